@@ -0,0 +1,103 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Benchmark fixtures
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+# Python modules
+import os
+import sys
+import time
+from collections.abc import Callable, Iterator
+from typing import NamedTuple
+
+# Third-party modules
+import pytest
+
+DEFAULT_SIZES = "10,100,1000,10000"
+N_BASES = 3
+# Directory modification time shift, to avoid racy index entries
+MTIME_SHIFT = 3600
+
+PLUGIN = """from tests.subclass.base import BasePlugin
+
+
+class Plugin(BasePlugin):
+    name = "{name}"
+
+    def get_name(self) -> str:
+        return self.name
+"""
+
+
+class PluginTree(NamedTuple):
+    """
+    Synthetic plugin tree.
+
+    Attributes:
+        bases: Plugin package names.
+        names: Plugin names, sorted.
+    """
+
+    bases: list[str]
+    names: list[str]
+
+    def unload(self) -> None:
+        """Remove imported plugin modules from `sys.modules`."""
+        prefixes = tuple(f"{b}." for b in self.bases)
+        for mod in [m for m in sys.modules if m.startswith(prefixes)]:
+            del sys.modules[mod]
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--tree-sizes",
+        default=DEFAULT_SIZES,
+        help="Comma-separated sizes of synthetic plugin trees",
+    )
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if "size" in metafunc.fixturenames:
+        sizes = metafunc.config.getoption("--tree-sizes")
+        metafunc.parametrize(
+            "size", [int(x) for x in sizes.split(",")], scope="session"
+        )
+
+
+@pytest.fixture(scope="session")
+def make_tree(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Iterator[Callable[[int], PluginTree]]:
+    """
+    Synthetic plugin tree factory.
+
+    Generates `size` plugin modules spread across `N_BASES`
+    plugin packages in round-robin manner. Trees are cached
+    by size.
+    """
+    root = tmp_path_factory.mktemp("trees")
+    sys.path.insert(0, str(root))
+    trees: dict[int, PluginTree] = {}
+
+    def inner(size: int) -> PluginTree:
+        tree = trees.get(size)
+        if tree:
+            return tree
+        bases = [f"bench_tree_{size}_{i}" for i in range(N_BASES)]
+        for b in bases:
+            (root / b).mkdir()
+            (root / b / "__init__.py").write_text("")
+        names = [f"p{i:05d}" for i in range(size)]
+        for i, name in enumerate(names):
+            path = root / bases[i % N_BASES] / f"{name}.py"
+            path.write_text(PLUGIN.format(name=name))
+        mtime = time.time() - MTIME_SHIFT
+        for b in bases:
+            os.utime(root / b, (mtime, mtime))
+        tree = PluginTree(bases=bases, names=names)
+        trees[size] = tree
+        return tree
+
+    yield inner
+    sys.path.remove(str(root))
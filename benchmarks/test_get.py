@@ -0,0 +1,85 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Cached lookup benchmarks
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+# Third-party modules
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+# Gufo Labs modules
+from gufo.loader import Loader
+from tests.subclass.base import BasePlugin
+
+PLUGIN_BASES = ["tests.subclass.primary", "tests.subclass.secondary"]
+LoaderType = Loader[type[BasePlugin]]
+
+
+@pytest.fixture(scope="module")
+def loader() -> LoaderType:
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES)
+    # Warm up cache
+    loader["a"]
+    return loader
+
+
+@pytest.mark.benchmark(group="hit")
+def test_dict_getitem(benchmark: BenchmarkFixture, loader: LoaderType) -> None:
+    d = {"a": loader["a"]}
+    benchmark(d.__getitem__, "a")
+
+
+@pytest.mark.benchmark(group="hit")
+def test_dict_get(benchmark: BenchmarkFixture, loader: LoaderType) -> None:
+    d = {"a": loader["a"]}
+    benchmark(d.get, "a")
+
+
+@pytest.mark.benchmark(group="hit")
+def test_function_get(benchmark: BenchmarkFixture, loader: LoaderType) -> None:
+    # Lower bound for any python-level lookup
+    d = {"a": loader["a"]}
+
+    def get(name: str) -> type[BasePlugin] | None:
+        return d.get(name)
+
+    benchmark(get, "a")
+
+
+@pytest.mark.benchmark(group="hit")
+def test_loader_getitem(
+    benchmark: BenchmarkFixture, loader: LoaderType
+) -> None:
+    benchmark(loader.__getitem__, "a")
+
+
+@pytest.mark.benchmark(group="hit")
+def test_loader_get(benchmark: BenchmarkFixture, loader: LoaderType) -> None:
+    benchmark(loader.get, "a")
+
+
+@pytest.mark.benchmark(group="hit")
+def test_frozen_getitem(
+    benchmark: BenchmarkFixture, loader: LoaderType
+) -> None:
+    frozen = loader.freeze(["a"])
+    benchmark(frozen.__getitem__, "a")
+
+
+@pytest.mark.benchmark(group="hit")
+def test_frozen_get(benchmark: BenchmarkFixture, loader: LoaderType) -> None:
+    frozen = loader.freeze(["a"])
+    benchmark(frozen.get, "a")
+
+
+@pytest.mark.benchmark(group="attr")
+def test_attr_direct(benchmark: BenchmarkFixture, loader: LoaderType) -> None:
+    item = loader["a"]
+    benchmark(getattr, item, "name")
+
+
+@pytest.mark.benchmark(group="attr")
+def test_attr_lazy(benchmark: BenchmarkFixture, loader: LoaderType) -> None:
+    proxy = loader.lazy("a")
+    benchmark(getattr, proxy, "name")
@@ -0,0 +1,55 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: ImportPathResolver benchmarks
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+# Python modules
+import contextlib
+
+# Third-party modules
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+# Gufo Labs modules
+from gufo.loader import ImportPathResolver
+from tests.subclass.base import BasePlugin
+
+HIT_PATH = "tests.subclass.base.BasePlugin"
+MISS_PATH = "tests.subclass.base.MissedPlugin"
+ResolverType = ImportPathResolver[type[BasePlugin]]
+
+
+@pytest.mark.benchmark(group="resolver")
+def test_resolver_hit(benchmark: BenchmarkFixture) -> None:
+    resolver = ImportPathResolver[type[BasePlugin]]()
+    resolver(HIT_PATH)
+    assert benchmark(resolver, HIT_PATH) is BasePlugin
+
+
+@pytest.mark.benchmark(group="resolver")
+def test_resolver_miss(benchmark: BenchmarkFixture) -> None:
+    resolver = ImportPathResolver[type[BasePlugin]]()
+
+    def run() -> None:
+        with contextlib.suppress(ImportError):
+            resolver(MISS_PATH)
+
+    benchmark(run)
+
+
+@pytest.mark.benchmark(group="resolver")
+def test_resolver_miss_no_cache(benchmark: BenchmarkFixture) -> None:
+    resolver = ImportPathResolver[type[BasePlugin]](cache_negative=False)
+
+    def run() -> None:
+        with contextlib.suppress(ImportError):
+            resolver(MISS_PATH)
+
+    benchmark(run)
+
+
+@pytest.mark.benchmark(group="resolver")
+def test_resolver_passthrough(benchmark: BenchmarkFixture) -> None:
+    resolver = ImportPathResolver[type[BasePlugin]]()
+    assert benchmark(resolver, BasePlugin) is BasePlugin
@@ -0,0 +1,221 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Synthetic plugin tree benchmarks
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+# Python modules
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+# Third-party modules
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+# Gufo Labs modules
+from gufo.loader import Loader, PluginWatcher
+from tests.subclass.base import BasePlugin
+
+from .conftest import PluginTree
+
+LoaderType = Loader[type[BasePlugin]]
+TreeFactory = Callable[[int], PluginTree]
+# Number of lookups per thread in contention tests
+N_LOOKUPS = 10_000
+# Rounds for the cold import benchmarks
+COLD_ROUNDS = 5
+
+
+def cold_loader(tree: PluginTree, **kwargs: Any) -> LoaderType:  # noqa: ANN401
+    """Unload plugins and create loader with populated name index."""
+    tree.unload()
+    loader = Loader[type[BasePlugin]](bases=tree.bases, **kwargs)
+    loader.refresh()
+    return loader
+
+
+@pytest.mark.benchmark(group="keys-cold")
+def test_keys_cold(
+    benchmark: BenchmarkFixture, make_tree: TreeFactory, size: int
+) -> None:
+    tree = make_tree(size)
+    loader = Loader[type[BasePlugin]](bases=tree.bases)
+
+    def run() -> list[str]:
+        loader.invalidate()
+        return list(loader.keys())
+
+    assert benchmark(run) == tree.names
+
+
+@pytest.mark.benchmark(group="keys-index")
+def test_keys_index(
+    benchmark: BenchmarkFixture,
+    make_tree: TreeFactory,
+    size: int,
+    tmp_path: Path,
+) -> None:
+    tree = make_tree(size)
+    index = str(tmp_path / "plugins.idx")
+    # Build index
+    Loader[type[BasePlugin]](bases=tree.bases, index=index).refresh()
+
+    def run() -> list[str]:
+        # Simulate process startup
+        return list(
+            Loader[type[BasePlugin]](bases=tree.bases, index=index).keys()
+        )
+
+    assert benchmark(run) == tree.names
+
+
+@pytest.mark.benchmark(group="keys-warm")
+def test_keys_warm(
+    benchmark: BenchmarkFixture, make_tree: TreeFactory, size: int
+) -> None:
+    tree = make_tree(size)
+    loader = Loader[type[BasePlugin]](bases=tree.bases)
+    loader.refresh()
+    assert benchmark(lambda: list(loader.keys())) == tree.names
+
+
+@pytest.mark.benchmark(group="keys-prefix")
+def test_keys_prefix(
+    benchmark: BenchmarkFixture, make_tree: TreeFactory, size: int
+) -> None:
+    tree = make_tree(size)
+    loader = Loader[type[BasePlugin]](bases=tree.bases)
+    loader.refresh()
+    name = tree.names[-1]
+    assert benchmark(lambda: list(loader.keys(prefix=name))) == [name]
+
+
+@pytest.mark.benchmark(group="keys-first")
+def test_keys_first(
+    benchmark: BenchmarkFixture, make_tree: TreeFactory, size: int
+) -> None:
+    tree = make_tree(size)
+    loader = Loader[type[BasePlugin]](bases=tree.bases)
+
+    def run() -> str:
+        loader.invalidate()
+        return next(iter(loader.keys(sort=False)))
+
+    assert benchmark(run) in tree.names
+
+
+@pytest.mark.benchmark(group="get-cold")
+def test_get_cold(
+    benchmark: BenchmarkFixture, make_tree: TreeFactory, size: int
+) -> None:
+    tree = make_tree(size)
+    # Plugin in the last base
+    name = tree.names[-1]
+
+    def setup() -> tuple[tuple[LoaderType], dict[str, Any]]:
+        return (cold_loader(tree),), {}
+
+    def run(loader: LoaderType) -> type[BasePlugin] | None:
+        return loader.get(name)
+
+    benchmark.pedantic(run, setup=setup, rounds=COLD_ROUNDS)
+
+
+@pytest.mark.benchmark(group="get-warm")
+def test_get_warm(
+    benchmark: BenchmarkFixture, make_tree: TreeFactory, size: int
+) -> None:
+    tree = make_tree(size)
+    loader = Loader[type[BasePlugin]](bases=tree.bases)
+    name = tree.names[-1]
+    loader[name]
+    assert benchmark(loader.get, name) is loader[name]
+
+
+@pytest.mark.benchmark(group="get-miss")
+def test_get_miss(
+    benchmark: BenchmarkFixture, make_tree: TreeFactory, size: int
+) -> None:
+    tree = make_tree(size)
+    loader = Loader[type[BasePlugin]](bases=tree.bases)
+    loader.refresh()
+    assert benchmark(loader.get, "missed") is None
+
+
+@pytest.mark.benchmark(group="values-cold")
+def test_values_cold(
+    benchmark: BenchmarkFixture, make_tree: TreeFactory, size: int
+) -> None:
+    tree = make_tree(size)
+
+    def setup() -> tuple[tuple[LoaderType], dict[str, Any]]:
+        return (cold_loader(tree),), {}
+
+    def run(loader: LoaderType) -> int:
+        return len(list(loader.values()))
+
+    benchmark.pedantic(run, setup=setup, rounds=COLD_ROUNDS)
+
+
+@pytest.mark.benchmark(group="preload-cold")
+def test_preload_cold(
+    benchmark: BenchmarkFixture, make_tree: TreeFactory, size: int
+) -> None:
+    tree = make_tree(size)
+
+    def setup() -> tuple[tuple[LoaderType], dict[str, Any]]:
+        return (cold_loader(tree),), {}
+
+    def run(loader: LoaderType) -> int:
+        return len(loader.preload().loaded)
+
+    benchmark.pedantic(run, setup=setup, rounds=COLD_ROUNDS)
+
+
+@pytest.mark.benchmark(group="values-warm")
+def test_values_warm(
+    benchmark: BenchmarkFixture, make_tree: TreeFactory, size: int
+) -> None:
+    tree = make_tree(size)
+    loader = Loader[type[BasePlugin]](bases=tree.bases)
+    loader.preload()
+    assert benchmark(lambda: len(list(loader.values()))) == size
+
+
+@pytest.mark.parametrize("threads", [1, 2, 4, 8])
+@pytest.mark.benchmark(group="get-contention")
+def test_get_contention(
+    benchmark: BenchmarkFixture,
+    make_tree: TreeFactory,
+    size: int,
+    threads: int,
+) -> None:
+    tree = make_tree(size)
+    loader = Loader[type[BasePlugin]](bases=tree.bases)
+    loader.preload()
+    names = (tree.names * (N_LOOKUPS // size + 1))[:N_LOOKUPS]
+
+    def worker() -> None:
+        get = loader.get
+        for name in names:
+            get(name)
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+
+        def run() -> None:
+            for f in [executor.submit(worker) for _ in range(threads)]:
+                f.result()
+
+        benchmark(run)
+
+
+@pytest.mark.benchmark(group="watcher-check")
+def test_watcher_check(
+    benchmark: BenchmarkFixture, make_tree: TreeFactory, size: int
+) -> None:
+    tree = make_tree(size)
+    loader = Loader[type[BasePlugin]](bases=tree.bases)
+    watcher = PluginWatcher(loader)
+    assert not benchmark(watcher.check).changed
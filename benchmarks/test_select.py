@@ -0,0 +1,117 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Plugin item selection benchmarks
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+# Python modules
+import inspect
+from types import ModuleType
+from typing import Any
+
+# Third-party modules
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+# Gufo Labs modules
+from gufo.loader import Loader
+from gufo.loader.validator import ProtocolValidator
+from tests.protocol.base import Named
+from tests.subclass.base import BasePlugin
+
+PLUGIN_BASES = ["tests.subclass.primary", "tests.subclass.secondary"]
+LoaderType = Loader[type[BasePlugin]]
+MOD_NAME = "bench_select"
+
+
+@pytest.fixture(scope="module")
+def loader() -> LoaderType:
+    return Loader[type[BasePlugin]](bases=PLUGIN_BASES)
+
+
+def make_module(n: int, marker: bool = False) -> ModuleType:
+    """
+    Build module with `n` decoy attributes and plugin defined last.
+
+    Decoys are the mix of imported names, local functions
+    and local classes.
+    """
+    mod = ModuleType(MOD_NAME)
+    for i in range(n):
+        kind = i % 3
+        if kind == 0:
+            value: Any = inspect  # Imported module
+        elif kind == 1:
+            value = type(f"Decoy{i}", (), {"__module__": MOD_NAME})
+        else:
+            value = i
+        setattr(mod, f"attr{i}", value)
+    # Last both in order of definition and in order of names
+    plugin = type("zplugin", (BasePlugin,), {"__module__": MOD_NAME})
+    mod.zplugin = plugin  # type: ignore[attr-defined]
+    if marker:
+        mod.__plugin__ = plugin  # type: ignore[attr-defined]
+    return mod
+
+
+def getmembers_select(loader: LoaderType, module: ModuleType) -> Any:  # noqa: ANN401
+    """Previous `inspect.getmembers` implementation, for reference."""
+    is_valid = loader._get_validator()
+    for _, member in inspect.getmembers(module):
+        if (
+            hasattr(member, "__module__")
+            and member.__module__ != module.__name__
+        ):
+            continue
+        if not is_valid(member):
+            continue
+        return member
+    return None
+
+
+@pytest.mark.parametrize("n", [100, 1_000, 5_000])
+@pytest.mark.benchmark(group="select")
+def test_select_getmembers(
+    benchmark: BenchmarkFixture, loader: LoaderType, n: int
+) -> None:
+    mod = make_module(n)
+    assert benchmark(getmembers_select, loader, mod) is mod.zplugin
+
+
+@pytest.mark.parametrize("n", [100, 1_000, 5_000])
+@pytest.mark.benchmark(group="select")
+def test_select_scan(
+    benchmark: BenchmarkFixture, loader: LoaderType, n: int
+) -> None:
+    mod = make_module(n)
+    assert benchmark(loader._select_item, mod) is mod.zplugin
+
+
+@pytest.mark.parametrize("n", [100, 1_000, 5_000])
+@pytest.mark.benchmark(group="select")
+def test_select_marker(
+    benchmark: BenchmarkFixture, loader: LoaderType, n: int
+) -> None:
+    mod = make_module(n, marker=True)
+    assert benchmark(loader._select_item, mod) is mod.zplugin
+
+
+@pytest.mark.benchmark(group="protocol")
+def test_protocol_isinstance(benchmark: BenchmarkFixture) -> None:
+    members = [type(f"Decoy{i}", (), {}) for i in range(100)]
+
+    def check() -> int:
+        return sum(isinstance(m, Named) for m in members)
+
+    assert benchmark(check) == 0
+
+
+@pytest.mark.benchmark(group="protocol")
+def test_protocol_validator(benchmark: BenchmarkFixture) -> None:
+    members = [type(f"Decoy{i}", (), {}) for i in range(100)]
+    is_valid = ProtocolValidator(Named)
+
+    def check() -> int:
+        return sum(is_valid(m) for m in members)
+
+    assert benchmark(check) == 0
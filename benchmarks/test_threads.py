@@ -0,0 +1,155 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Thread scaling benchmarks
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+# Python modules
+import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+# Third-party modules
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+# Gufo Labs modules
+from gufo.loader import ImportPathResolver, Loader
+from tests.subclass.base import BasePlugin
+
+from .conftest import PluginTree
+
+TreeFactory = Callable[[int], PluginTree]
+# Number of threads
+THREADS = [1, 2, 4, 8]
+# Number of lookups per thread
+N_LOOKUPS = 10_000
+# Plugin tree size
+TREE_SIZE = 100
+# Rounds for the cold import benchmarks
+COLD_ROUNDS = 3
+# Free-threaded (no-GIL) interpreter
+GIL_ENABLED = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def run_threads(  # noqa: PLR0913
+    benchmark: BenchmarkFixture,
+    threads: int,
+    worker: Callable[[int], Any],
+    n_ops: int,
+    setup: Callable[[], None] | None = None,
+    rounds: int | None = None,
+) -> None:
+    """
+    Run worker in threads and record throughput.
+
+    Worker is called with thread number and performs `n_ops`
+    operations in total across all threads.
+    """
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        # Start threads
+        list(executor.map(lambda _: None, range(threads)))
+
+        def run() -> None:
+            for f in [executor.submit(worker, i) for i in range(threads)]:
+                f.result()
+
+        if rounds is None:
+            benchmark(run)
+        else:
+            benchmark.pedantic(
+                run, setup=setup, rounds=rounds, warmup_rounds=0
+            )
+    benchmark.extra_info["threads"] = threads
+    benchmark.extra_info["gil"] = GIL_ENABLED
+    # No stats with --benchmark-disable
+    stats = getattr(benchmark.stats, "stats", None)
+    if stats is not None and stats.mean:
+        benchmark.extra_info["ops_per_sec"] = n_ops / stats.mean
+
+
+@pytest.mark.parametrize("threads", THREADS)
+@pytest.mark.benchmark(group="threads-loader-hit")
+def test_loader_hit(
+    benchmark: BenchmarkFixture, make_tree: TreeFactory, threads: int
+) -> None:
+    tree = make_tree(TREE_SIZE)
+    loader = Loader[type[BasePlugin]](bases=tree.bases)
+    loader.preload()
+    names = (tree.names * (N_LOOKUPS // TREE_SIZE))[:N_LOOKUPS]
+
+    def worker(_: int) -> None:
+        get = loader.get
+        for name in names:
+            get(name)
+
+    run_threads(benchmark, threads, worker, N_LOOKUPS * threads)
+
+
+@pytest.mark.parametrize("threads", THREADS)
+@pytest.mark.benchmark(group="threads-frozen-hit")
+def test_frozen_hit(
+    benchmark: BenchmarkFixture, make_tree: TreeFactory, threads: int
+) -> None:
+    tree = make_tree(TREE_SIZE)
+    frozen = Loader[type[BasePlugin]](bases=tree.bases).freeze()
+    names = (tree.names * (N_LOOKUPS // TREE_SIZE))[:N_LOOKUPS]
+
+    def worker(_: int) -> None:
+        get = frozen.get
+        for name in names:
+            get(name)
+
+    run_threads(benchmark, threads, worker, N_LOOKUPS * threads)
+
+
+@pytest.mark.parametrize("threads", THREADS)
+@pytest.mark.benchmark(group="threads-resolver-hit")
+def test_resolver_hit(
+    benchmark: BenchmarkFixture, make_tree: TreeFactory, threads: int
+) -> None:
+    tree = make_tree(TREE_SIZE)
+    paths = [
+        f"{tree.bases[i % len(tree.bases)]}.{name}.Plugin"
+        for i, name in enumerate(tree.names)
+    ]
+    resolver = ImportPathResolver[type[BasePlugin]]()
+    resolver.prefork(paths, gc_freeze=False)
+    paths = (paths * (N_LOOKUPS // TREE_SIZE))[:N_LOOKUPS]
+
+    def worker(_: int) -> None:
+        for path in paths:
+            resolver(path)
+
+    run_threads(benchmark, threads, worker, N_LOOKUPS * threads)
+
+
+@pytest.mark.parametrize("threads", THREADS)
+@pytest.mark.benchmark(group="threads-loader-miss")
+def test_loader_cold(
+    benchmark: BenchmarkFixture, make_tree: TreeFactory, threads: int
+) -> None:
+    tree = make_tree(TREE_SIZE)
+    loaders: list[Loader[type[BasePlugin]]] = []
+
+    def setup() -> None:
+        tree.unload()
+        loader = Loader[type[BasePlugin]](bases=tree.bases)
+        loader.refresh()
+        loaders[:] = [loader]
+
+    def worker(n: int) -> None:
+        # Each thread imports its own share of plugins
+        get = loaders[0].get
+        for name in tree.names[n::threads]:
+            get(name)
+
+    run_threads(
+        benchmark,
+        threads,
+        worker,
+        TREE_SIZE,
+        setup=setup,
+        rounds=COLD_ROUNDS,
+    )
@@ -83,8 +83,39 @@ Attributes:
 """
 
 # Gufo Loader modules
+from .chain import ChainLoader
+from .frozen import FrozenLoader
+from .lazy import LazyPlugin
 from .loader import Loader
+from .report import (
+    BytecodeReport,
+    LoaderStats,
+    ModuleBytecode,
+    PluginFailure,
+    PluginTiming,
+    PreforkReport,
+    PreloadReport,
+)
 from .resolver import ImportPathResolver
+from .static import PluginInfo
+from .watcher import PluginWatcher, WatchEvent, WatchStats
 
 __version__: str = "2.0.0"
-__all__ = ["ImportPathResolver", "Loader"]
+__all__ = [
+    "BytecodeReport",
+    "ChainLoader",
+    "FrozenLoader",
+    "ImportPathResolver",
+    "LazyPlugin",
+    "Loader",
+    "LoaderStats",
+    "ModuleBytecode",
+    "PluginFailure",
+    "PluginInfo",
+    "PluginTiming",
+    "PluginWatcher",
+    "PreforkReport",
+    "PreloadReport",
+    "WatchEvent",
+    "WatchStats",
+]
@@ -0,0 +1,138 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Command-line interface
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+"""
+Command-line interface.
+
+Usage:
+    ``` sh
+    python -m gufo.loader compile [options] BASE [BASE ...]
+    python -m gufo.loader check [options] BASE [BASE ...]
+    ```
+
+`compile` writes the bytecode of all plugin modules,
+`check` reports the modules without the fresh bytecode
+and their compilation times.
+"""
+
+# Python modules
+import argparse
+import sys
+from collections.abc import Sequence
+from py_compile import PycInvalidationMode
+from typing import Any
+
+# Gufo Loader modules
+from .loader import Loader
+from .report import BytecodeReport
+
+INVALIDATION_MODES = {
+    "timestamp": PycInvalidationMode.TIMESTAMP,
+    "checked-hash": PycInvalidationMode.CHECKED_HASH,
+    "unchecked-hash": PycInvalidationMode.UNCHECKED_HASH,
+}
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """
+    Build command-line parser.
+
+    Returns:
+        Argument parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m gufo.loader",
+        description="Manage plugin packages bytecode",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    compile_cmd = commands.add_parser(
+        "compile", help="Compile plugin modules ahead of time"
+    )
+    compile_cmd.add_argument(
+        "--invalidation-mode",
+        choices=sorted(INVALIDATION_MODES),
+        help="Bytecode invalidation mode",
+    )
+    compile_cmd.add_argument(
+        "--force",
+        action="store_true",
+        help="Recompile modules with fresh bytecode",
+    )
+    check_cmd = commands.add_parser(
+        "check", help="Check plugin modules bytecode is fresh"
+    )
+    for cmd in (compile_cmd, check_cmd):
+        cmd.add_argument(
+            "--prefix",
+            help="Separate bytecode cache tree, like PYTHONPYCACHEPREFIX",
+        )
+        cmd.add_argument(
+            "-O",
+            "--optimize",
+            type=int,
+            choices=[0, 1, 2],
+            help="Optimization level",
+        )
+        cmd.add_argument(
+            "-q", "--quiet", action="store_true", help="Print only summary"
+        )
+        cmd.add_argument("bases", nargs="+", help="Plugin package names")
+    return parser
+
+
+def print_report(report: BytecodeReport, quiet: bool) -> None:
+    """
+    Print bytecode report.
+
+    Args:
+        report: Bytecode report.
+        quiet: Print only summary.
+    """
+    if not quiet:
+        for m in report.modules:
+            print(f"{m.status:<8} {m.compile_time * 1000:9.2f} ms  {m.name}")
+            if m.error:
+                print(f"         {m.error}")
+    print(
+        f"{len(report.modules)} modules, {len(report.outdated)} outdated, "
+        f"{report.compile_time * 1000:.2f} ms to compile"
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Run command-line interface.
+
+    Args:
+        argv: Command-line arguments. Use `sys.argv`, if not set.
+
+    Returns:
+        Exit code: 0 on success, 1 if the modules are outdated or
+        cannot be compiled, 2 if plugin packages are not found.
+    """
+    args = get_parser().parse_args(argv)
+    try:
+        loader = Loader[Any](bases=args.bases)
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    if args.command == "compile":
+        report = loader.precompile(
+            prefix=args.prefix,
+            optimize=args.optimize,
+            invalidation_mode=INVALIDATION_MODES.get(args.invalidation_mode),
+            force=args.force,
+        )
+    else:
+        report = loader.verify_bytecode(
+            prefix=args.prefix, optimize=args.optimize
+        )
+    print_report(report, args.quiet)
+    return 1 if report.outdated else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
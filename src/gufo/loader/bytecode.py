@@ -0,0 +1,162 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Plugin bytecode management
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+"""
+Plugin bytecode management.
+
+Plugin modules are compiled ahead of time, so the cold imports
+only unmarshal the cached bytecode. It is essential for read-only
+deployments, where the import system cannot write the `.pyc` files
+and recompiles the stale modules on every start.
+"""
+
+# Python modules
+import os
+import py_compile
+import sys
+import time
+from importlib.util import MAGIC_NUMBER, cache_from_source, source_hash
+from typing import Literal
+
+# Bytecode file state
+BytecodeStatus = Literal[
+    "fresh", "stale", "missing", "invalid", "compiled", "error"
+]
+# .pyc header size: magic, flags, 8 bytes of validation data
+HEADER_SIZE = 16
+# .pyc flags
+FLAG_HASH_BASED = 0b01
+FLAG_CHECK_SOURCE = 0b10
+
+
+def get_cache_path(
+    source: str, prefix: str | None = None, optimize: int | None = None
+) -> str:
+    """
+    Get path to the cached bytecode file.
+
+    Args:
+        source: Path to the module source.
+        prefix: Root of the separate bytecode cache tree, like
+            `sys.pycache_prefix`. Use `sys.pycache_prefix`, if not set.
+        optimize: Optimization level. Use current interpreter's
+            level, if not set.
+
+    Returns:
+        Path to the `.pyc` file.
+    """
+    if optimize is None:
+        optimize = sys.flags.optimize
+    path = cache_from_source(source, optimization=optimize or "")
+    if prefix is None:
+        return path
+    # Mirror the source directory tree under the prefix
+    head = os.path.splitdrive(os.path.dirname(os.path.abspath(source)))[1]
+    return os.path.join(
+        prefix, head.lstrip(os.sep + (os.altsep or "")), os.path.basename(path)
+    )
+
+
+def check_bytecode(source: str, cache: str) -> BytecodeStatus:
+    """
+    Check if the cached bytecode may be used by the import system.
+
+    Validated in the same way as on import: by the source
+    modification time and size, or by the source hash
+    for the checked hash-based files.
+
+    Args:
+        source: Path to the module source.
+        cache: Path to the `.pyc` file.
+
+    Returns:
+        * `fresh` - bytecode is valid.
+        * `stale` - source has been changed.
+        * `missing` - no bytecode file.
+        * `invalid` - bytecode file is corrupted or is compiled
+          by the other Python version.
+    """
+    try:
+        with open(cache, "rb") as f:
+            header = f.read(HEADER_SIZE)
+    except FileNotFoundError:
+        return "missing"
+    except OSError:
+        return "invalid"
+    if len(header) < HEADER_SIZE or header[:4] != MAGIC_NUMBER:
+        return "invalid"
+    flags = int.from_bytes(header[4:8], "little")
+    try:
+        if flags & FLAG_HASH_BASED:
+            if not flags & FLAG_CHECK_SOURCE:
+                return "fresh"
+            with open(source, "rb") as f:
+                fresh = header[8:16] == source_hash(f.read())
+        else:
+            st = os.stat(source)
+            fresh = int.from_bytes(header[8:12], "little") == (
+                int(st.st_mtime) & 0xFFFFFFFF
+            ) and int.from_bytes(header[12:16], "little") == (
+                st.st_size & 0xFFFFFFFF
+            )
+    except OSError:
+        return "invalid"
+    return "fresh" if fresh else "stale"
+
+
+def measure_compile(source: str) -> tuple[float, str | None]:
+    """
+    Measure the module compilation time.
+
+    Source is compiled in memory, nothing is written.
+
+    Args:
+        source: Path to the module source.
+
+    Returns:
+        Tuple of (`duration`, `error`). Duration is in seconds.
+    """
+    t0 = time.perf_counter()
+    try:
+        with open(source, "rb") as f:
+            compile(f.read(), source, "exec", dont_inherit=True)
+    except (OSError, SyntaxError, ValueError) as e:
+        return time.perf_counter() - t0, f"{e.__class__.__name__}: {e}"
+    return time.perf_counter() - t0, None
+
+
+def compile_bytecode(
+    source: str,
+    cache: str,
+    optimize: int | None = None,
+    invalidation_mode: py_compile.PycInvalidationMode | None = None,
+) -> tuple[float, str | None]:
+    """
+    Compile module and write the bytecode file.
+
+    Args:
+        source: Path to the module source.
+        cache: Path to the `.pyc` file.
+        optimize: Optimization level. Use current interpreter's
+            level, if not set.
+        invalidation_mode: Bytecode invalidation mode. Use
+            `py_compile` defaults, if not set.
+
+    Returns:
+        Tuple of (`duration`, `error`). Duration is in seconds.
+    """
+    t0 = time.perf_counter()
+    try:
+        py_compile.compile(
+            source,
+            cfile=cache,
+            doraise=True,
+            optimize=-1 if optimize is None else optimize,
+            invalidation_mode=invalidation_mode,
+        )
+    except (OSError, py_compile.PyCompileError) as e:
+        return time.perf_counter() - t0, f"{e.__class__.__name__}: {e}"
+    return time.perf_counter() - t0, None
@@ -0,0 +1,359 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: ChainLoader implementation
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+"""ChainLoader implementation."""
+
+# Python modules
+from collections.abc import Iterable, Iterator
+from threading import Lock
+from typing import Generic, NamedTuple, TypeVar, overload
+
+# Gufo Loader modules
+from .loader import Loader, filter_names
+
+T = TypeVar("T")
+
+
+class _ChainIndex(NamedTuple):
+    """
+    Merged plugin name index.
+
+    Replaced as a whole, so readers always see the consistent state.
+
+    Attributes:
+        names: Sorted tuple of plugin names.
+        name_set: Set of plugin names.
+        routes: Mapping of plugin name to the tuple of the positions
+            of the loaders containing the plugin, in order of precedence.
+    """
+
+    names: tuple[str, ...]
+    name_set: frozenset[str]
+    routes: dict[str, tuple[int, ...]]
+
+
+class ChainLoader(Generic[T]):
+    """
+    Composite loader merging several loaders.
+
+    Loaders are listed in order of precedence: when several loaders
+    contain the same plugin name, the first one owns the name
+    and shadows the others. Each loader keeps its own bases,
+    exclusions and settings.
+
+    Plugin names of all loaders are merged into the single
+    name index, so lookups are routed directly to the owning
+    loader. Names missed in the index are passed to all loaders,
+    which probe their plugin directories once. When the owning
+    loader fails to load the plugin, the shadowed loaders
+    are tried in order of precedence.
+
+    Example:
+        ``` py
+        loader = ChainLoader[type[BasePlugin]](
+            [
+                Loader[type[BasePlugin]](base="customer.plugins"),
+                Loader[type[BasePlugin]](base="vendor.plugins"),
+                Loader[type[BasePlugin]](base="core.plugins"),
+            ]
+        )
+        ```
+
+    Args:
+        loaders: Iterable of loaders, in order of precedence.
+    """
+
+    def __init__(self, loaders: Iterable[Loader[T]]) -> None:
+        self._loaders = tuple(loaders)
+        if not self._loaders:
+            msg = "No loaders"
+            raise RuntimeError(msg)
+        self._all = tuple(range(len(self._loaders)))
+        self._lock = Lock()
+        self._index: _ChainIndex | None = None
+
+    @property
+    def loaders(self) -> tuple[Loader[T], ...]:
+        """
+        Chained loaders.
+
+        Returns:
+            Tuple of loaders, in order of precedence.
+        """
+        return self._loaders
+
+    def __getitem__(self, name: str) -> T:
+        """
+        Get plugin by name.
+
+        Args:
+            name: Name of plugin.
+
+        Returns:
+            Plugin item depending on generic type.
+
+        Raises:
+            KeyError: if plugin is missed.
+        """
+        item = self.get(name)
+        if item is None:
+            raise KeyError(name)
+        return item
+
+    @overload
+    def get(self, name: str) -> T | None: ...
+    @overload
+    def get(self, name: str, default: T) -> T: ...
+    def get(self, name: str, default: T | None = None) -> T | None:
+        """
+        Get plugin by name.
+
+        Return `default` value if plugin is missed.
+
+        Args:
+            name: Name of plugin.
+            default: Default value, if plugin is missed.
+
+        Returns:
+            Plugin item if found, otherwise the explicit default value.
+            If default is omitted, returns None when plugin is missing.
+        """
+        for i in self._get_routes(name):
+            item = self._loaders[i].get(name)
+            if item is not None:
+                return item
+        return default
+
+    @overload
+    async def aget(self, name: str) -> T | None: ...
+    @overload
+    async def aget(self, name: str, default: T) -> T: ...
+    async def aget(self, name: str, default: T | None = None) -> T | None:
+        """
+        Get plugin by name without blocking the event loop.
+
+        Args:
+            name: Name of plugin.
+            default: Default value, if plugin is missed.
+
+        Returns:
+            Plugin item if found, otherwise the explicit default value.
+            If default is omitted, returns None when plugin is missing.
+        """
+        for i in self._get_routes(name):
+            item = await self._loaders[i].aget(name)
+            if item is not None:
+                return item
+        return default
+
+    def _get_routes(self, name: str) -> tuple[int, ...]:
+        """
+        Get positions of the loaders which may contain the plugin.
+
+        Names missed in the index, including dotted names,
+        are searched in all loaders.
+
+        Args:
+            name: Plugin name.
+
+        Returns:
+            Tuple of loader positions, in order of precedence.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        routes = self._get_index().routes.get(name)
+        if routes is not None:
+            return routes
+        return self._all
+
+    def owner(self, name: str) -> Loader[T] | None:
+        """
+        Get loader owning the plugin name.
+
+        Args:
+            name: Plugin name.
+
+        Returns:
+            First loader containing the plugin, or None
+            if plugin is not found.
+
+        Note:
+            Do not force plugin module loading.
+        """
+        routes = self._get_index().routes.get(name)
+        return self._loaders[routes[0]] if routes else None
+
+    def shadowed(self) -> dict[str, tuple[int, ...]]:
+        """
+        Get plugin names defined in several loaders.
+
+        Returns:
+            Mapping of plugin name to the positions of the loaders
+            containing it, in order of precedence. The first one
+            owns the name.
+
+        Note:
+            Do not force plugin module loading.
+        """
+        return {
+            name: routes
+            for name, routes in self._get_index().routes.items()
+            if len(routes) > 1
+        }
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate over plugin names.
+
+        Returns:
+            Iterator of all plugin names, in sorted order.
+        """
+        return iter(self._get_index().names)
+
+    def keys(
+        self, prefix: str | None = None, pattern: str | None = None
+    ) -> Iterable[str]:
+        """
+        Iterate over plugin names.
+
+        Args:
+            prefix: Yield only names starting with prefix.
+            pattern: Yield only names matching the shell-style
+                pattern, i.e. `huawei_*`.
+
+        Returns:
+            Iterable of plugin names, in sorted order.
+
+        Note:
+            `keys()` do not force plugin module loading and instantiation.
+        """
+        yield from filter_names(self._get_index().names, prefix, pattern)
+
+    def __contains__(self, name: object) -> bool:
+        """
+        Check if plugin exists in any loader.
+
+        Args:
+            name: Name of plugin.
+
+        Returns:
+            True, if plugin exists.
+
+        Note:
+            Do not force plugin module loading.
+        """
+        return name in self._get_index().name_set
+
+    def __len__(self) -> int:
+        """
+        Get number of plugins.
+
+        Returns:
+            Number of unique plugin names in all loaders.
+
+        Note:
+            Do not force plugin module loading.
+        """
+        return len(self._get_index().names)
+
+    def values(self) -> Iterable[T]:
+        """
+        Iterate all found plugin items.
+
+        Returns:
+            Iterable of plugin items.
+
+        Note:
+            `values()` will force plugin module loading and instantiation.
+        """
+        for name in self:
+            item = self.get(name)
+            if item is not None:
+                yield item
+
+    def items(self) -> Iterable[tuple[str, T]]:
+        """
+        Iterate the (`name`, `item`) tuples for all plugin items.
+
+        Return:
+            Iterable of tuples of (`name`, `item`)
+
+        Note:
+            `items()` will force plugin module loading and instantiation.
+        """
+        for name in self:
+            item = self.get(name)
+            if item is not None:
+                yield name, item
+
+    def refresh(self) -> None:
+        """Rescan plugin directories of all loaders and rebuild the index."""
+        for loader in self._loaders:
+            loader.refresh()
+        self._index = self._build_index()
+
+    def invalidate(self) -> None:
+        """
+        Drop the name indexes of all loaders.
+
+        Indexes will be rebuilt on next access.
+        """
+        for loader in self._loaders:
+            loader.invalidate()
+        self._index = None
+
+    def _get_index(self) -> _ChainIndex:
+        """
+        Get actual merged name index, build if necessary.
+
+        Returns:
+            Merged name index.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        index = self._index
+        if index is None:
+            with self._lock:
+                index = self._index
+                if index is None:
+                    index = self._build_index()
+                    self._index = index
+        return index
+
+    def _build_index(self) -> _ChainIndex:
+        """
+        Merge name indexes of all loaders.
+
+        Returns:
+            Merged name index.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        routes: dict[str, list[int]] = {}
+        for i, loader in enumerate(self._loaders):
+            for name in loader:
+                r = routes.get(name)
+                if r is None:
+                    routes[name] = [i]
+                else:
+                    r.append(i)
+        return _ChainIndex(
+            names=tuple(sorted(routes)),
+            name_set=frozenset(routes),
+            routes={name: tuple(r) for name, r in routes.items()},
+        )
+
+    def __repr__(self) -> str:
+        """
+        Get chain representation.
+
+        Returns:
+            String representation.
+        """
+        return f"<ChainLoader: {len(self._loaders)} loaders>"
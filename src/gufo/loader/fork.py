@@ -0,0 +1,73 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Pre-fork support
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+"""Pre-fork support."""
+
+# Python modules
+import gc
+import os
+from threading import Lock
+from typing import Protocol
+from weakref import WeakSet
+
+
+class ForkAware(Protocol):
+    """Object resetting its state in the forked child."""
+
+    def _after_fork(self) -> None: ...
+
+
+_lock = Lock()
+_registered = False
+_objects: "WeakSet[ForkAware]" = WeakSet()
+
+
+def _after_fork_in_child() -> None:
+    """
+    Reset the state of registered objects in the forked child.
+
+    Note:
+        Internal function. Must not be used directly.
+    """
+    global _lock  # noqa: PLW0603
+    # Lock may be held by the other parent's thread
+    _lock = Lock()
+    for obj in list(_objects):
+        obj._after_fork()
+
+
+def register_fork_handler(obj: ForkAware) -> None:
+    """
+    Reset the object's state in the forked children.
+
+    The object's `_after_fork()` method is called in the child
+    process after each `os.fork()`. Objects are referenced weakly.
+
+    Args:
+        obj: Object to register.
+    """
+    global _registered  # noqa: PLW0603
+    with _lock:
+        _objects.add(obj)
+        if not _registered and hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=_after_fork_in_child)
+            _registered = True
+
+
+def freeze_gc() -> int:
+    """
+    Move all tracked objects to the permanent generation.
+
+    Frozen objects are ignored by the garbage collector,
+    so the collections in the forked children do not touch
+    the memory pages shared with the parent.
+
+    Returns:
+        Number of objects in the permanent generation.
+    """
+    gc.collect()
+    gc.freeze()
+    return gc.get_freeze_count()
@@ -0,0 +1,102 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Frozen plugin set
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+"""Frozen plugin set."""
+
+# Python modules
+from collections.abc import Iterator, Mapping
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class FrozenLoader(Mapping[str, T]):
+    """
+    Immutable snapshot of loaded plugins.
+
+    Created by `Loader.freeze()`. Contains only the successfully
+    loaded plugins and never imports anything. Lookups are
+    plain dictionary accesses without locks, so the snapshot
+    may be freely shared between threads and forked processes.
+
+    Args:
+        items: Mapping of plugin name to plugin item.
+    """
+
+    __slots__ = ("_items", "_names")
+
+    def __init__(self, items: Mapping[str, T]) -> None:
+        self._names = tuple(sorted(items))
+        self._items = {name: items[name] for name in self._names}
+
+    def __getitem__(self, name: str) -> T:
+        """
+        Get plugin by name.
+
+        Args:
+            name: Plugin name.
+
+        Returns:
+            Plugin item.
+
+        Raises:
+            KeyError: If plugin is not in the snapshot.
+        """
+        return self._items[name]
+
+    def get(  # type: ignore[override]
+        self, name: str, default: T | None = None
+    ) -> T | None:
+        """
+        Get plugin by name or return default.
+
+        Args:
+            name: Plugin name.
+            default: Default value.
+
+        Returns:
+            Plugin item or default.
+        """
+        return self._items.get(name, default)
+
+    def __contains__(self, name: object) -> bool:
+        """
+        Check if plugin is in the snapshot.
+
+        Args:
+            name: Plugin name.
+
+        Returns:
+            True, if plugin is in the snapshot.
+        """
+        return name in self._items
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate over plugin names.
+
+        Returns:
+            Iterator of plugin names, in sorted order.
+        """
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        """
+        Get number of plugins.
+
+        Returns:
+            Number of plugins in the snapshot.
+        """
+        return len(self._names)
+
+    def __repr__(self) -> str:
+        """
+        Get snapshot representation.
+
+        Returns:
+            String representation.
+        """
+        return f"<FrozenLoader: {len(self._names)} plugins>"
@@ -0,0 +1,145 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Plugin dependency graph
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+"""
+Plugin dependency graph.
+
+The graph is the mapping of plugin name to the names
+of the plugins it requires. All required names must be
+the graph's keys as well.
+"""
+
+# Python modules
+from collections.abc import Collection, Mapping
+
+Graph = Mapping[str, Collection[str]]
+
+
+def find_cycle(graph: Graph) -> list[str] | None:
+    """
+    Find the dependency cycle.
+
+    Args:
+        graph: Dependency graph.
+
+    Returns:
+        List of names forming the cycle, starting and ending with
+        the same name. None, if graph has no cycles.
+    """
+    done: set[str] = set()
+    for root in sorted(graph):
+        if root in done:
+            continue
+        # Iterative DFS, path holds the current chain
+        path = [root]
+        on_path = {root}
+        stack = [iter(sorted(graph[root]))]
+        while stack:
+            node = next(stack[-1], None)
+            if node is None:
+                stack.pop()
+                last = path.pop()
+                on_path.discard(last)
+                done.add(last)
+            elif node in on_path:
+                return [*path[path.index(node) :], node]
+            elif node not in done:
+                path.append(node)
+                on_path.add(node)
+                stack.append(iter(sorted(graph[node])))
+    return None
+
+
+def topo_levels(graph: Graph) -> list[tuple[str, ...]]:
+    """
+    Group the names in dependency order.
+
+    Each group contains the names depending only on the names
+    from the previous groups, so the names within the group
+    may be processed in parallel.
+
+    Args:
+        graph: Dependency graph.
+
+    Returns:
+        List of groups, each group is sorted.
+
+    Raises:
+        RuntimeError: On dependency cycle.
+    """
+    pending = {name: len(set(deps)) for name, deps in graph.items()}
+    dependents = get_dependents(graph)
+    levels: list[tuple[str, ...]] = []
+    level = sorted(name for name, n in pending.items() if not n)
+    while level:
+        levels.append(tuple(level))
+        ready: list[str] = []
+        for name in level:
+            for d in dependents[name]:
+                pending[d] -= 1
+                if not pending[d]:
+                    ready.append(d)
+        level = sorted(ready)
+    if sum(len(x) for x in levels) != len(pending):
+        cycle = find_cycle(graph) or []
+        msg = f"Plugin dependency cycle: {' -> '.join(cycle)}"
+        raise RuntimeError(msg)
+    return levels
+
+
+def get_dependents(graph: Graph) -> dict[str, list[str]]:
+    """
+    Invert the dependency graph.
+
+    Args:
+        graph: Dependency graph.
+
+    Returns:
+        Mapping of name to the names requiring it.
+    """
+    r: dict[str, list[str]] = {name: [] for name in graph}
+    for name, deps in graph.items():
+        for d in set(deps):
+            r[d].append(name)
+    return r
+
+
+def critical_path(
+    graph: Graph, durations: Mapping[str, float]
+) -> tuple[tuple[str, ...], float]:
+    """
+    Find the longest chain of dependencies by total duration.
+
+    The critical path is the lower bound of the parallel
+    processing time, whatever the number of workers is.
+
+    Args:
+        graph: Acyclic dependency graph.
+        durations: Mapping of name to its processing time.
+            Missed names are considered instant.
+
+    Returns:
+        Tuple of (`path`, `duration`). Path is ordered
+        from the first processed name.
+    """
+    finish: dict[str, float] = {}
+    prev: dict[str, str | None] = {}
+    for level in topo_levels(graph):
+        for name in level:
+            dep = max(graph[name], key=finish.__getitem__, default=None)
+            start = 0.0 if dep is None else finish[dep]
+            finish[name] = start + durations.get(name, 0.0)
+            prev[name] = dep
+    if not finish:
+        return (), 0.0
+    last = max(finish, key=finish.__getitem__)
+    total = finish[last]
+    path: list[str] = []
+    node: str | None = last
+    while node is not None:
+        path.append(node)
+        node = prev[node]
+    return tuple(reversed(path)), total
@@ -0,0 +1,351 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Persistent plugin index
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+"""Persistent plugin index."""
+
+# Python modules
+import contextlib
+import marshal
+import os
+import sys
+import time
+from collections.abc import Iterable
+from inspect import getmodulename
+from threading import Lock
+from typing import Any, NamedTuple
+
+# Gufo Loader modules
+from .static import ModuleSource, SourceMap, update_sources
+
+# Index format version, must be changed on every format change.
+INDEX_VERSION = 4
+# Directory modification time is considered unreliable (racy)
+# when it is closer than this value to the scan time, nanoseconds.
+RACY_INTERVAL = 2_000_000_000
+# Modification time for directories which must be rescanned next time.
+RACY_MTIME = -1
+
+
+class IndexEntry(NamedTuple):
+    """
+    Plugin module entry.
+
+    Attributes:
+        name: Module name.
+        is_pkg: Module is the package.
+        file: Path to module file (`__init__` file for packages).
+        mtime: Module file modification time, nanoseconds.
+        size: Module file size.
+    """
+
+    name: str
+    is_pkg: bool
+    file: str
+    mtime: int
+    size: int
+
+
+class DirEntry(NamedTuple):
+    """
+    Scanned plugin directory.
+
+    Attributes:
+        mtime: Directory modification time at scan, nanoseconds.
+        modules: Plugin module entries, ordered by name.
+    """
+
+    mtime: int
+    modules: tuple[IndexEntry, ...]
+
+
+def scan_dir(path: str) -> DirEntry:
+    """
+    Scan plugin directory.
+
+    Follows `pkgutil.iter_modules` rules of module discovery.
+
+    Args:
+        path: Directory path.
+
+    Returns:
+        Directory entry.
+    """
+    now = time.time_ns()
+    try:
+        mtime = os.stat(path).st_mtime_ns
+        files = sorted(os.scandir(path), key=lambda x: x.name)
+    except OSError:
+        return DirEntry(mtime=RACY_MTIME, modules=())
+    if now - mtime < RACY_INTERVAL:
+        # Changes within the same timestamp may be missed
+        mtime = RACY_MTIME
+    seen: set[str] = set()
+    modules: list[IndexEntry] = []
+    for de in files:
+        name = getmodulename(de.name)
+        if name == "__init__" or (name and name in seen):
+            continue
+        file = de.path
+        is_pkg = False
+        if not name and "." not in de.name and de.is_dir():
+            init = _find_init(de.path)
+            if not init:
+                continue
+            name, file, is_pkg = de.name, init, True
+        if not name or "." in name:
+            continue
+        try:
+            st = os.stat(file)
+        except OSError:
+            continue
+        seen.add(name)
+        modules.append(
+            IndexEntry(
+                name=name,
+                is_pkg=is_pkg,
+                file=file,
+                mtime=st.st_mtime_ns,
+                size=st.st_size,
+            )
+        )
+    modules.sort(key=lambda x: x.name)
+    return DirEntry(mtime=mtime, modules=tuple(modules))
+
+
+def _find_init(path: str) -> str | None:
+    """
+    Find package's `__init__` file.
+
+    Args:
+        path: Package directory path.
+
+    Returns:
+        Path to `__init__` file, if package. None otherwise.
+
+    Note:
+        Internal function. Must not be used directly.
+    """
+    try:
+        names = os.listdir(path)
+    except OSError:
+        return None
+    for fn in names:
+        if getmodulename(fn) == "__init__":
+            return os.path.join(path, fn)
+    return None
+
+
+class PluginIndex:
+    """
+    Persistent on-disk plugin index.
+
+    Keeps the results of plugin directory scans in the file,
+    so the loader can enumerate the plugins without listing
+    the plugin directories. The index is validated by directory
+    modification times: only changed directories are rescanned,
+    and the index file is rewritten only when something is changed.
+
+    The index also keeps the parsed plugin sources for the static
+    discovery, validated by module files modification times and sizes.
+    Only the changed modules are reparsed.
+
+    The index file is the `marshal` dump of the
+    `(version, cache tag, {path: (mtime, entries)},
+    {file: (mtime, size, source)})` tuple.
+    Each process unmarshals its own copy of the index,
+    only the file itself is shared through the OS file cache.
+    The index file may be shared between loaders with different
+    bases: the entries are merged, so each loader keeps only
+    its own directories up to date.
+
+    Args:
+        path: Path to the index file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = Lock()
+        self._dirs: dict[str, DirEntry] | None = None
+        self._sources: SourceMap = {}
+
+    def _after_fork(self) -> None:
+        """
+        Reset locks in the forked child.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        self._lock = Lock()
+
+    def _ensure_loaded(self) -> dict[str, DirEntry]:
+        """
+        Load index from file on first call.
+
+        Must be called under the lock.
+
+        Returns:
+            Mapping of directory path to its entry.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        if self._dirs is None:
+            self._dirs, self._sources = self._load()
+        return self._dirs
+
+    def _load(self) -> tuple[dict[str, DirEntry], SourceMap]:
+        """
+        Load index from file.
+
+        Broken, stale or missed files are silently ignored.
+
+        Returns:
+            Tuple of mapping of directory path to its entry
+            and parsed sources.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        try:
+            with open(self.path, "rb") as f:
+                data = marshal.load(f)  # noqa: S302
+        except (OSError, ValueError, EOFError, TypeError):
+            return {}, {}
+        if (
+            not isinstance(data, tuple)
+            or len(data) != 4  # noqa: PLR2004
+            or data[0] != INDEX_VERSION
+            or data[1] != sys.implementation.cache_tag
+        ):
+            return {}, {}
+        dirs = {
+            path: DirEntry(
+                mtime=mtime, modules=tuple(IndexEntry(*m) for m in modules)
+            )
+            for path, (mtime, modules) in data[2].items()
+        }
+        sources: SourceMap = {
+            path: (mtime, size, None if src is None else ModuleSource(*src))
+            for path, (mtime, size, src) in data[3].items()
+        }
+        return dirs, sources
+
+    def _save(self) -> None:
+        """
+        Atomically write index to file.
+
+        Write errors are ignored, as index is only the optimization.
+        Entries written by the other processes in the meantime
+        are merged, the own entries take precedence.
+        Parsed sources of the modules not found in the indexed
+        directories are dropped.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        dirs, sources_map = self._load()
+        dirs.update(self._dirs or {})
+        sources_map.update(self._sources)
+        self._dirs, self._sources = dirs, sources_map
+        files = {m.file for d in dirs.values() for m in d.modules}
+        sources: dict[str, tuple[int, int, tuple[Any, ...] | None]] = {
+            path: (mtime, size, None if src is None else tuple(src))
+            for path, (mtime, size, src) in sources_map.items()
+            if path in files
+        }
+        data = (
+            INDEX_VERSION,
+            sys.implementation.cache_tag,
+            {
+                path: (d.mtime, tuple(tuple(m) for m in d.modules))
+                for path, d in dirs.items()
+            },
+            sources,
+        )
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                marshal.dump(data, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+
+    @staticmethod
+    def _get_mtime(path: str) -> int:
+        """
+        Get directory modification time.
+
+        Args:
+            path: Directory path.
+
+        Returns:
+            Modification time in nanoseconds or `RACY_MTIME` on error.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return RACY_MTIME
+
+    def get_dirs(self, paths: Iterable[str]) -> dict[str, DirEntry]:
+        """
+        Get actual directory entries.
+
+        Load the index on first call, rescan changed directories
+        and save the index if necessary. Entries of the other
+        directories are kept in the index.
+
+        Args:
+            paths: Iterable of plugin directories.
+
+        Returns:
+            Mapping of directory path to its actual entry.
+        """
+        with self._lock:
+            indexed = self._ensure_loaded()
+            changed = False
+            dirs: dict[str, DirEntry] = {}
+            for path in paths:
+                d = indexed.get(path)
+                if (
+                    d is None
+                    or d.mtime == RACY_MTIME
+                    or d.mtime != self._get_mtime(path)
+                ):
+                    new_d = scan_dir(path)
+                    changed |= new_d != d
+                    d = new_d
+                dirs[path] = d
+            if changed:
+                indexed.update(dirs)
+                self._save()
+            return dirs
+
+    def get_sources(
+        self, paths: Iterable[str]
+    ) -> dict[str, ModuleSource | None]:
+        """
+        Get parsed plugin sources.
+
+        Changed modules are reparsed and the index
+        is saved if necessary.
+
+        Args:
+            paths: Iterable of module file paths.
+
+        Returns:
+            Mapping of path to parsed source. Source is None,
+            if module is not the Python source.
+        """
+        with self._lock:
+            self._ensure_loaded()
+            r, changed = update_sources(self._sources, paths)
+            if changed:
+                self._save()
+            return r
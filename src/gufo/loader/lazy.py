@@ -0,0 +1,243 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Lazy plugin proxy
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+"""Lazy plugin proxy."""
+
+# Python modules
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from .loader import Loader
+
+T = TypeVar("T")
+
+
+class _Unresolved: ...
+
+
+_unresolved = _Unresolved()
+# Proxy's own attributes bypass the forwarding
+_get = object.__getattribute__
+_set = object.__setattr__
+
+
+class LazyPlugin(Generic[T]):
+    """
+    Proxy importing the plugin on the first use.
+
+    Created by `Loader.lazy()`. The plugin is loaded on the first
+    attribute access or call. Then the loaded item is kept
+    in the proxy, and the following accesses are forwarded
+    to it directly, without the loader lookups.
+
+    Python looks up special methods on the type, bypassing
+    the attribute access. So the proxy forwards only the common
+    ones: comparison for equality, `hash()`, `bool()`, `str()`,
+    `len()`, iteration, `in` and item access. Other operators
+    are not supported.
+
+    Any forwarded operation imports the plugin on the first use.
+    It includes `isinstance()` and `issubclass()` checks, which
+    see the plugin's `__class__` and `__bases__`, and `hash()`
+    and `==`, so putting the proxy into a set or using it
+    as a dictionary key imports the plugin. Only `repr()`
+    does not import. `type()` and `is` see the proxy itself.
+
+    Args:
+        loader: Loader instance.
+        name: Plugin name.
+    """
+
+    __slots__ = ("_item", "_loader", "_name")
+
+    def __init__(self, loader: "Loader[T]", name: str) -> None:
+        _set(self, "_loader", loader)
+        _set(self, "_name", name)
+        _set(self, "_item", _unresolved)
+
+    def __getattribute__(self, name: str) -> Any:  # noqa: ANN401
+        """
+        Get plugin item's attribute.
+
+        Args:
+            name: Attribute name.
+
+        Returns:
+            Attribute value.
+        """
+        item = _get(self, "_item")
+        if item is _unresolved:
+            item = _resolve(self)
+        return getattr(item, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        """
+        Set plugin item's attribute.
+
+        Args:
+            name: Attribute name.
+            value: Attribute value.
+        """
+        setattr(_resolve(self), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        """
+        Delete plugin item's attribute.
+
+        Args:
+            name: Attribute name.
+        """
+        delattr(_resolve(self), name)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        """
+        Call plugin item.
+
+        Args:
+            args: Positional arguments.
+            kwargs: Keyword arguments.
+
+        Returns:
+            Call result.
+        """
+        return _resolve(self)(*args, **kwargs)  # type: ignore[operator]
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare plugin item for equality.
+
+        Args:
+            other: Other object.
+
+        Returns:
+            Comparison result.
+        """
+        return _resolve(self) == other  # type: ignore[no-any-return]
+
+    def __ne__(self, other: object) -> bool:
+        """
+        Compare plugin item for inequality.
+
+        Args:
+            other: Other object.
+
+        Returns:
+            Comparison result.
+        """
+        return _resolve(self) != other  # type: ignore[no-any-return]
+
+    def __hash__(self) -> int:
+        """
+        Get plugin item's hash.
+
+        Returns:
+            Hash value.
+        """
+        return hash(_resolve(self))
+
+    def __bool__(self) -> bool:
+        """
+        Get plugin item's truth value.
+
+        Returns:
+            Truth value.
+        """
+        return bool(_resolve(self))
+
+    def __len__(self) -> int:
+        """
+        Get plugin item's length.
+
+        Returns:
+            Length.
+        """
+        return len(_resolve(self))  # type: ignore[arg-type]
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterate over plugin item.
+
+        Returns:
+            Iterator.
+        """
+        return iter(_resolve(self))  # type: ignore[call-overload,no-any-return]
+
+    def __contains__(self, value: object) -> bool:
+        """
+        Check plugin item contains the value.
+
+        Args:
+            value: Value to check.
+
+        Returns:
+            True, if the value is in the item.
+        """
+        return value in _resolve(self)  # type: ignore[operator]
+
+    def __getitem__(self, key: Any) -> Any:  # noqa: ANN401
+        """
+        Get plugin item's element.
+
+        Args:
+            key: Element key.
+
+        Returns:
+            Element value.
+        """
+        return _resolve(self)[key]  # type: ignore[index]
+
+    def __str__(self) -> str:
+        """
+        Convert plugin item to string.
+
+        Returns:
+            String value.
+        """
+        return str(_resolve(self))
+
+    def __repr__(self) -> str:
+        """
+        Get proxy representation.
+
+        Returns:
+            String representation.
+        """
+        name = _get(self, "_name")
+        item = _get(self, "_item")
+        if item is _unresolved:
+            return f"<LazyPlugin: {name}>"
+        return f"<LazyPlugin: {name} -> {item!r}>"
+
+
+def _resolve(proxy: LazyPlugin[T]) -> T:
+    """
+    Get the proxy's plugin item, loading it if necessary.
+
+    Args:
+        proxy: Proxy instance.
+
+    Returns:
+        Plugin item.
+
+    Raises:
+        KeyError: If plugin is missed.
+
+    Note:
+        Internal function. Must not be used directly.
+    """
+    item = _get(proxy, "_item")
+    if item is not _unresolved:
+        return item  # type: ignore[no-any-return]
+    loader: Loader[T] = _get(proxy, "_loader")
+    name: str = _get(proxy, "_name")
+    loaded = loader.get(name)
+    if loaded is None:
+        msg = f"plugin is not found: {name}"
+        failure = loader.failures().get(name)
+        raise KeyError(msg) from failure.error if failure else None
+    _set(proxy, "_item", loaded)
+    return loaded
@@ -7,14 +7,344 @@
 """Loader implementation."""
 
 # Python modules
-import inspect
-from collections.abc import Callable, Iterable, Iterator
+import asyncio
+import contextlib
+import importlib
+import os
+import re
+import sys
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from fnmatch import fnmatchcase
+from importlib.machinery import PathFinder
 from pkgutil import iter_modules
-from threading import RLock
-from typing import Any, Generic, TypeVar, cast, get_args, get_origin, overload
+from py_compile import PycInvalidationMode
+from threading import Lock, RLock, get_ident, local
+from types import ModuleType
+from typing import (
+    Any,
+    Generic,
+    Literal,
+    NamedTuple,
+    TypeVar,
+    cast,
+    get_args,
+    get_origin,
+    overload,
+)
+from weakref import finalize
+
+# Gufo Loader modules
+from .bytecode import (
+    check_bytecode,
+    compile_bytecode,
+    get_cache_path,
+    measure_compile,
+)
+from .fork import freeze_gc, register_fork_handler
+from .frozen import FrozenLoader
+from .graph import critical_path, get_dependents, topo_levels
+from .index import IndexEntry, PluginIndex, scan_dir
+from .lazy import LazyPlugin
+from .report import (
+    BytecodeReport,
+    LoaderStats,
+    ModuleBytecode,
+    PluginFailure,
+    PluginTiming,
+    PreforkReport,
+    PreloadReport,
+)
+from .static import (
+    ItemKind,
+    ModuleSource,
+    PluginInfo,
+    SourceCache,
+    select_candidate,
+)
+from .validator import (
+    InstanceValidator,
+    ProtocolValidator,
+    SubclassValidator,
+    Validator,
+    is_runtime_protocol,
+)
+from .watcher import PluginWatcher
 
 T = TypeVar("T")
 
+# Instrumentation events
+HookEvent = Literal[
+    "on_scan",
+    "on_import_start",
+    "on_import_end",
+    "on_hit",
+    "on_miss",
+    "on_error",
+]
+HOOK_EVENTS: frozenset[str] = frozenset(get_args(HookEvent))
+# Handling of the dispatch keys declared by several plugins
+KeyConflictPolicy = Literal["first", "raise"]
+
+# Module attribute explicitly declaring the plugin item
+PLUGIN_ATTR = "__plugin__"
+# Free-threaded (no-GIL) build
+FREE_THREADING = not getattr(sys, "_is_gil_enabled", lambda: True)()
+# Shell-style pattern special characters
+PATTERN_SPECIAL = re.compile(r"[*?\[]")
+# Maximal number of cached names missed by the plugin directories probe
+MAX_PROBE_MISSES = 1024
+# Types of module members which are never plugins
+SKIP_TYPES = frozenset(
+    {
+        ModuleType,
+        type(None),
+        bool,
+        int,
+        float,
+        str,
+        bytes,
+        tuple,
+        list,
+        dict,
+        set,
+        frozenset,
+    }
+)
+
+
+def filter_names(
+    names: tuple[str, ...] | Iterator[str],
+    prefix: str | None = None,
+    pattern: str | None = None,
+) -> Iterator[str]:
+    """
+    Filter plugin names by prefix and shell-style pattern.
+
+    Sorted tuple of names is looked up with binary search
+    by the prefix and the pattern's literal part, iterator
+    is filtered sequentially.
+
+    Args:
+        names: Sorted tuple of names or iterator of names.
+        prefix: Yield only names starting with prefix.
+        pattern: Yield only names matching the shell-style
+            pattern, i.e. `huawei_*`.
+
+    Returns:
+        Iterator of names, in order of `names`.
+    """
+    if pattern is not None:
+        # Literal part of pattern
+        pp = PATTERN_SPECIAL.split(pattern, 1)[0]
+        if prefix is None or pp.startswith(prefix):
+            prefix = pp
+        elif not prefix.startswith(pp):
+            return
+    if not prefix:
+        selected: Iterator[str] = iter(names)
+    elif isinstance(names, tuple):
+        selected = _iter_prefix(names, prefix)
+    else:
+        selected = (n for n in names if n.startswith(prefix))
+    if pattern is None:
+        yield from selected
+    else:
+        for name in selected:
+            if fnmatchcase(name, pattern):
+                yield name
+
+
+def _iter_prefix(names: tuple[str, ...], prefix: str) -> Iterator[str]:
+    """
+    Iterate over sorted names starting with prefix.
+
+    Args:
+        names: Sorted tuple of names.
+        prefix: Name prefix.
+
+    Returns:
+        Iterator of names.
+
+    Note:
+        Internal function. Must not be used directly.
+    """
+    for i in range(bisect_left(names, prefix), len(names)):
+        name = names[i]
+        if not name.startswith(prefix):
+            break
+        yield name
+
+
+class _NameIndex(NamedTuple):
+    """
+    In-memory plugin name index.
+
+    Replaced as a whole, so readers always see the consistent state.
+
+    Attributes:
+        names: Sorted tuple of plugin names.
+        name_set: Set of plugin names.
+        routes: Mapping of plugin name to the tuple of the bases
+            containing the plugin module, in order of precedence.
+    """
+
+    names: tuple[str, ...]
+    name_set: frozenset[str]
+    routes: dict[str, tuple[str, ...]]
+
+
+class _ThreadToken:
+    """
+    Weak-referenceable object, living as long as its thread.
+
+    Note:
+        Internal class. Must not be used directly.
+    """
+
+    __slots__ = ("__weakref__",)
+
+
+class _CounterCells:
+    """
+    Registry of the per-thread counter cells.
+
+    Cells of the finished threads are folded into the shared
+    total, so the registry holds only the live threads' cells.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._total = 0
+        self._cells: dict[int, list[int]] = {}  # id(cell) -> cell
+
+    def add(self, token: _ThreadToken) -> list[int]:
+        """
+        Register the new cell.
+
+        Args:
+            token: Thread's token. The cell is folded into
+                the total when the token is collected.
+
+        Returns:
+            New cell.
+        """
+        cell = [0]
+        with self._lock:
+            self._cells[id(cell)] = cell
+        finalize(token, self._fold, cell)
+        return cell
+
+    def _fold(self, cell: list[int]) -> None:
+        """
+        Fold the finished thread's cell into the total.
+
+        Args:
+            cell: Counter cell.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        with self._lock:
+            self._total += cell[0]
+            self._cells.pop(id(cell), None)
+
+    def __len__(self) -> int:
+        """
+        Get number of the live cells.
+
+        Returns:
+            Number of cells.
+        """
+        return len(self._cells)
+
+    def sum(self) -> int:
+        """
+        Get the sum of all the cells.
+
+        Returns:
+            Total value, including the finished threads.
+        """
+        with self._lock:
+            return self._total + sum(c[0] for c in self._cells.values())
+
+    def _after_fork(self) -> None:
+        """
+        Reset lock in the forked child.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        self._lock = Lock()
+
+
+class _NameLock:
+    """
+    Plugin import lock.
+
+    Keeps the owner thread, so the loader can refuse the waits
+    closing the cycle of plugins requesting each other
+    during the import, like `importlib` module locks do.
+
+    Attributes:
+        lock: Underlying lock.
+        owner: Identifier of the thread holding the lock, if any.
+    """
+
+    __slots__ = ("lock", "owner")
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.owner: int | None = None
+
+
+class _ThreadCounter(local):
+    """
+    Per-thread counter.
+
+    Each thread gets its own cell, registered in the shared
+    registry of cells. Avoids the contention on the shared counter
+    in free-threaded builds.
+
+    Args:
+        cells: Registry of all threads' cells.
+    """
+
+    def __init__(self, cells: _CounterCells) -> None:
+        self.token = _ThreadToken()
+        self.cell = cells.add(self.token)
+
+
+class _MetaIndex(NamedTuple):
+    """
+    In-memory plugin metadata index.
+
+    Attributes:
+        meta: Mapping of plugin name to its static metadata.
+        values: Mapping of (`key`, `value`) to the set
+            of plugin names.
+    """
+
+    meta: dict[str, Mapping[str, Any]]
+    values: dict[tuple[str, Any], frozenset[str]]
+
+
+class _DispatchIndex(NamedTuple):
+    """
+    In-memory key dispatch table.
+
+    Attributes:
+        keys: Mapping of key to the handling plugin name.
+        conflicts: Mapping of key to the names of all plugins
+            declaring it, for keys declared by several plugins.
+    """
+
+    keys: dict[Any, str]
+    conflicts: dict[Any, tuple[str, ...]]
+
 
 class Loader(Generic[T]):
     """
@@ -25,6 +355,25 @@ class Loader(Generic[T]):
         bases: Iterable of plugin package names.
         strict: Ignore missed plugin packages if set to False, Fail otherwise.
         exclude: Iterable of names to be excluded from plugins lists.
+        index: Optional path to the persistent plugin index file.
+            When set, plugin enumeration is served from the index,
+            which is validated against plugin directories modification
+            times and incrementally rebuilt when necessary.
+        failure_ttl: Time in seconds to keep the failed plugin loads
+            before the next import attempt. If not set, failures are
+            kept until `refresh()`, `invalidate()` or `clear_failures()`.
+            Set to 0 to retry the import on every request.
+        max_size: Maximal number of cached plugins. When set,
+            the least recently used plugins are evicted from the cache.
+            Pinned plugins are not counted and never evicted.
+        pinned: Iterable of plugin names which are never evicted.
+        unload: Remove evicted plugin modules from `sys.modules`.
+            Only the modules imported by the loader itself
+            are removed.
+        on_key_conflict: Handling of the `for_key()` lookups of the keys
+            declared by several plugins. `first` - the first plugin
+            in order of names handles the key, `raise` - raise
+            `RuntimeError`.
 
     Note:
         `base` and `bases` parameters are mutually exclusive.
@@ -32,17 +381,24 @@ class Loader(Generic[T]):
 
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         base: str | None = None,
         bases: Iterable[str] | None = None,
         strict: bool = False,
         exclude: Iterable[str] | None = None,
+        index: str | None = None,
+        failure_ttl: float | None = None,
+        max_size: int | None = None,
+        pinned: Iterable[str] | None = None,
+        unload: bool = False,
+        on_key_conflict: KeyConflictPolicy = "first",
     ) -> None:
         # Pass to generic
         super().__init__()
         self.strict = strict
-        self._validate: Callable[[Any], bool] | None = None
+        self._on_key_conflict = on_key_conflict
+        self._validate: Validator | None = None
         # Check settinngs
         if base is not None and bases is None:
             self._bases = [base]
@@ -52,13 +408,53 @@ class Loader(Generic[T]):
             msg = "Either base or bases should be set"
             raise RuntimeError(msg)
         # Map bases to physical paths
-        self._paths = list(self._iter_paths(self._bases))
+        self._base_paths = list(self._iter_paths(self._bases))
+        self._paths = [path for _, path in self._base_paths]
         if not self._paths:
             msg = "No valid bases"
             raise RuntimeError(msg)
         self._classes: dict[str, T] = {}  # name -> class
         self._lock = RLock()
+        self._name_locks: dict[str, _NameLock] = {}  # name -> import lock
+        # thread id -> import lock the thread is waiting for
+        self._blocking_on: dict[int, _NameLock] = {}
         self._exclude: set[str] = set(exclude or [])
+        self._index = PluginIndex(index) if index else None
+        self._names: _NameIndex | None = None
+        # Names missed both in the name index and in the plugin directories
+        self._probe_misses: set[str] = set()
+        self._failures: dict[str, PluginFailure] = {}
+        self._failure_ttl = failure_ttl
+        # Instrumentation
+        self._hooks: dict[str, tuple[Callable[..., None], ...]] = {}
+        self._on_hit: tuple[Callable[..., None], ...] = ()
+        self._hits = 0
+        # Per-thread hit counters for free-threaded builds
+        self._hit_cells = _CounterCells()
+        self._hit_counter = _ThreadCounter(self._hit_cells)
+        self._misses = 0
+        self._imports = 0
+        self._import_errors = 0
+        self._import_time = 0.0
+        self._scans = 0
+        self._scan_time = 0.0
+        # Bounded cache
+        self._max_size = max_size
+        self._pinned: set[str] = set(pinned or [])
+        self._unload = unload
+        self._lru: OrderedDict[str, None] = OrderedDict()
+        self._owned: dict[str, str] = {}  # name -> module name
+        self._evictions = 0
+        self._unloads = 0
+        self._update_hit_hooks()
+        # Static discovery
+        self._sources = SourceCache()
+        self._meta: _MetaIndex | None = None
+        self._dispatch: _DispatchIndex | None = None
+        # (loop, name) -> pending import
+        self._pending: dict[
+            tuple[asyncio.AbstractEventLoop, str], asyncio.Future[T | None]
+        ] = {}
 
     def _get_item_type(self) -> T:
         """
@@ -72,12 +468,12 @@ class Loader(Generic[T]):
         """
         return get_args(self.__orig_class__)[0]  # type: ignore
 
-    def _get_validator(self) -> Callable[[Any], bool]:
+    def _get_validator(self) -> Validator:
         """
-        Get item validator function depending of instance type.
+        Get item validator depending of instance type.
 
         Returns:
-            Validation callable accepting one argument and returning boolean.
+            Validator instance.
 
         Note:
             Internal method. Must not be used directly.
@@ -97,7 +493,7 @@ class Loader(Generic[T]):
     @staticmethod
     def _is_instance_validator(
         t: Any,  # noqa: ANN401
-    ) -> Callable[[Any], bool]:
+    ) -> Validator:
         """
         Instance validator.
 
@@ -108,27 +504,28 @@ class Loader(Generic[T]):
         Loader[BaseClass](...)
         ```
 
+        Runtime checkable protocols are checked structurally,
+        with the results cached per candidate class.
+
         Args:
             t: Arbitrary object from module to check.
 
         Returns:
-            Validation callable accepting one argument and returning boolean.
+            Validator instance.
 
         Note:
             Internal method. Must not be used directly.
         """
-
-        def inner(x: Any) -> bool:  # noqa: ANN401
-            return isinstance(x, t)
-
-        return inner
+        if is_runtime_protocol(t):
+            return ProtocolValidator(t)
+        return InstanceValidator(t)
 
     @staticmethod
     def _is_subclass_validator(
         t: Any,  # noqa: ANN401
-    ) -> Callable[[Any], bool]:
+    ) -> Validator:
         """
-        Instance validator.
+        Subclass validator.
 
         Check if the item is subclass of generic class.
         Used for subclass scheme. i.e.
@@ -137,20 +534,21 @@ class Loader(Generic[T]):
         Loader[type[BaseClass]](...)
         ```
 
+        Runtime checkable protocols are checked structurally,
+        with the results cached per candidate class.
+
         Args:
             t: Arbitrary object from module to check.
 
         Returns:
-            Validation callable accepting one argument and returning boolean.
+            Validator instance.
 
         Note:
             Internal method. Must not be used directly.
         """
-
-        def inner(x: Any) -> bool:  # noqa: ANN401
-            return issubclass(x, t)
-
-        return inner
+        if is_runtime_protocol(t):
+            return ProtocolValidator(t, classes=True)
+        return SubclassValidator(t)
 
     @staticmethod
     def _is_type(x: Any) -> bool:  # noqa: ANN401
@@ -168,7 +566,7 @@ class Loader(Generic[T]):
         """
         return get_origin(x) is type
 
-    def _iter_paths(self, bases: Iterable[str]) -> Iterable[str]:
+    def _iter_paths(self, bases: Iterable[str]) -> Iterable[tuple[str, str]]:
         """
         Iterate over all paths.
 
@@ -179,7 +577,7 @@ class Loader(Generic[T]):
             bases: Iterable of python packages name.
 
         Returns:
-            Iterable of resolved paths.
+            Iterable of (`base`, `path`) tuples.
 
         Note:
             Internal method. Must not be used directly.
@@ -189,7 +587,7 @@ class Loader(Generic[T]):
                 m = __import__(b, {}, {}, "*")
                 paths = getattr(m, "__path__", None)
                 if paths:
-                    yield paths[0]
+                    yield b, paths[0]
             except ModuleNotFoundError as e:
                 if self.strict:
                     msg = f"Module '{b}' is not found"
@@ -210,7 +608,18 @@ class Loader(Generic[T]):
         Raises:
             KeyError: if plugin is missed.
         """
-        kls = self.get(name)
+        # Lock-free fast path, excluded names are never cached.
+        # Same as `_get_cached()`, inlined to save the call.
+        kls = self._classes.get(name)
+        if kls is not None:
+            if FREE_THREADING:
+                self._hit_counter.cell[0] += 1
+            else:
+                self._hits += 1
+            if self._on_hit:
+                self._emit_hit(name)
+            return kls
+        kls = self._get_item(name)
         if kls is None:
             raise KeyError(name)
         return kls
@@ -229,7 +638,7 @@ class Loader(Generic[T]):
         Returns:
             Iterable of plugin names.
         """
-        return iter(self.keys())
+        return iter(self._get_names().names)
 
     @overload
     def get(self, name: str) -> T | None: ...
@@ -248,7 +657,23 @@ class Loader(Generic[T]):
         Returns:
             Plugin item if found, otherwise the explicit default value.
             If default is omitted, returns None when plugin is missing.
+
+        Raises:
+            Exception: Exception other than `ImportError`, raised
+                by the plugin module on import. Re-raised while
+                the failure is recorded.
         """
+        # Lock-free fast path, excluded names are never cached.
+        # Same as `_get_cached()`, inlined to save the call.
+        kls = self._classes.get(name)
+        if kls is not None:
+            if FREE_THREADING:
+                self._hit_counter.cell[0] += 1
+            else:
+                self._hits += 1
+            if self._on_hit:
+                self._emit_hit(name)
+            return kls
         kls = self._get_item(name)
         if kls is not None:
             return kls
@@ -256,11 +681,94 @@ class Loader(Generic[T]):
             return default
         return None
 
+    @overload
+    async def aget(self, name: str) -> T | None: ...
+    @overload
+    async def aget(self, name: str, default: T) -> T: ...
+    async def aget(self, name: str, default: T | None = None) -> T | None:
+        """
+        Get plugin by name without blocking the event loop.
+
+        Cached plugins are returned immediately. Otherwise, the plugin
+        is imported in the loop's default executor. Concurrent requests
+        for the same plugin share the single import.
+
+        Args:
+            name: Name of plugin.
+            default: Default value, if plugin is missed.
+
+        Returns:
+            Plugin item if found, otherwise the explicit default value.
+            If default is omitted, returns None when plugin is missing.
+        """
+        kls = self._get_cached(name)
+        if kls is not None:
+            return kls
+        loop = asyncio.get_running_loop()
+        key = (loop, name)
+        fut = self._pending.get(key)
+        if fut is None:
+            fut = loop.run_in_executor(None, self._get_item, name)
+            self._pending[key] = fut
+            fut.add_done_callback(lambda _: self._pending.pop(key, None))
+        # Cancellation of the single waiter must not cancel the import
+        kls = await asyncio.shield(fut)
+        if kls is not None:
+            return kls
+        if default is not None:
+            return default
+        return None
+
+    def _get_cached(self, name: str) -> T | None:
+        """
+        Get plugin from cache.
+
+        Lock-free. Counts the cache hit and calls `on_hit` hooks.
+        Inlined into `get()` and `__getitem__()`, must be kept in sync.
+
+        Args:
+            name: Plugin name.
+
+        Returns:
+            Cached item or None.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        kls = self._classes.get(name)
+        if kls is not None:
+            if FREE_THREADING:
+                self._hit_counter.cell[0] += 1
+            else:
+                self._hits += 1
+            if self._on_hit:
+                self._emit_hit(name)
+            return kls
+        return None
+
     def _get_item(self, name: str) -> T | None:
         """
         Get plugin by name.
 
-        Search all the packages and get plugin named by `name`.
+        Route the name to the packages containing the plugin module
+        using the name index. Names missed in the index are probed
+        once in the plugin directories without import, so the plugin
+        modules added after the index is built are still found.
+        Dotted names, which are not the part of the index,
+        are searched in all the packages.
+
+        Imports are serialized per plugin name: concurrent requests
+        for the same plugin wait for the single import, while
+        requests for different plugins are processed in parallel.
+        Cached plugins are returned without locking. The request
+        which would wait for its own import, directly or through
+        the other threads, gets the item from the partially
+        initialized module instead, like Python's circular imports.
+
+        Failed loads are cached according to `failure_ttl` policy,
+        so the broken plugin costs the single import attempt.
+        Exceptions other than `ImportError` are re-raised
+        on each request while the failure is cached.
 
         Args:
             name: Plugin name
@@ -274,23 +782,104 @@ class Loader(Generic[T]):
         if name in self._exclude:
             msg = "Trying to import excluded name"
             raise RuntimeError(msg)
-        with self._lock:
+        kls = self._get_cached(name)
+        if kls is not None:
+            return kls
+        self._misses += 1
+        self._emit("on_miss", name)
+        if "." in name:
+            bases: Iterable[str] = self._bases
+        else:
+            bases = self._get_names().routes.get(name, ())
+            if not bases:
+                bases = self._probe(name)
+                if not bases:
+                    return None
+        if self._is_failed(name):
+            self._raise_failure(name)
+            return None
+        lock = self._get_name_lock(name)
+        if not self._acquire_name_lock(lock):
+            # Plugins request each other during import
+            return self._get_initializing(name, bases)
+        try:
             kls = self._classes.get(name)
-            if kls is not None:
-                return kls
-            for b in self._bases:
-                kls = self._find_item(f"{b}.{name}")
+            if kls is None:
+                if self._is_failed(name):
+                    self._raise_failure(name)
+                else:
+                    kls = self._load_item(name, bases)
+            return kls
+        finally:
+            # Late comers will get item or failure from cache
+            self._release_name_lock(name, lock)
+
+    def _get_initializing(self, name: str, bases: Iterable[str]) -> T | None:
+        """
+        Get plugin item from the module being imported.
+
+        Like Python's circular imports, the item is found only
+        if it is defined before the request. The item is not cached,
+        the import in progress caches the final one.
+
+        Args:
+            name: Plugin name.
+            bases: Iterable of packages to search the plugin in.
+
+        Returns:
+            Item found or None
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        for b in bases:
+            module = sys.modules.get(f"{b}.{name}")
+            if module is not None:
+                kls = self._select_item(module)
                 if kls is not None:
-                    self._classes[name] = kls
                     return kls
         return None
 
-    def _find_item(self, name: str) -> T | None:
+    def _probe(self, name: str) -> tuple[str, ...]:
         """
-        Get plugin item from module `name`.
+        Find packages containing plugin missed in the name index.
+
+        All the portions of the namespace packages are searched.
+        The modules are not imported. Missed names are remembered
+        until `refresh()` or `invalidate()`.
 
         Args:
-            name: Module name.
+            name: Plugin name.
+
+        Returns:
+            Tuple of packages containing the plugin module,
+            in order of precedence.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        if name in self._probe_misses:
+            return ()
+        bases: list[str] = []
+        for b in self._bases:
+            paths = getattr(sys.modules.get(b), "__path__", None)
+            if paths and PathFinder.find_spec(name, list(paths)) is not None:
+                bases.append(b)
+        if not bases:
+            if len(self._probe_misses) >= MAX_PROBE_MISSES:
+                self._probe_misses.clear()
+            self._probe_misses.add(name)
+        return tuple(bases)
+
+    def _load_item(self, name: str, bases: Iterable[str]) -> T | None:
+        """
+        Load and cache plugin.
+
+        Must be called with plugin's name lock held.
+
+        Args:
+            name: Plugin name.
+            bases: Iterable of packages to search the plugin in.
 
         Returns:
             Item found or None
@@ -298,69 +887,1692 @@ class Loader(Generic[T]):
         Note:
             Internal method. Must not be used directly.
         """
-        is_valid = self._get_validator()
+        self._emit("on_import_start", name)
+        t0 = time.perf_counter()
+        kls: T | None = None
+        error: BaseException | None = None
         try:
-            module = __import__(name, {}, {}, "*")
-            for _, member in inspect.getmembers(module):
-                # Check member is originated from same module
-                if (
-                    hasattr(member, "__module__")
-                    and member.__module__ != module.__name__
-                ):
-                    continue
-                # Check member is valid
-                if not is_valid(member):
-                    continue
-                # Cast member to proper type
-                return cast(T, member)
-        except ImportError:
-            pass
+            kls, error = self._import_item(name, bases)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            # Count and report the import even if it is interrupted
+            duration = time.perf_counter() - t0
+            self._imports += 1
+            self._import_time += duration
+            self._emit("on_import_end", name, duration, kls is not None)
+            if kls is None:
+                self._import_errors += 1
+                self._emit("on_error", name, error)
+        if kls is not None:
+            self._set_item(name, kls)
+            return kls
+        if "." not in name:
+            self._set_failed(name, error)
+        if error is not None and not isinstance(error, ImportError):
+            raise error
         return None
 
-    def keys(self) -> Iterable[str]:
+    def _import_item(
+        self, name: str, bases: Iterable[str]
+    ) -> tuple[T | None, Exception | None]:
         """
-        Iterate over plugin name.
+        Import plugin from the first package containing it.
 
-        Iterable yielding all existing plugin names.
+        Any exception raised by the plugin module is considered
+        the load failure, so the broken module is not reimported
+        on every request. `ImportError` means the plugin cannot
+        be loaded from this package, so the next package is tried.
+        The other exceptions stop the search.
+
+        Args:
+            name: Plugin name.
+            bases: Iterable of packages to search the plugin in.
 
         Returns:
-            Iterable of strings with all plugin names.
+            Tuple of (`item`, `error`). Item is None if not found,
+            error is the last exception raised on import, if any.
 
         Note:
-            `keys()` do not force plugin module loading and instantiation.
+            Internal method. Must not be used directly.
         """
-        seen: set[str] = set()
-        for mi in iter_modules(self._paths):
-            if mi.name not in seen and mi.name not in self._exclude:
-                seen.add(mi.name)
-        yield from sorted(seen)
+        error: Exception | None = None
+        for b in bases:
+            mod_name = f"{b}.{name}"
+            is_loaded = mod_name in sys.modules
+            try:
+                kls = self._find_item(mod_name)
+            except ImportError as e:
+                error = e
+                continue
+            except Exception as e:  # noqa: BLE001
+                return None, e
+            if kls is not None:
+                if self._unload and not is_loaded:
+                    self._owned[name] = mod_name
+                return kls, None
+        return None, error
 
-    def values(self) -> Iterable[T]:
+    def _set_item(self, name: str, kls: T) -> None:
         """
-        Iterate all found plugin items.
+        Put item into the cache.
 
-        Returns:
-            Iterable of plugin items.
+        Evict the least recently used items, if necessary.
+
+        Args:
+            name: Plugin name.
+            kls: Plugin item.
 
         Note:
-            `values()` will force plugin module loading and instantiation.
+            Internal method. Must not be used directly.
         """
-        for name in self:
-            item = self.get(name)
-            if item is not None:
-                yield item
+        self._classes[name] = kls
+        self._failures.pop(name, None)
+        if self._max_size is not None and name not in self._pinned:
+            with self._lock:
+                self._lru[name] = None
+                self._lru.move_to_end(name)
+                self._evict()
+
+    def _touch(self, name: str) -> None:
+        """
+        Mark cached item as recently used.
 
-    def items(self) -> Iterable[tuple[str, T]]:
+        The GIL makes the concurrent `OrderedDict` changes safe.
+        Free-threaded builds reorder the items under the loader's lock,
+        like `_evict()`, `pin()` and `unpin()` do.
+
+        Args:
+            name: Plugin name.
+
+        Note:
+            Internal method. Must not be used directly.
         """
-        Iterate the (`name`, `item`) tuples for all plugin items.
+        if FREE_THREADING:
+            with self._lock:
+                if name in self._lru:
+                    self._lru.move_to_end(name)
+            return
+        # Item may be concurrently evicted
+        with contextlib.suppress(KeyError):
+            self._lru.move_to_end(name)
+
+    def _evict(self) -> None:
+        """
+        Evict the least recently used items above the cache size.
 
-        Return:
-            Iterable of tuples of (`name`, `item`)
+        Must be called with the loader's lock held.
 
         Note:
-            `items()` will force plugin module loading and instantiation.
+            Internal method. Must not be used directly.
         """
-        for name in self:
-            item = self.get(name)
-            if item is not None:
-                yield name, item
+        if self._max_size is None:
+            return
+        while len(self._lru) > self._max_size:
+            name, _ = self._lru.popitem(last=False)
+            self._classes.pop(name, None)
+            self._evictions += 1
+            mod_name = self._owned.pop(name, None)
+            if mod_name:
+                self._unload_module(mod_name)
+
+    def _unload_module(self, mod_name: str) -> None:
+        """
+        Remove module from `sys.modules` and from its parent package.
+
+        Args:
+            mod_name: Module name.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        module = sys.modules.pop(mod_name, None)
+        if module is None:
+            return
+        parent_name, _, attr = mod_name.rpartition(".")
+        parent = sys.modules.get(parent_name)
+        if parent is not None and getattr(parent, attr, None) is module:
+            delattr(parent, attr)
+        self._unloads += 1
+
+    def pin(self, name: str) -> None:
+        """
+        Protect plugin from eviction.
+
+        Args:
+            name: Plugin name.
+        """
+        with self._lock:
+            self._pinned.add(name)
+            self._lru.pop(name, None)
+
+    def unpin(self, name: str) -> None:
+        """
+        Allow plugin eviction.
+
+        Args:
+            name: Plugin name.
+        """
+        with self._lock:
+            self._pinned.discard(name)
+            if self._max_size is not None and name in self._classes:
+                self._lru[name] = None
+                self._evict()
+
+    def add_hook(self, event: HookEvent, hook: Callable[..., None]) -> None:
+        """
+        Register instrumentation hook.
+
+        Hooks are called synchronously in the thread performing
+        the operation. Hook signatures depend on the event:
+
+        * `on_scan(duration: float, count: int)` - plugin directories
+          are scanned, `count` is the number of found plugins.
+        * `on_import_start(name: str)` - plugin import is started.
+        * `on_import_end(name: str, duration: float, loaded: bool)` -
+          plugin import is finished.
+        * `on_hit(name: str)` - plugin is served from cache.
+        * `on_miss(name: str)` - plugin is not in cache.
+        * `on_error(name: str, error: BaseException | None)` - plugin
+          is failed to load, `error` is None if module contains
+          no valid plugin item.
+
+        Args:
+            event: Event name.
+            hook: Callable to be called on event.
+
+        Raises:
+            ValueError: On unknown event.
+        """
+        if event not in HOOK_EVENTS:
+            msg = f"Unknown event: {event}"
+            raise ValueError(msg)
+        with self._lock:
+            self._hooks[event] = (*self._hooks.get(event, ()), hook)
+            self._update_hit_hooks()
+
+    def remove_hook(self, event: HookEvent, hook: Callable[..., None]) -> None:
+        """
+        Unregister instrumentation hook.
+
+        Args:
+            event: Event name.
+            hook: Previously registered callable.
+        """
+        with self._lock:
+            hooks = tuple(h for h in self._hooks.get(event, ()) if h != hook)
+            if hooks:
+                self._hooks[event] = hooks
+            else:
+                self._hooks.pop(event, None)
+            self._update_hit_hooks()
+
+    def _update_hit_hooks(self) -> None:
+        """
+        Update the list of callables to be called on cache hit.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        hooks = self._hooks.get("on_hit", ())
+        if self._max_size is not None:
+            hooks = (self._touch, *hooks)
+        self._on_hit = hooks
+
+    def _emit(self, event: str, *args: Any) -> None:  # noqa: ANN401
+        """
+        Call registered hooks.
+
+        Args:
+            event: Event name.
+            args: Hook arguments.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        for hook in self._hooks.get(event, ()):
+            hook(*args)
+
+    def _emit_hit(self, name: str) -> None:
+        """
+        Call `on_hit` hooks.
+
+        Args:
+            name: Plugin name.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        for hook in self._on_hit:
+            hook(name)
+
+    def stats(self) -> LoaderStats:
+        """
+        Get loader counters.
+
+        Returns:
+            Counters snapshot.
+        """
+        return LoaderStats(
+            hits=self._hits + self._hit_cells.sum(),
+            misses=self._misses,
+            imports=self._imports,
+            import_errors=self._import_errors,
+            import_time=self._import_time,
+            scans=self._scans,
+            scan_time=self._scan_time,
+            evictions=self._evictions,
+            unloads=self._unloads,
+        )
+
+    def _is_failed(self, name: str) -> bool:
+        """
+        Check if plugin has recently failed to load.
+
+        Args:
+            name: Plugin name.
+
+        Returns:
+            True, if the failure is cached and must not be retried yet.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        failure = self._failures.get(name)
+        if failure is None:
+            return False
+        if self._failure_ttl is None:
+            return True
+        return time.monotonic() - failure.timestamp < self._failure_ttl
+
+    def _set_failed(self, name: str, error: Exception | None) -> None:
+        """
+        Record plugin load failure.
+
+        Args:
+            name: Plugin name.
+            error: Exception raised on import, if any. None when module
+                contains no valid plugin item.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        prev = self._failures.get(name)
+        self._failures[name] = PluginFailure(
+            name=name,
+            error=error,
+            timestamp=time.monotonic(),
+            attempts=prev.attempts + 1 if prev else 1,
+            traceback=error.__traceback__ if error else None,
+        )
+
+    def _raise_failure(self, name: str) -> None:
+        """
+        Re-raise the recorded load failure.
+
+        Only the exceptions other than `ImportError` are re-raised,
+        with the traceback of the original import.
+
+        Args:
+            name: Plugin name.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        failure = self._failures.get(name)
+        if failure is None:
+            return
+        error = failure.error
+        if error is not None and not isinstance(error, ImportError):
+            raise error.with_traceback(failure.traceback)
+
+    def failures(self) -> dict[str, PluginFailure]:
+        """
+        Get plugin load failures.
+
+        Returns:
+            Mapping of plugin name to the last load failure.
+        """
+        return dict(self._failures)
+
+    def rejections(self, name: str) -> dict[str, str]:
+        """
+        Explain why the module members were not selected as plugin.
+
+        Candidates are checked in the same order as on the plugin
+        loading, stopping at the selected item.
+
+        Args:
+            name: Plugin name.
+
+        Returns:
+            Mapping of the candidate's full name (`module.attribute`)
+            to the rejection reason. Empty, if the first candidate
+            is selected.
+
+        Raises:
+            KeyError: If plugin module cannot be imported.
+        """
+        validator = self._get_validator()
+        found = False
+        r: dict[str, str] = {}
+        for b in self._bases:
+            mod_name = f"{b}.{name}"
+            try:
+                module = __import__(mod_name, {}, {}, "*")
+            except ImportError:
+                continue
+            found = True
+            for attr, member in self._iter_candidates(module):
+                reason = validator.explain(member)
+                if reason is None:
+                    return r
+                r[f"{mod_name}.{attr}"] = reason
+        if not found:
+            raise KeyError(name)
+        return r
+
+    def clear_failures(self, name: str | None = None) -> None:
+        """
+        Forget plugin load failures.
+
+        The next request will retry the import.
+
+        Args:
+            name: Plugin name. Clear all failures, if not set.
+        """
+        if name is None:
+            self._failures = {}
+        else:
+            self._failures.pop(name, None)
+
+    def _get_name_lock(self, name: str) -> _NameLock:
+        """
+        Get import lock for plugin name.
+
+        Args:
+            name: Plugin name.
+
+        Returns:
+            Lock, shared by all threads importing the plugin.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        lock = self._name_locks.get(name)
+        if lock is None:
+            with self._lock:
+                lock = self._name_locks.get(name)
+                if lock is None:
+                    lock = _NameLock()
+                    self._name_locks[name] = lock
+        return lock
+
+    def _acquire_name_lock(self, lock: _NameLock) -> bool:
+        """
+        Acquire import lock for plugin name.
+
+        The wait is refused if the lock is held by the current
+        thread, or by the thread waiting for the current thread's
+        lock, directly or through the other threads.
+
+        Args:
+            lock: Lock, returned by `_get_name_lock`.
+
+        Returns:
+            True, if the lock is acquired. False, if the wait
+            would deadlock.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        tid = get_ident()
+        with self._lock:
+            owner = lock.owner
+            seen: set[int] = set()
+            while owner is not None and owner not in seen:
+                if owner == tid:
+                    return False
+                seen.add(owner)
+                blocking = self._blocking_on.get(owner)
+                owner = blocking.owner if blocking else None
+            self._blocking_on[tid] = lock
+        acquired = False
+        try:
+            acquired = lock.lock.acquire()
+        finally:
+            with self._lock:
+                del self._blocking_on[tid]
+                if acquired:
+                    lock.owner = tid
+        return True
+
+    def _release_name_lock(self, name: str, lock: _NameLock) -> None:
+        """
+        Release and remove import lock for plugin name.
+
+        The lock is removed only if it is not replaced yet,
+        so the lock of the concurrent import is kept.
+
+        Args:
+            name: Plugin name.
+            lock: Lock, returned by `_get_name_lock`.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        with self._lock:
+            lock.owner = None
+            if self._name_locks.get(name) is lock:
+                del self._name_locks[name]
+        lock.lock.release()
+
+    def _find_item(self, name: str) -> T | None:
+        """
+        Get plugin item from module `name`.
+
+        Args:
+            name: Module name.
+
+        Returns:
+            Item found or None
+
+        Raises:
+            ImportError: If module cannot be imported.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        module = __import__(name, {}, {}, "*")
+        return self._select_item(module)
+
+    def _select_item(self, module: ModuleType) -> T | None:
+        """
+        Select plugin item from module.
+
+        Returns the first valid candidate, see `_iter_candidates`.
+
+        Args:
+            module: Imported plugin module.
+
+        Returns:
+            Item found or None
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        is_valid = self._get_validator()
+        for _, member in self._iter_candidates(module):
+            if is_valid(member):
+                return cast(T, member)
+        return None
+
+    @staticmethod
+    def _iter_candidates(module: ModuleType) -> Iterator[tuple[str, Any]]:
+        """
+        Iterate over plugin item candidates.
+
+        The candidates are yielded in the following order:
+
+        * Explicit `__plugin__` module attribute. Exclusive,
+          when set, other members are not yielded.
+        * Members listed in `__all__`.
+        * Module members in order of definition.
+
+        Only the members originated from the module itself
+        are yielded, except for the explicit `__plugin__`.
+
+        Args:
+            module: Imported plugin module.
+
+        Returns:
+            Yields tuples of (`attribute name`, `member`).
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        ns = vars(module)
+        # Explicit declaration
+        if PLUGIN_ATTR in ns:
+            yield PLUGIN_ATTR, ns[PLUGIN_ATTR]
+            return
+        mod_name = module.__name__
+        # Public members
+        exported = ns.get("__all__") or ()
+        for attr in exported:
+            member = ns.get(attr)
+            if getattr(member, "__module__", None) == mod_name:
+                yield attr, member
+        # All members, except already yielded
+        seen = set(exported)
+        for attr, member in list(ns.items()):
+            # Fast skip of imported modules and plain values
+            if type(member) in SKIP_TYPES or attr in seen:
+                continue
+            # Check member is originated from same module
+            if getattr(member, "__module__", None) == mod_name:
+                yield attr, member
+
+    def reload(self, name: str) -> T | None:
+        """
+        Reimport plugin module and replace the cached item.
+
+        The cached item is replaced atomically after the module
+        is successfully reimported, so concurrent lookups get either
+        the old or the new item. The old item is kept if
+        the reimport fails.
+
+        Args:
+            name: Plugin name.
+
+        Returns:
+            New item or None, if reload is failed. Reload
+            is failed if requested during the plugin's own import.
+
+        Raises:
+            Exception: Exception other than `ImportError`,
+                raised by the plugin module. The failure is recorded.
+        """
+        if name in self._exclude:
+            msg = "Trying to import excluded name"
+            raise RuntimeError(msg)
+        lock = self._get_name_lock(name)
+        if not self._acquire_name_lock(lock):
+            return None
+        try:
+            return self._reload_item(name)
+        finally:
+            self._release_name_lock(name, lock)
+
+    def _reload_item(self, name: str) -> T | None:
+        """
+        Reimport plugin module and replace the cached item.
+
+        Must be called with plugin's name lock held.
+
+        Args:
+            name: Plugin name.
+
+        Returns:
+            New item or None, if reload is failed.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        error: Exception | None = None
+        for b in self._get_names().routes.get(name, ()):
+            mod_name = f"{b}.{name}"
+            module = sys.modules.get(mod_name)
+            try:
+                if module is None:
+                    module = importlib.import_module(mod_name)
+                else:
+                    module = importlib.reload(module)
+            except ImportError as e:
+                error = e
+                continue
+            except Exception as e:
+                self._set_failed(name, e)
+                raise
+            kls = self._select_item(module)
+            if kls is not None:
+                self._set_item(name, kls)
+                return kls
+        self._set_failed(name, error)
+        return None
+
+    def forget(self, name: str) -> None:
+        """
+        Drop the cached item and the failure for plugin.
+
+        The next request will import the plugin.
+
+        Args:
+            name: Plugin name.
+        """
+        with self._lock:
+            self._classes.pop(name, None)
+            self._failures.pop(name, None)
+            self._lru.pop(name, None)
+            self._owned.pop(name, None)
+
+    def watch(self, interval: float = 1.0) -> PluginWatcher:
+        """
+        Start watching plugin directories for changes.
+
+        Changed plugins are reloaded in the background thread.
+
+        Args:
+            interval: Polling interval in seconds.
+
+        Returns:
+            Started watcher. Call `stop()` to stop watching.
+        """
+        watcher = PluginWatcher(self, interval=interval)
+        watcher.start()
+        return watcher
+
+    def _scan_entries(self) -> dict[str, tuple[str, IndexEntry]]:
+        """
+        Scan plugin directories bypassing the index.
+
+        Returns:
+            Mapping of plugin name to (`base`, `entry`) of the module
+            taking precedence.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        r: dict[str, tuple[str, IndexEntry]] = {}
+        for base, path in self._base_paths:
+            for entry in scan_dir(path).modules:
+                if entry.name not in r and entry.name not in self._exclude:
+                    r[entry.name] = (base, entry)
+        return r
+
+    def _get_static_target(self) -> tuple[ItemKind, str | None]:
+        """
+        Get expected item kind and type name for static discovery.
+
+        Returns:
+            Tuple of (`kind`, `type name`). Type name is None
+            for protocols, which cannot be checked by name.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        item_type = self._get_item_type()
+        if self._is_type(item_type):
+            kind: ItemKind = "class"
+            t = get_args(item_type)[0]
+        else:
+            kind, t = "instance", item_type
+        if getattr(t, "_is_protocol", False):
+            return kind, None
+        return kind, getattr(t, "__name__", None)
+
+    def _get_sources(
+        self, paths: Iterable[str]
+    ) -> dict[str, ModuleSource | None]:
+        """
+        Get parsed plugin sources.
+
+        Sources are kept in the persistent index, when configured.
+
+        Args:
+            paths: Iterable of module file paths.
+
+        Returns:
+            Mapping of path to parsed source.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        if self._index is None:
+            return self._sources.get_sources(paths)
+        return self._index.get_sources(paths)
+
+    def _make_info(
+        self, name: str, base: str, file: str, src: ModuleSource | None
+    ) -> PluginInfo:
+        """
+        Build plugin information from the parsed source.
+
+        Args:
+            name: Plugin name.
+            base: Plugin package name.
+            file: Path to the plugin module file.
+            src: Parsed source. None, if module is not the Python source.
+
+        Returns:
+            Plugin information.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        if src is None:
+            # Cannot be checked without import
+            return PluginInfo(
+                name=name, base=base, file=file, item=None, kind=None
+            )
+        kind, target = self._get_static_target()
+        item, item_kind, bases, valid = select_candidate(src, kind, target)
+        return PluginInfo(
+            name=name,
+            base=base,
+            file=file,
+            item=item,
+            kind=item_kind,
+            bases=bases,
+            meta=src.meta,
+            handles=src.handles,
+            requires=src.requires,
+            valid=False if src.error else valid,
+            error=src.error,
+        )
+
+    def _describe_names(self, names: Iterable[str]) -> Iterator[PluginInfo]:
+        """
+        Statically examine plugins.
+
+        The first module which may contain the valid plugin
+        is selected, in order of bases precedence.
+
+        Args:
+            names: Iterable of plugin names.
+
+        Returns:
+            Iterator of plugin information. Plugins
+            which are not found are skipped.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        paths = dict(self._base_paths)
+        routes = self._get_names().routes
+        found: list[tuple[str, list[tuple[str, str]]]] = []
+        for name in names:
+            if name in self._exclude:
+                continue
+            files: list[tuple[str, str]] = []
+            for base in routes.get(name, ()):
+                spec = PathFinder.find_spec(name, [paths[base]])
+                if spec is not None and spec.origin and spec.has_location:
+                    files.append((base, spec.origin))
+            if files:
+                found.append((name, files))
+        sources = self._get_sources(f for _, x in found for _, f in x)
+        for name, files in found:
+            infos = [
+                self._make_info(name, base, file, sources[file])
+                for base, file in files
+            ]
+            yield next((i for i in infos if i.valid is not False), infos[0])
+
+    def describe(self, name: str) -> PluginInfo | None:
+        """
+        Get plugin information without importing the plugin.
+
+        Plugin source is parsed and the plugin item candidate
+        is selected following the same rules as on import.
+        Parsed sources are cached and reparsed only when
+        the module file is changed.
+
+        Args:
+            name: Plugin name.
+
+        Returns:
+            Plugin information or None, if plugin is not found.
+        """
+        return next(self._describe_names([name]), None)
+
+    def describe_all(self) -> Iterable[PluginInfo]:
+        """
+        Iterate over all plugins information without importing.
+
+        Returns:
+            Iterable of plugin information, ordered by name.
+        """
+        yield from self._describe_names(self._get_names().names)
+
+    def _get_meta(self) -> _MetaIndex:
+        """
+        Get actual metadata index, build if necessary.
+
+        Returns:
+            Metadata index.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        meta = self._meta
+        if meta is None:
+            with self._lock:
+                meta = self._meta
+                if meta is None:
+                    meta = self._build_meta()
+                    self._meta = meta
+        return meta
+
+    def _build_meta(self) -> _MetaIndex:
+        """
+        Build metadata index from the static plugin information.
+
+        Plugins without valid candidates are not indexed.
+        Collection values are indexed by the each item as well.
+
+        Returns:
+            Metadata index.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        meta: dict[str, Mapping[str, Any]] = {}
+        values: dict[tuple[str, Any], set[str]] = {}
+        for info in self.describe_all():
+            if info.valid is False:
+                continue
+            meta[info.name] = info.meta
+            for k, v in info.meta.items():
+                items = [v]
+                if isinstance(v, (list, tuple, set, frozenset)):
+                    items += list(v)
+                for x in items:
+                    with contextlib.suppress(TypeError):
+                        values.setdefault((k, x), set()).add(info.name)
+        return _MetaIndex(
+            meta=meta,
+            values={k: frozenset(v) for k, v in values.items()},
+        )
+
+    def find(self, **query: Any) -> list[str]:  # noqa: ANN401
+        """
+        Find plugins by static metadata without importing.
+
+        Plugin matches the query when all the query's values
+        are equal to the plugin's metadata values. Collection
+        metadata values match when containing the query's value.
+
+        Example:
+            ``` py
+            loader.find(vendor="acme", protocols="ssh")
+            ```
+
+        Args:
+            query: Metadata values.
+
+        Returns:
+            Sorted list of matched plugin names.
+
+        Note:
+            Metadata index is built on first call and is kept
+            until `refresh()` or `invalidate()`.
+        """
+        idx = self._get_meta()
+        r: set[str] | None = None
+        for k, v in query.items():
+            try:
+                names = idx.values.get((k, v), frozenset())
+            except TypeError:
+                # Unhashable value
+                names = frozenset(
+                    n for n, m in idx.meta.items() if k in m and m[k] == v
+                )
+            r = set(names) if r is None else r & names
+            if not r:
+                return []
+        return sorted(idx.meta if r is None else r)
+
+    def _get_dispatch(self) -> _DispatchIndex:
+        """
+        Get actual dispatch table, build if necessary.
+
+        Returns:
+            Dispatch table.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        dispatch = self._dispatch
+        if dispatch is None:
+            with self._lock:
+                dispatch = self._dispatch
+                if dispatch is None:
+                    dispatch = self._build_dispatch()
+                    self._dispatch = dispatch
+        return dispatch
+
+    def _build_dispatch(self) -> _DispatchIndex:
+        """
+        Build dispatch table from the static plugin information.
+
+        When several plugins declare the same key, the first one
+        in order of names takes the key.
+
+        Returns:
+            Dispatch table.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        handlers: dict[Any, list[str]] = {}
+        for info in self.describe_all():
+            if info.valid is False:
+                continue
+            for key in info.handles:
+                handlers.setdefault(key, []).append(info.name)
+        return _DispatchIndex(
+            keys={k: v[0] for k, v in handlers.items()},
+            conflicts={k: tuple(v) for k, v in handlers.items() if len(v) > 1},
+        )
+
+    def for_key(self, key: Hashable) -> T | None:
+        """
+        Get plugin handling the key.
+
+        Plugins declare the handled keys with the literal
+        `__plugin_handles__` collection. Only the selected
+        plugin is imported.
+
+        Example:
+            ``` py
+            __plugin_handles__ = ["Cisco.IOS", "Cisco.IOSXE"]
+            ```
+
+        Args:
+            key: Key.
+
+        Returns:
+            Plugin item or None, if key is not handled or the plugin
+            cannot be loaded.
+
+        Raises:
+            RuntimeError: If the key is declared by several plugins
+                and `on_key_conflict` is set to `raise`.
+
+        Note:
+            Dispatch table is built on first call and is kept
+            until `refresh()` or `invalidate()`.
+        """
+        dispatch = self._get_dispatch()
+        if self._on_key_conflict == "raise":
+            names = dispatch.conflicts.get(key)
+            if names:
+                msg = f"Conflicting plugin key {key!r}: {', '.join(names)}"
+                raise RuntimeError(msg)
+        name = dispatch.keys.get(key)
+        if name is None:
+            return None
+        return self.get(name)
+
+    def key_conflicts(self) -> dict[Any, tuple[str, ...]]:
+        """
+        Get keys declared by several plugins.
+
+        Returns:
+            Mapping of key to the names of plugins declaring it,
+            in order of names. The first plugin handles the key.
+        """
+        return dict(self._get_dispatch().conflicts)
+
+    def keys(
+        self,
+        prefix: str | None = None,
+        pattern: str | None = None,
+        sort: bool = True,
+    ) -> Iterable[str]:
+        """
+        Iterate over plugin name.
+
+        Iterable yielding all existing plugin names.
+
+        Args:
+            prefix: Yield only names starting with prefix.
+            pattern: Yield only names matching the shell-style
+                pattern, i.e. `huawei_*`.
+            sort: Yield names in sorted order. When not set
+                and names are not cached yet, names are streamed
+                directly from the plugin directories in order of
+                discovery, without building the name index.
+
+        Returns:
+            Iterable of strings with all plugin names.
+
+        Note:
+            `keys()` do not force plugin module loading and instantiation.
+            Names are cached, use `refresh()` or `invalidate()`
+            to catch up with plugin directories changes.
+            Prefix and pattern lookups over the cached names
+            use binary search by the pattern's literal prefix.
+        """
+        if not sort and self._names is None:
+            names: tuple[str, ...] | Iterator[str] = self._iter_names()
+        else:
+            names = self._get_names().names
+        yield from filter_names(names, prefix, pattern)
+
+    def _iter_names(self) -> Iterator[str]:
+        """
+        Stream plugin names from plugin directories.
+
+        Returns:
+            Iterator of unique not excluded names,
+            in order of discovery.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        seen: set[str] = set()
+        for _, name in self._iter_module_names():
+            if name not in seen and name not in self._exclude:
+                seen.add(name)
+                yield name
+
+    def __contains__(self, name: object) -> bool:
+        """
+        Check if plugin exists.
+
+        Args:
+            name: Name of plugin.
+
+        Returns:
+            True, if plugin exists and is not excluded.
+
+        Note:
+            Do not force plugin module loading.
+        """
+        return name in self._get_names().name_set
+
+    def __len__(self) -> int:
+        """
+        Get number of plugins.
+
+        Returns:
+            Number of existing and not excluded plugins.
+
+        Note:
+            Do not force plugin module loading.
+        """
+        return len(self._get_names().names)
+
+    def refresh(self) -> None:
+        """
+        Rescan plugin directories and rebuild the name index.
+
+        Already loaded plugins are kept intact,
+        plugin load failures are forgotten.
+        """
+        self._names = self._build_names()
+        self._probe_misses = set()
+        self._meta = None
+        self._dispatch = None
+        self._failures = {}
+
+    def invalidate(self) -> None:
+        """
+        Drop the name index.
+
+        Index will be rebuilt on next access,
+        plugin load failures are forgotten.
+        """
+        self._names = None
+        self._probe_misses = set()
+        self._meta = None
+        self._dispatch = None
+        self._failures = {}
+
+    def _get_names(self) -> _NameIndex:
+        """
+        Get actual name index, build if necessary.
+
+        Returns:
+            Name index.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        names = self._names
+        if names is None:
+            with self._lock:
+                names = self._names
+                if names is None:
+                    names = self._build_names()
+                    self._names = names
+        return names
+
+    def _build_names(self) -> _NameIndex:
+        """
+        Scan plugin directories and build the name index.
+
+        Returns:
+            Name index.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        t0 = time.perf_counter()
+        routes: dict[str, list[str]] = {}
+        for base, name in self._iter_module_names():
+            if name in self._exclude:
+                continue
+            r = routes.get(name)
+            if r is None:
+                routes[name] = [base]
+            elif base not in r:
+                r.append(base)
+        duration = time.perf_counter() - t0
+        self._scans += 1
+        self._scan_time += duration
+        self._emit("on_scan", duration, len(routes))
+        return _NameIndex(
+            names=tuple(sorted(routes)),
+            name_set=frozenset(routes),
+            routes={name: tuple(r) for name, r in routes.items()},
+        )
+
+    def _iter_module_names(self) -> Iterable[tuple[str, str]]:
+        """
+        Iterate over module names in all plugin paths.
+
+        Names are served from the persistent index, when configured.
+        Names may be repeated when defined in several paths.
+
+        Returns:
+            Iterable of (`base`, `module name`) tuples,
+            in order of bases precedence.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        if self._index is None:
+            for base, path in self._base_paths:
+                for mi in iter_modules([path]):
+                    yield base, mi.name
+        else:
+            dirs = self._index.get_dirs(self._paths)
+            for base, path in self._base_paths:
+                for entry in dirs[path].modules:
+                    yield base, entry.name
+
+    def values(self) -> Iterable[T]:
+        """
+        Iterate all found plugin items.
+
+        Returns:
+            Iterable of plugin items.
+
+        Note:
+            `values()` will force plugin module loading and instantiation.
+        """
+        for name in self:
+            item = self.get(name)
+            if item is not None:
+                yield item
+
+    def items(self) -> Iterable[tuple[str, T]]:
+        """
+        Iterate the (`name`, `item`) tuples for all plugin items.
+
+        Return:
+            Iterable of tuples of (`name`, `item`)
+
+        Note:
+            `items()` will force plugin module loading and instantiation.
+        """
+        for name in self:
+            item = self.get(name)
+            if item is not None:
+                yield name, item
+
+    def preload(
+        self,
+        names: Iterable[str] | None = None,
+        max_workers: int | None = None,
+        deps: bool = False,
+    ) -> PreloadReport:
+        """
+        Load plugins in parallel.
+
+        Import and cache plugins using the thread pool.
+
+        Args:
+            names: Iterable of plugin names to load. Load all plugins
+                if not set.
+            max_workers: Maximal number of loading threads.
+                Use `ThreadPoolExecutor` defaults, if not set.
+            deps: Respect the plugin dependencies, declared by the
+                `__plugin_requires__` module attribute. The required
+                plugins are loaded as well, each plugin is loaded
+                after all its dependencies.
+
+        Returns:
+            Preloading report with per-plugin timings.
+
+        Raises:
+            RuntimeError: On dependency cycle, when `deps` is set.
+                Nothing is loaded in that case.
+        """
+        to_load = list(self.keys() if names is None else names)
+        if deps:
+            return self._preload_deps(to_load, max_workers)
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="loader"
+        ) as executor:
+            plugins = tuple(executor.map(self._timed_load, to_load))
+        return PreloadReport(
+            plugins=plugins, duration=time.perf_counter() - t0
+        )
+
+    def _preload_deps(
+        self, names: list[str], max_workers: int | None
+    ) -> PreloadReport:
+        """
+        Load plugins in parallel, in order of dependencies.
+
+        Each plugin is submitted to the thread pool as soon
+        as all its dependencies are loaded, so the independent
+        chains are not waiting for each other. Failed dependencies
+        do not prevent the loading of dependent plugins.
+
+        Args:
+            names: List of plugin names to load.
+            max_workers: Maximal number of loading threads.
+
+        Returns:
+            Preloading report with per-plugin timings and
+            the critical path.
+
+        Raises:
+            RuntimeError: On dependency cycle.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        graph = self._get_requires(names)
+        topo_levels(graph)  # Raises RuntimeError on cycles
+        dependents = get_dependents(graph)
+        pending = {name: len(deps) for name, deps in graph.items()}
+        results: dict[str, PluginTiming] = {}
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="loader"
+        ) as executor:
+            running = {
+                executor.submit(self._timed_load, name): name
+                for name, n in sorted(pending.items())
+                if not n
+            }
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    results[name] = future.result()
+                    for d in dependents[name]:
+                        pending[d] -= 1
+                        if not pending[d]:
+                            running[executor.submit(self._timed_load, d)] = d
+        duration = time.perf_counter() - t0
+        path, path_duration = critical_path(
+            graph, {name: r.duration for name, r in results.items()}
+        )
+        # Requested plugins first, then the dependencies
+        order = dict.fromkeys(names)
+        order.update(dict.fromkeys(sorted(graph)))
+        return PreloadReport(
+            plugins=tuple(results[name] for name in order),
+            duration=duration,
+            critical_path=path,
+            critical_path_duration=path_duration,
+        )
+
+    def _get_requires(
+        self, names: Iterable[str]
+    ) -> dict[str, tuple[str, ...]]:
+        """
+        Build dependency graph of plugins.
+
+        Dependencies are collected statically, without import.
+        All the required plugins are included, recursively.
+        Required names which are not the loader's plugins
+        are ignored.
+
+        Args:
+            names: Iterable of plugin names.
+
+        Returns:
+            Mapping of plugin name to the names of the required plugins.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        name_set = self._get_names().name_set
+        graph: dict[str, tuple[str, ...]] = {}
+        todo = list(names)
+        while todo:
+            batch = [name for name in dict.fromkeys(todo) if name not in graph]
+            infos = {info.name: info for info in self._describe_names(batch)}
+            todo = []
+            for name in batch:
+                info = infos.get(name)
+                requires = (
+                    tuple(r for r in info.requires if r in name_set)
+                    if info
+                    else ()
+                )
+                graph[name] = requires
+                todo += requires
+        return graph
+
+    def load_order(
+        self, names: Iterable[str] | None = None
+    ) -> list[tuple[str, ...]]:
+        """
+        Get plugins grouped in order of dependencies.
+
+        Dependencies are declared by the literal `__plugin_requires__`
+        module attribute and collected without import. Each group
+        contains the plugins requiring only the plugins from
+        the previous groups, so the plugins within the group
+        may be loaded in parallel.
+
+        Example:
+            ``` py
+            __plugin_requires__ = ["base_cli", "snmp"]
+            ```
+
+        Args:
+            names: Iterable of plugin names. All the required plugins
+                are included as well. Use all plugins, if not set.
+
+        Returns:
+            List of groups of plugin names, each group is sorted.
+
+        Raises:
+            RuntimeError: On dependency cycle.
+        """
+        return topo_levels(
+            self._get_requires(self.keys() if names is None else names)
+        )
+
+    def lazy(self, name: str) -> T:
+        """
+        Get proxy loading the plugin on the first use.
+
+        Nothing is imported until the first attribute access
+        or call of the proxy, so plugins may be wired into
+        the application's structures at no cost. The loaded item
+        is kept in the proxy, and the following accesses
+        are forwarded to it directly.
+
+        Args:
+            name: Plugin name.
+
+        Returns:
+            `LazyPlugin` proxy, typed as plugin item.
+            The missed plugin raises `KeyError` on the first use.
+        """
+        return cast(T, LazyPlugin(self, name))
+
+    def freeze(
+        self,
+        names: Iterable[str] | None = None,
+        max_workers: int | None = None,
+    ) -> FrozenLoader[T]:
+        """
+        Load plugins and get the immutable snapshot.
+
+        Plugins are loaded in parallel like with `preload()`.
+        The snapshot contains only the successfully loaded plugins,
+        never imports anything and serves lookups without locks.
+        The loader remains usable.
+
+        Args:
+            names: Iterable of plugin names to load. Load all plugins
+                if not set.
+            max_workers: Maximal number of loading threads.
+                Use `ThreadPoolExecutor` defaults, if not set.
+
+        Returns:
+            Frozen plugin set.
+        """
+        report = self.preload(names, max_workers=max_workers)
+        items: dict[str, T] = {}
+        for name in report.loaded:
+            # May be evicted from the bounded cache
+            item = self._classes.get(name)
+            if item is None:
+                item = self.get(name)
+            if item is not None:
+                items[name] = item
+        return FrozenLoader(items)
+
+    def prefork(
+        self,
+        names: Iterable[str] | None = None,
+        max_workers: int | None = None,
+        gc_freeze: bool = True,
+    ) -> PreforkReport:
+        """
+        Prepare loader for the pre-fork worker pools.
+
+        Call in the parent process before forking the workers.
+        Loads all plugins (or the given subset) and registers
+        the locks reset in the forked children, so the workers
+        start with the warm cache and share the plugin modules'
+        memory with the parent.
+
+        Args:
+            names: Iterable of plugin names to load. Load all plugins
+                if not set.
+            max_workers: Maximal number of loading threads.
+                Use `ThreadPoolExecutor` defaults, if not set.
+            gc_freeze: Move all objects to the garbage collector's
+                permanent generation with `gc.freeze()`, so
+                the collections in the workers do not dirty
+                the shared memory pages.
+
+        Returns:
+            Preparation report.
+        """
+        t0 = time.perf_counter()
+        n_modules = len(sys.modules)
+        report = self.preload(names, max_workers=max_workers)
+        register_fork_handler(self)
+        return PreforkReport(
+            loaded=tuple(report.loaded),
+            failed=tuple(report.failed),
+            modules=len(sys.modules) - n_modules,
+            frozen=freeze_gc() if gc_freeze else 0,
+            duration=time.perf_counter() - t0,
+        )
+
+    def _iter_sources(self) -> Iterator[tuple[str, str]]:
+        """
+        Iterate over Python sources in all plugin paths.
+
+        Plugin packages are walked recursively, excluded plugins
+        are skipped.
+
+        Returns:
+            Iterator of (`module name`, `path`) tuples,
+            in order of bases precedence.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        for base, path in self._base_paths:
+            for root, dirs, files in os.walk(path):
+                rel = os.path.relpath(root, path)
+                parts = [] if rel == os.curdir else rel.split(os.sep)
+                if parts and parts[0] in self._exclude:
+                    dirs[:] = []
+                    continue
+                dirs[:] = sorted(
+                    d
+                    for d in dirs
+                    if d != "__pycache__" and not d.startswith(".")
+                )
+                for fn in sorted(files):
+                    stem, ext = os.path.splitext(fn)
+                    if ext != ".py" or (not parts and stem in self._exclude):
+                        continue
+                    mod = parts if stem == "__init__" else [*parts, stem]
+                    yield ".".join([base, *mod]), os.path.join(root, fn)
+
+    def verify_bytecode(
+        self, prefix: str | None = None, optimize: int | None = None
+    ) -> BytecodeReport:
+        """
+        Check the cached bytecode of plugin modules.
+
+        All Python sources in the plugin packages are checked
+        and compiled in memory to measure the compilation time,
+        which is paid on every cold import if the bytecode
+        is not fresh. Nothing is imported or written.
+
+        Args:
+            prefix: Root of the separate bytecode cache tree, like
+                `sys.pycache_prefix`. Use `sys.pycache_prefix`, if not set.
+            optimize: Optimization level. Use current interpreter's
+                level, if not set.
+
+        Returns:
+            Bytecode report.
+        """
+        t0 = time.perf_counter()
+        r: list[ModuleBytecode] = []
+        for name, source in self._iter_sources():
+            cache = get_cache_path(source, prefix=prefix, optimize=optimize)
+            status = check_bytecode(source, cache)
+            duration, error = measure_compile(source)
+            r.append(
+                ModuleBytecode(
+                    name=name,
+                    source=source,
+                    cache=cache,
+                    status="error" if error else status,
+                    compile_time=duration,
+                    error=error,
+                )
+            )
+        return BytecodeReport(
+            modules=tuple(r), duration=time.perf_counter() - t0
+        )
+
+    def precompile(
+        self,
+        prefix: str | None = None,
+        optimize: int | None = None,
+        invalidation_mode: PycInvalidationMode | None = None,
+        force: bool = False,
+    ) -> BytecodeReport:
+        """
+        Compile plugin modules ahead of time.
+
+        All Python sources in the plugin packages are compiled
+        and the bytecode files are written, so the following
+        cold imports only unmarshal the bytecode. Run on build
+        stage for deployments with read-only file systems.
+
+        Args:
+            prefix: Root of the separate bytecode cache tree, like
+                `sys.pycache_prefix`. Use `sys.pycache_prefix`, if not set.
+                Processes importing the plugins must be started
+                with the same `PYTHONPYCACHEPREFIX`.
+            optimize: Optimization level. Use current interpreter's
+                level, if not set.
+            invalidation_mode: Bytecode invalidation mode. Use
+                `py_compile` defaults, if not set.
+            force: Recompile the modules with fresh bytecode as well.
+
+        Returns:
+            Bytecode report.
+        """
+        t0 = time.perf_counter()
+        r: list[ModuleBytecode] = []
+        for name, source in self._iter_sources():
+            cache = get_cache_path(source, prefix=prefix, optimize=optimize)
+            if not force and check_bytecode(source, cache) == "fresh":
+                r.append(
+                    ModuleBytecode(
+                        name=name,
+                        source=source,
+                        cache=cache,
+                        status="fresh",
+                        compile_time=0.0,
+                    )
+                )
+                continue
+            duration, error = compile_bytecode(
+                source,
+                cache,
+                optimize=optimize,
+                invalidation_mode=invalidation_mode,
+            )
+            r.append(
+                ModuleBytecode(
+                    name=name,
+                    source=source,
+                    cache=cache,
+                    status="error" if error else "compiled",
+                    compile_time=duration,
+                    error=error,
+                )
+            )
+        return BytecodeReport(
+            modules=tuple(r), duration=time.perf_counter() - t0
+        )
+
+    def _after_fork(self) -> None:
+        """
+        Reset locks in the forked child.
+
+        Locks may be held by the parent's threads at the time of fork
+        and would never be released in the child.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        self._lock = RLock()
+        self._name_locks = {}
+        self._blocking_on = {}
+        self._pending = {}
+        self._sources._after_fork()
+        self._hit_cells._after_fork()
+        if self._index is not None:
+            self._index._after_fork()
+
+    async def apreload(
+        self,
+        names: Iterable[str] | None = None,
+        max_workers: int | None = None,
+    ) -> PreloadReport:
+        """
+        Load plugins in parallel without blocking the event loop.
+
+        Asynchronous version of `preload()`.
+
+        Args:
+            names: Iterable of plugin names to load. Load all plugins
+                if not set.
+            max_workers: Maximal number of loading threads.
+                Use `ThreadPoolExecutor` defaults, if not set.
+
+        Returns:
+            Preloading report with per-plugin timings.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.preload, names, max_workers
+        )
+
+    def _timed_load(self, name: str) -> PluginTiming:
+        """
+        Load plugin and measure time.
+
+        Args:
+            name: Plugin name.
+
+        Returns:
+            Loading result.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        t0 = time.perf_counter()
+        try:
+            item = self.get(name)
+        except Exception as e:  # noqa: BLE001
+            return PluginTiming(
+                name=name,
+                duration=time.perf_counter() - t0,
+                loaded=False,
+                error=e,
+            )
+        return PluginTiming(
+            name=name,
+            duration=time.perf_counter() - t0,
+            loaded=item is not None,
+        )
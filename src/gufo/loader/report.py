@@ -0,0 +1,244 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Loading reports
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+"""Loading reports."""
+
+# Python modules
+from dataclasses import dataclass, field
+from types import TracebackType
+
+# Gufo Loader modules
+from .bytecode import BytecodeStatus
+
+
+@dataclass(frozen=True)
+class PluginTiming:
+    """
+    Plugin loading result.
+
+    Attributes:
+        name: Plugin name.
+        duration: Loading time, in seconds.
+        loaded: True, if plugin is loaded successfully.
+        error: Exception raised during the loading, if any.
+    """
+
+    name: str
+    duration: float
+    loaded: bool
+    error: Exception | None = None
+
+
+@dataclass(frozen=True)
+class PluginFailure:
+    """
+    Plugin load failure.
+
+    Attributes:
+        name: Plugin name.
+        error: Exception raised on import, if any. None, when plugin
+            module contains no valid plugin item.
+        timestamp: Time of the last attempt, `time.monotonic()` value.
+        attempts: Number of failed attempts.
+        traceback: Traceback of the error, as raised on import.
+    """
+
+    name: str
+    error: Exception | None
+    timestamp: float
+    attempts: int
+    traceback: TracebackType | None = field(
+        default=None, repr=False, compare=False
+    )
+
+
+@dataclass(frozen=True)
+class PreloadReport:
+    """
+    Plugins preloading report.
+
+    Attributes:
+        plugins: Loading results, in order of plugin names.
+        duration: Total wall time, in seconds.
+        critical_path: The longest chain of plugin dependencies
+            by loading time, from the first loaded plugin.
+            Empty, unless loaded with dependencies.
+        critical_path_duration: Total loading time of
+            the critical path plugins, in seconds.
+    """
+
+    plugins: tuple[PluginTiming, ...]
+    duration: float
+    critical_path: tuple[str, ...] = ()
+    critical_path_duration: float = 0.0
+
+    @property
+    def loaded(self) -> list[str]:
+        """
+        Names of successfully loaded plugins.
+
+        Returns:
+            List of plugin names.
+        """
+        return [p.name for p in self.plugins if p.loaded]
+
+    @property
+    def failed(self) -> list[str]:
+        """
+        Names of plugins failed to load.
+
+        Returns:
+            List of plugin names.
+        """
+        return [p.name for p in self.plugins if not p.loaded]
+
+    def slowest(self, n: int = 10) -> list[PluginTiming]:
+        """
+        Get the slowest plugins.
+
+        Args:
+            n: Number of plugins to return.
+
+        Returns:
+            List of loading results, slowest first.
+        """
+        return sorted(self.plugins, key=lambda p: p.duration, reverse=True)[:n]
+
+
+@dataclass(frozen=True)
+class LoaderStats:
+    """
+    Loader counters.
+
+    Attributes:
+        hits: Number of lookups served from cache.
+        misses: Number of lookups not served from cache.
+        imports: Number of plugin import attempts.
+        import_errors: Number of failed plugin imports.
+        import_time: Total plugin import time, in seconds.
+        scans: Number of plugin directories scans.
+        scan_time: Total plugin directories scanning time, in seconds.
+        evictions: Number of plugins evicted from the bounded cache.
+        unloads: Number of plugin modules removed from `sys.modules`.
+    """
+
+    hits: int
+    misses: int
+    imports: int
+    import_errors: int
+    import_time: float
+    scans: int
+    scan_time: float
+    evictions: int = 0
+    unloads: int = 0
+
+
+@dataclass(frozen=True)
+class PreforkReport:
+    """
+    Pre-fork preparation report.
+
+    Attributes:
+        loaded: Names of successfully loaded items.
+        failed: Names of items failed to load.
+        modules: Number of modules imported during preparation.
+        frozen: Number of objects in the permanent generation
+            of the garbage collector, 0 if not frozen.
+        duration: Total wall time, in seconds.
+    """
+
+    loaded: tuple[str, ...]
+    failed: tuple[str, ...]
+    modules: int
+    frozen: int
+    duration: float
+
+
+@dataclass(frozen=True)
+class ModuleBytecode:
+    """
+    Plugin module bytecode state.
+
+    Attributes:
+        name: Module name.
+        source: Path to the module source.
+        cache: Path to the cached bytecode file.
+        status: Bytecode file state, one of:
+
+            * `fresh` - bytecode is valid.
+            * `stale` - source has been changed.
+            * `missing` - no bytecode file.
+            * `invalid` - bytecode file is corrupted or is compiled
+              by the other Python version.
+            * `compiled` - bytecode file has been written.
+            * `error` - source cannot be compiled.
+
+        compile_time: Module compilation time, in seconds.
+            The cost paid on every cold import when bytecode
+            is not fresh.
+        error: Compilation error, if any.
+    """
+
+    name: str
+    source: str
+    cache: str
+    status: BytecodeStatus
+    compile_time: float
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class BytecodeReport:
+    """
+    Plugin bytecode verification or compilation report.
+
+    Attributes:
+        modules: Module states, in order of bases and paths.
+        duration: Total wall time, in seconds.
+    """
+
+    modules: tuple[ModuleBytecode, ...]
+    duration: float
+
+    @property
+    def fresh(self) -> list[str]:
+        """
+        Names of modules with usable bytecode.
+
+        Returns:
+            List of module names.
+        """
+        return [
+            m.name for m in self.modules if m.status in ("fresh", "compiled")
+        ]
+
+    @property
+    def outdated(self) -> list[str]:
+        """
+        Names of modules to be compiled on import.
+
+        Returns:
+            List of module names.
+        """
+        return [
+            m.name
+            for m in self.modules
+            if m.status not in ("fresh", "compiled")
+        ]
+
+    @property
+    def compile_time(self) -> float:
+        """
+        Total compilation time of the outdated modules.
+
+        Returns:
+            Compilation time, in seconds.
+        """
+        return sum(
+            m.compile_time
+            for m in self.modules
+            if m.status not in ("fresh", "compiled")
+        )
@@ -8,9 +8,16 @@
 
 # Python modules
 import importlib
+import sys
+import time
+from collections.abc import Iterable
 from threading import Lock
 from typing import Generic, TypeVar
 
+# Gufo Loader modules
+from .fork import freeze_gc, register_fork_handler
+from .report import PreforkReport
+
 T = TypeVar("T")
 
 
@@ -18,6 +25,8 @@ class _Sentinel: ...
 
 
 _sentinel = _Sentinel()
+# Marks the missed cache entry
+_missed = _Sentinel()
 
 
 class ImportPathResolver(Generic[T]):
@@ -45,6 +54,11 @@ class ImportPathResolver(Generic[T]):
     Notes:
         This resolver is idempotent for string inputs.
 
+        Cached paths are resolved without locking. Uncached paths
+        are imported under the per-path locks, so the concurrent
+        requests for the same path share the single import, while
+        the different paths are imported in parallel.
+
         Negative caching is optional and controlled by `cache_negative`.
         When enabled, missing attributes are cached to prevent repeated
         import attempts for unresolved symbols.
@@ -54,6 +68,7 @@ class ImportPathResolver(Generic[T]):
         self._lock = Lock()
         self._cache: dict[str, T | _Sentinel] = {}
         self._cache_negative = cache_negative
+        self._path_locks: dict[str, Lock] = {}  # path -> import lock
 
     def __call__(self, path: str | T) -> T:
         """
@@ -75,36 +90,137 @@ class ImportPathResolver(Generic[T]):
             ImportError:
                 If module cannot be imported or attribute is missing.
         """
-
-        def unwind(v: T | _Sentinel) -> T:
-            """
-            Raise import error if value is sentinel.
-
-            Args:
-                v: Value or sentinel item
-
-            Returns:
-                Value, when not sentinel.
-
-            Raises:
-                ImportError: when value is sentinel.
-            """
-            if isinstance(v, _Sentinel):
-                msg = "not found"
-                raise ImportError(msg)
-            return v
-
         if not isinstance(path, str):
             return path  # as-is
+        # Lock-free fast path
+        item = self._cache.get(path, _missed)
+        if item is not _missed:
+            return self._unwind(item)
         mod_name, _, attr_name = path.rpartition(".")
         if not mod_name:
             msg = f"malformed path: {path}"
             raise ValueError(msg)
+        lock = self._get_path_lock(path)
+        with lock:
+            try:
+                item = self._cache.get(path, _missed)
+                if item is not _missed:
+                    return self._unwind(item)
+                module = importlib.import_module(
+                    mod_name
+                )  # Raises ImportError
+                item = getattr(module, attr_name, _sentinel)
+                if item is not _sentinel or self._cache_negative:
+                    self._cache[path] = item
+                return self._unwind(item)
+            finally:
+                self._drop_path_lock(path, lock)
+
+    @staticmethod
+    def _unwind(v: T | _Sentinel) -> T:
+        """
+        Raise import error if value is sentinel.
+
+        Args:
+            v: Value or sentinel item
+
+        Returns:
+            Value, when not sentinel.
+
+        Raises:
+            ImportError: when value is sentinel.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        if isinstance(v, _Sentinel):
+            msg = "not found"
+            raise ImportError(msg)
+        return v
+
+    def _get_path_lock(self, path: str) -> Lock:
+        """
+        Get import lock for path.
+
+        Args:
+            path: Import path.
+
+        Returns:
+            Lock instance.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        lock = self._path_locks.get(path)
+        if lock is None:
+            with self._lock:
+                lock = self._path_locks.get(path)
+                if lock is None:
+                    lock = Lock()
+                    self._path_locks[path] = lock
+        return lock
+
+    def _drop_path_lock(self, path: str, lock: Lock) -> None:
+        """
+        Remove import lock for path.
+
+        The lock is removed only if it is not replaced yet,
+        so the lock of the concurrent import is kept.
+
+        Args:
+            path: Import path.
+            lock: Lock, returned by `_get_path_lock`.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
         with self._lock:
-            if path in self._cache:
-                return unwind(self._cache[path])
-            module = importlib.import_module(mod_name)  # Raises ImportError
-            item = getattr(module, attr_name, _sentinel)
-            if item is not _sentinel or self._cache_negative:
-                self._cache[path] = item
-            return unwind(item)
+            if self._path_locks.get(path) is lock:
+                del self._path_locks[path]
+
+    def prefork(
+        self, paths: Iterable[str], gc_freeze: bool = True
+    ) -> PreforkReport:
+        """
+        Prepare resolver for the pre-fork worker pools.
+
+        Call in the parent process before forking the workers.
+        Resolves all the paths and registers the locks reset
+        in the forked children.
+
+        Args:
+            paths: Iterable of import paths to resolve.
+            gc_freeze: Move all objects to the garbage collector's
+                permanent generation with `gc.freeze()`.
+
+        Returns:
+            Preparation report.
+        """
+        t0 = time.perf_counter()
+        n_modules = len(sys.modules)
+        loaded: list[str] = []
+        failed: list[str] = []
+        for path in paths:
+            try:
+                self(path)
+                loaded.append(path)
+            except (ImportError, ValueError):
+                failed.append(path)
+        register_fork_handler(self)
+        return PreforkReport(
+            loaded=tuple(loaded),
+            failed=tuple(failed),
+            modules=len(sys.modules) - n_modules,
+            frozen=freeze_gc() if gc_freeze else 0,
+            duration=time.perf_counter() - t0,
+        )
+
+    def _after_fork(self) -> None:
+        """
+        Reset locks in the forked child.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        self._lock = Lock()
+        self._path_locks = {}
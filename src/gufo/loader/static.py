@@ -0,0 +1,501 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Static plugin discovery
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+"""
+Static plugin discovery.
+
+Plugin sources are parsed with `ast` and never executed,
+so the plugin candidates may be examined without importing
+the plugin modules and their dependencies.
+"""
+
+# Python modules
+import ast
+import os
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Literal, NamedTuple
+
+# Module attribute explicitly declaring the plugin item
+PLUGIN_ATTR = "__plugin__"
+# Module attribute declaring the static plugin metadata
+META_ATTR = "__plugin_meta__"
+# Module attribute declaring the keys handled by plugin
+HANDLES_ATTR = "__plugin_handles__"
+# Module attribute declaring the plugin's dependencies
+REQUIRES_ATTR = "__plugin_requires__"
+# Module attributes with special meaning
+SPECIAL_ATTRS = frozenset(
+    {PLUGIN_ATTR, "__all__", META_ATTR, HANDLES_ATTR, REQUIRES_ATTR}
+)
+# Plugin item kinds
+ItemKind = Literal["class", "instance"]
+
+
+class ModuleSource(NamedTuple):
+    """
+    Parsed plugin module source.
+
+    Contains only the plain values, suitable for `marshal`.
+
+    Attributes:
+        plugin: Name bound to the `__plugin__` attribute, if any.
+        exported: Names listed in `__all__`.
+        classes: Mapping of top-level class name to the tuple
+            of its base class names, in order of definition.
+        instances: Mapping of top-level name to the class name
+            of the instance assigned to it, in order of definition.
+        meta: Literal `__plugin_meta__` dictionary.
+        handles: Hashable items of literal `__plugin_handles__`
+            collection.
+        requires: Names of the required plugins, listed
+            in literal `__plugin_requires__` collection.
+        error: Parse error, if any.
+    """
+
+    plugin: str | None = None
+    exported: tuple[str, ...] = ()
+    classes: dict[str, tuple[str, ...]] = {}  # noqa: RUF012
+    instances: dict[str, str] = {}  # noqa: RUF012
+    meta: dict[str, Any] = {}  # noqa: RUF012
+    handles: tuple[Any, ...] = ()
+    requires: tuple[str, ...] = ()
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class PluginInfo:
+    """
+    Statically discovered plugin information.
+
+    Attributes:
+        name: Plugin name.
+        base: Plugin package name.
+        file: Path to the plugin module file.
+        item: Name of the plugin item candidate within the module.
+        kind: Candidate kind: `class` or `instance`.
+        bases: Base class names of the candidate (of its class,
+            for instances), as written in the source.
+        meta: Static plugin metadata, declared
+            by `__plugin_meta__` literal dictionary.
+        handles: Keys handled by plugin, declared
+            by `__plugin_handles__` literal collection.
+        requires: Names of the plugins required by plugin, declared
+            by `__plugin_requires__` literal collection.
+        valid: True, if the candidate is known to match the loader's
+            type. False, if no candidate is found. None, if
+            it cannot be decided without import.
+        error: Source parsing error, if any.
+    """
+
+    name: str
+    base: str
+    file: str
+    item: str | None
+    kind: ItemKind | None
+    bases: tuple[str, ...] = ()
+    meta: Mapping[str, Any] = field(default_factory=dict)
+    handles: tuple[Any, ...] = ()
+    requires: tuple[str, ...] = ()
+    valid: bool | None = None
+    error: str | None = None
+
+
+def _dotted(node: ast.expr) -> str | None:
+    """
+    Convert name or attribute chain to the dotted name.
+
+    Args:
+        node: Expression node.
+
+    Returns:
+        Dotted name or None, if node is not a plain name.
+
+    Note:
+        Internal function. Must not be used directly.
+    """
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        prefix = _dotted(node.value)
+        return f"{prefix}.{node.attr}" if prefix else None
+    if isinstance(node, ast.Subscript):
+        # Generic[...]
+        return _dotted(node.value)
+    return None
+
+
+def _literal(
+    node: ast.expr | None,
+    t: type | tuple[type, ...],
+) -> Any:  # noqa: ANN401
+    """
+    Evaluate literal expression.
+
+    Args:
+        node: Expression node, if any.
+        t: Expected type or tuple of types.
+
+    Returns:
+        Evaluated value or None, if expression is missed, not literal
+        or has the unexpected type.
+
+    Note:
+        Internal function. Must not be used directly.
+    """
+    if node is None:
+        return None
+    try:
+        v = ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
+    return v if isinstance(v, t) else None
+
+
+def parse_source(
+    source: str | bytes, filename: str = "<plugin>"
+) -> ModuleSource:
+    """
+    Parse plugin module source.
+
+    Only the module top-level statements are examined:
+
+    * `class` definitions.
+    * Assignments of the call results, i.e. `x = Plugin()`.
+    * `__plugin__ = name` explicit declaration.
+    * `__all__` literal list or tuple.
+    * `__plugin_meta__` literal dictionary.
+    * `__plugin_handles__` literal list, tuple or set.
+    * `__plugin_requires__` literal list, tuple or set.
+
+    Args:
+        source: Module source.
+        filename: File name for error messages.
+
+    Returns:
+        Parsed source.
+    """
+    try:
+        tree = ast.parse(source, filename=filename)
+    except (SyntaxError, ValueError) as e:
+        return ModuleSource(error=f"{e.__class__.__name__}: {e}")
+    classes: dict[str, tuple[str, ...]] = {}
+    instances: dict[str, str] = {}
+    special: dict[str, ast.expr] = {}
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            classes[node.name] = tuple(
+                b for b in (_dotted(x) for x in node.bases) if b
+            )
+            instances.pop(node.name, None)
+            continue
+        for target, value in _iter_assigns(node):
+            if target in SPECIAL_ATTRS:
+                special[target] = value
+            elif isinstance(value, ast.Call):
+                kls = _dotted(value.func)
+                if kls:
+                    instances[target] = kls
+                    classes.pop(target, None)
+    plugin = special.get(PLUGIN_ATTR)
+    exported = _literal(special.get("__all__"), (list, tuple)) or ()
+    meta = _literal(special.get(META_ATTR), dict) or {}
+    handles = _literal(special.get(HANDLES_ATTR), (list, tuple, set)) or ()
+    requires = _literal(special.get(REQUIRES_ATTR), (list, tuple, set)) or ()
+    return ModuleSource(
+        plugin=None if plugin is None else _dotted(plugin),
+        exported=tuple(x for x in exported if isinstance(x, str)),
+        classes=classes,
+        instances=instances,
+        meta={k: v for k, v in meta.items() if isinstance(k, str)},
+        handles=tuple(x for x in handles if _is_hashable(x)),
+        requires=tuple(sorted({x for x in requires if isinstance(x, str)})),
+    )
+
+
+def _is_hashable(x: Any) -> bool:  # noqa: ANN401
+    """
+    Check if the value is hashable.
+
+    Args:
+        x: Value.
+
+    Returns:
+        True, if value may be used as the dict key.
+
+    Note:
+        Internal function. Must not be used directly.
+    """
+    try:
+        hash(x)
+    except TypeError:
+        return False
+    return True
+
+
+def _iter_assigns(node: ast.stmt) -> Iterator[tuple[str, ast.expr]]:
+    """
+    Iterate over plain name assignments of the statement.
+
+    Args:
+        node: Statement node.
+
+    Returns:
+        Iterator of (`name`, `value`) tuples.
+
+    Note:
+        Internal function. Must not be used directly.
+    """
+    if isinstance(node, ast.Assign):
+        for t in node.targets:
+            if isinstance(t, ast.Name):
+                yield t.id, node.value
+    elif (
+        isinstance(node, ast.AnnAssign)
+        and isinstance(node.target, ast.Name)
+        and node.value is not None
+    ):
+        yield node.target.id, node.value
+
+
+def parse_file(path: str) -> ModuleSource | None:
+    """
+    Parse plugin module file.
+
+    Args:
+        path: Path to the module file.
+
+    Returns:
+        Parsed source or None, if module is not the Python source
+        (i.e. bytecode or extension module).
+    """
+    if not path.endswith(".py"):
+        return None
+    try:
+        with open(path, "rb") as f:
+            source = f.read()
+    except OSError as e:
+        return ModuleSource(error=f"{e.__class__.__name__}: {e}")
+    return parse_source(source, filename=path)
+
+
+def _derives(
+    kls: str,
+    target: str,
+    classes: Mapping[str, tuple[str, ...]],
+    seen: set[str],
+) -> bool | None:
+    """
+    Check if the local class derives from the target class.
+
+    Args:
+        kls: Local class name.
+        target: Target class name.
+        classes: Local classes.
+        seen: Already checked classes.
+
+    Returns:
+        True, if derives. False, if not. None, if the class has
+        the base defined outside the module.
+
+    Note:
+        Internal function. Must not be used directly.
+    """
+    seen.add(kls)
+    r: bool | None = False
+    for b in classes.get(kls, ()):
+        if b.rsplit(".", 1)[-1] == target:
+            return True
+        if b in classes:
+            if b in seen:
+                continue
+            v = _derives(b, target, classes, seen)
+        else:
+            v = None if b not in ("object", "Generic") else False
+        if v:
+            return True
+        if v is None:
+            r = None
+    return r
+
+
+def check_candidate(
+    src: ModuleSource,
+    name: str,
+    kind: ItemKind,
+    target: str | None,
+    explicit: bool = False,
+) -> tuple[ItemKind | None, tuple[str, ...], bool | None]:
+    """
+    Check the module member is the plugin candidate.
+
+    As on import, the instances of the classes defined outside
+    the module are the candidates only when declared explicitly.
+
+    Args:
+        src: Parsed source.
+        name: Member name.
+        kind: Expected item kind. Ignored for protocols.
+        target: Loader's type name. None, if the type
+            cannot be checked by name (i.e. protocols).
+        explicit: Member is declared by `__plugin__`.
+
+    Returns:
+        Tuple of (`kind`, `bases`, `valid`). `valid` is False,
+        if member is not the candidate.
+    """
+    if name in src.classes:
+        member_kind: ItemKind = "class"
+        kls = name
+    elif name in src.instances:
+        member_kind = "instance"
+        kls = src.instances[name]
+        if not explicit and kls not in src.classes:
+            # Not originated from the module
+            return member_kind, (kls,), False
+    else:
+        return None, (), False
+    if target is None:
+        # Protocols may be matched by both classes and instances
+        return member_kind, src.classes.get(kls, (kls,)), None
+    if member_kind != kind:
+        return member_kind, (), False
+    if kls not in src.classes:
+        # Instance of the imported class
+        valid = True if target and kls.rsplit(".", 1)[-1] == target else None
+        return member_kind, (kls,), valid
+    bases = src.classes[kls]
+    if kls == target and kind == "instance":
+        valid = True
+    else:
+        valid = _derives(kls, target, src.classes, set())
+    return member_kind, bases, valid
+
+
+def select_candidate(
+    src: ModuleSource, kind: ItemKind, target: str | None
+) -> tuple[str | None, ItemKind | None, tuple[str, ...], bool | None]:
+    """
+    Select plugin candidate from the parsed source.
+
+    Follows the loader's selection order: explicit `__plugin__`,
+    members listed in `__all__`, then all members in order
+    of definition. The first candidate which is valid or cannot
+    be checked statically is selected.
+
+    Args:
+        src: Parsed source.
+        kind: Expected item kind.
+        target: Loader's type name. None, if the type
+            cannot be checked by name (i.e. protocols).
+
+    Returns:
+        Tuple of (`item`, `kind`, `bases`, `valid`).
+    """
+    if src.plugin:
+        k, bases, valid = check_candidate(
+            src, src.plugin, kind, target, explicit=True
+        )
+        if k is None:
+            # Imported
+            return src.plugin, None, (), None
+        return src.plugin, k, bases, valid
+    if target is None:
+        members: tuple[str, ...] = (*src.classes, *src.instances)
+    elif kind == "class":
+        members = tuple(src.classes)
+    else:
+        members = tuple(src.instances)
+    for name in (*src.exported, *members):
+        k, bases, valid = check_candidate(src, name, kind, target)
+        if valid is not False:
+            return name, k, bases, valid
+    return None, None, (), False
+
+
+# Parsed sources cache: path -> (mtime, size, source)
+SourceMap = dict[str, tuple[int, int, ModuleSource | None]]
+
+
+def update_sources(
+    cache: SourceMap, paths: Iterable[str]
+) -> tuple[dict[str, ModuleSource | None], bool]:
+    """
+    Get parsed sources, reparse the changed files.
+
+    Cached entries are validated by the file modification
+    time and size.
+
+    Args:
+        cache: Parsed sources cache, updated in place.
+        paths: Iterable of module file paths.
+
+    Returns:
+        Tuple of (`sources`, `changed`). `sources` is the mapping
+        of path to parsed source. `changed` is True,
+        if any cache entry has been updated.
+    """
+    r: dict[str, ModuleSource | None] = {}
+    changed = False
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError as e:
+            r[path] = ModuleSource(error=f"{e.__class__.__name__}: {e}")
+            continue
+        c = cache.get(path)
+        if c is not None and c[0] == st.st_mtime_ns and c[1] == st.st_size:
+            r[path] = c[2]
+            continue
+        src = parse_file(path)
+        cache[path] = (st.st_mtime_ns, st.st_size, src)
+        r[path] = src
+        changed = True
+    return r, changed
+
+
+class SourceCache:
+    """
+    In-memory parsed plugin sources cache.
+
+    Entries are validated by the file modification
+    time and size.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._cache: SourceMap = {}
+
+    def _after_fork(self) -> None:
+        """
+        Reset locks in the forked child.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        self._lock = Lock()
+
+    def get_sources(
+        self, paths: Iterable[str]
+    ) -> dict[str, ModuleSource | None]:
+        """
+        Get parsed sources, parse if necessary.
+
+        Args:
+            paths: Iterable of module file paths.
+
+        Returns:
+            Mapping of path to parsed source. Source is None,
+            if module is not the Python source.
+        """
+        with self._lock:
+            return update_sources(self._cache, paths)[0]
+
+    def clear(self) -> None:
+        """Drop all cached sources."""
+        with self._lock:
+            self._cache = {}
@@ -0,0 +1,331 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Plugin item validators
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+"""Plugin item validators."""
+
+# Python modules
+import typing
+from abc import ABC, abstractmethod
+from typing import Any
+from weakref import WeakKeyDictionary
+
+
+class _Missed: ...
+
+
+_missed = _Missed()
+
+
+def is_runtime_protocol(t: Any) -> bool:  # noqa: ANN401
+    """
+    Check if the type is the `runtime_checkable` protocol.
+
+    Args:
+        t: Type to check.
+
+    Returns:
+        True, if `t` is the runtime checkable protocol.
+    """
+    return getattr(t, "_is_protocol", False) and getattr(
+        t, "_is_runtime_protocol", False
+    )
+
+
+def get_protocol_members(t: Any) -> frozenset[str]:  # noqa: ANN401
+    """
+    Get the names of the protocol's members.
+
+    Args:
+        t: Protocol class.
+
+    Returns:
+        Set of member names.
+    """
+    # Python 3.12+ computes members on the protocol creation
+    attrs = getattr(t, "__protocol_attrs__", None)
+    if attrs is None:
+        attrs = typing._get_protocol_attrs(t)  # type: ignore[attr-defined]
+    return frozenset(attrs)
+
+
+def _type_name(t: Any) -> str:  # noqa: ANN401
+    """
+    Get human-readable type name.
+
+    Args:
+        t: Type.
+
+    Returns:
+        Type name.
+
+    Note:
+        Internal function. Must not be used directly.
+    """
+    return getattr(t, "__qualname__", None) or repr(t)
+
+
+class Validator(ABC):
+    """
+    Plugin item validator.
+
+    Validators are callables returning True for the acceptable
+    plugin items. `explain()` returns the rejection reason.
+
+    Args:
+        t: Expected type.
+    """
+
+    __slots__ = ("t",)
+
+    def __init__(self, t: Any) -> None:  # noqa: ANN401
+        self.t = t
+
+    def __call__(self, x: Any) -> bool:  # noqa: ANN401
+        """
+        Check the item.
+
+        Args:
+            x: Arbitrary object from module to check.
+
+        Returns:
+            True, if item is acceptable.
+        """
+        return self.explain(x) is None
+
+    @abstractmethod
+    def explain(self, x: Any) -> str | None:  # noqa: ANN401
+        """
+        Get the reason why the item is rejected.
+
+        Args:
+            x: Arbitrary object from module to check.
+
+        Returns:
+            Rejection reason or None, if item is acceptable.
+        """
+
+
+class InstanceValidator(Validator):
+    """
+    Check if the item is the instance of given type.
+
+    Used for the plugin schemes like:
+
+    ``` py
+    Loader[BaseClass](...)
+    ```
+    """
+
+    __slots__ = ()
+
+    def __call__(self, x: Any) -> bool:  # noqa: ANN401
+        """
+        Check the item.
+
+        Args:
+            x: Arbitrary object from module to check.
+
+        Returns:
+            True, if item is acceptable.
+        """
+        return isinstance(x, self.t)
+
+    def explain(self, x: Any) -> str | None:  # noqa: ANN401
+        """
+        Get the reason why the item is rejected.
+
+        Args:
+            x: Arbitrary object from module to check.
+
+        Returns:
+            Rejection reason or None, if item is acceptable.
+        """
+        if isinstance(x, self.t):
+            return None
+        return f"not an instance of {_type_name(self.t)}"
+
+
+class SubclassValidator(Validator):
+    """
+    Check if the item is the subclass of given type.
+
+    Used for the plugin schemes like:
+
+    ``` py
+    Loader[type[BaseClass]](...)
+    ```
+    """
+
+    __slots__ = ()
+
+    def __call__(self, x: Any) -> bool:  # noqa: ANN401
+        """
+        Check the item.
+
+        Args:
+            x: Arbitrary object from module to check.
+
+        Returns:
+            True, if item is acceptable.
+        """
+        return isinstance(x, type) and issubclass(x, self.t)
+
+    def explain(self, x: Any) -> str | None:  # noqa: ANN401
+        """
+        Get the reason why the item is rejected.
+
+        Args:
+            x: Arbitrary object from module to check.
+
+        Returns:
+            Rejection reason or None, if item is acceptable.
+        """
+        if not isinstance(x, type):
+            return "not a class"
+        if issubclass(x, self.t):
+            return None
+        return f"not a subclass of {_type_name(self.t)}"
+
+
+class ProtocolValidator(Validator):
+    """
+    Structural check against the `runtime_checkable` protocol.
+
+    Replaces `isinstance()` and `issubclass()` calls against
+    the protocol, which walk over all the protocol's members
+    on each check. The member set is computed once and
+    the class-level results are cached per candidate class.
+
+    Explicit subclasses of the protocol are always accepted.
+    Callable members must not be None. Class-level members are
+    looked up in the class' MRO, like `issubclass()` does, so the
+    attributes of the metaclass (i.e. `type.mro`) are not counted.
+
+    Args:
+        t: Protocol class.
+        classes: Accept only classes, like `issubclass()`.
+            Otherwise, check any object, like `isinstance()`.
+    """
+
+    __slots__ = ("_cache", "_callables", "classes", "members")
+
+    def __init__(self, t: Any, classes: bool = False) -> None:  # noqa: ANN401
+        super().__init__(t)
+        self.classes = classes
+        self.members = tuple(sorted(get_protocol_members(t)))
+        self._callables = frozenset(
+            m for m in self.members if callable(getattr(t, m, None))
+        )
+        # class -> members missing on class level
+        self._cache: WeakKeyDictionary[type, tuple[str, ...]] = (
+            WeakKeyDictionary()
+        )
+
+    def __call__(self, x: Any) -> bool:  # noqa: ANN401
+        """
+        Check the item.
+
+        Args:
+            x: Arbitrary object from module to check.
+
+        Returns:
+            True, if item is acceptable.
+        """
+        missing = self._missing(x)
+        return missing is not None and not missing
+
+    def explain(self, x: Any) -> str | None:  # noqa: ANN401
+        """
+        Get the reason why the item is rejected.
+
+        Args:
+            x: Arbitrary object from module to check.
+
+        Returns:
+            Rejection reason or None, if item is acceptable.
+        """
+        missing = self._missing(x)
+        if missing is None:
+            return "not a class"
+        if not missing:
+            return None
+        return f"missing {', '.join(missing)}"
+
+    def _missing(self, x: Any) -> tuple[str, ...] | None:  # noqa: ANN401
+        """
+        Get protocol members missing in the item.
+
+        Args:
+            x: Arbitrary object from module to check.
+
+        Returns:
+            Tuple of missing members, empty tuple if item is acceptable.
+            None if the classes are expected and `x` is not a class.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        if self.classes:
+            if not isinstance(x, type):
+                return None
+            kls = x
+        else:
+            kls = type(x)
+        missing = self._cache.get(kls)
+        if missing is None:
+            if self.t in kls.__mro__:
+                missing = ()  # Explicit subclass
+            else:
+                missing = tuple(
+                    m for m in self.members if not self._has_class(kls, m)
+                )
+            self._cache[kls] = missing
+        if not missing or self.classes:
+            return missing
+        # May be set in instance
+        return tuple(m for m in missing if not self._has(x, m))
+
+    def _has_class(self, kls: type, name: str) -> bool:
+        """
+        Check if the class provides the protocol member.
+
+        Only the class' MRO is examined, the metaclass
+        attributes are ignored.
+
+        Args:
+            kls: Class.
+            name: Member name.
+
+        Returns:
+            True, if member is provided.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        for base in kls.__mro__:
+            ns = vars(base)
+            if name in ns:
+                return ns[name] is not None or name not in self._callables
+        return False
+
+    def _has(self, x: Any, name: str) -> bool:  # noqa: ANN401
+        """
+        Check if the object provides the protocol member.
+
+        Args:
+            x: Object.
+            name: Member name.
+
+        Returns:
+            True, if member is provided.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        v = getattr(x, name, _missed)
+        if v is _missed:
+            return False
+        return v is not None or name not in self._callables
@@ -0,0 +1,272 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Plugin watcher
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+"""Plugin watcher."""
+
+# Python modules
+import importlib
+import sys
+import time
+from dataclasses import dataclass
+from threading import Event, Lock, Thread
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .loader import Loader
+
+
+@dataclass(frozen=True)
+class WatchEvent:
+    """
+    Result of the single plugin directories check.
+
+    Attributes:
+        added: Names of added plugins.
+        removed: Names of removed plugins.
+        modified: Names of modified plugins.
+        reloaded: Names of successfully reloaded plugins.
+        failed: Names of plugins failed to reload.
+        scan_duration: Directories scanning time, in seconds.
+        reload_duration: Plugins reloading time, in seconds.
+    """
+
+    added: tuple[str, ...] = ()
+    removed: tuple[str, ...] = ()
+    modified: tuple[str, ...] = ()
+    reloaded: tuple[str, ...] = ()
+    failed: tuple[str, ...] = ()
+    scan_duration: float = 0.0
+    reload_duration: float = 0.0
+
+    @property
+    def changed(self) -> bool:
+        """
+        Check if any changes were detected.
+
+        Returns:
+            True, if any plugin is added, removed or modified.
+        """
+        return bool(self.added or self.removed or self.modified)
+
+
+@dataclass(frozen=True)
+class WatchStats:
+    """
+    Watcher counters.
+
+    Attributes:
+        scans: Number of performed checks.
+        scan_time: Total directories scanning time, in seconds.
+        last_scan: Last directories scanning time, in seconds.
+        reloads: Number of plugin reloads.
+        reload_time: Total plugins reloading time, in seconds.
+        last_reload: Last plugins reloading time, in seconds.
+    """
+
+    scans: int = 0
+    scan_time: float = 0.0
+    last_scan: float = 0.0
+    reloads: int = 0
+    reload_time: float = 0.0
+    last_reload: float = 0.0
+
+
+class PluginWatcher:
+    """
+    Watch loader's plugin directories and reload changed plugins.
+
+    Plugin files are polled for modification time and size changes.
+    Added and removed plugins are reflected in the loader's name index,
+    modified plugins, which are already loaded, are reimported and
+    atomically replaced in the loader's cache.
+
+    Args:
+        loader: Loader instance.
+        interval: Polling interval, in seconds.
+    """
+
+    def __init__(self, loader: "Loader[Any]", interval: float = 1.0) -> None:
+        self._loader = loader
+        self.interval = interval
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread: Thread | None = None
+        self._snapshot = loader._scan_entries()
+        self._stats = WatchStats()
+
+    def __enter__(self) -> "PluginWatcher":
+        """
+        Start watching on entering the context.
+
+        Returns:
+            Watcher instance.
+        """
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Stop watching on leaving the context."""
+        self.stop()
+
+    def start(self) -> None:
+        """Start watching in the background thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = Thread(
+            target=self._run, name="loader-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        Stop the background thread.
+
+        Args:
+            timeout: Time to wait for the thread, in seconds.
+        """
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Check if the background thread is running.
+
+        Returns:
+            True, if watcher is running.
+        """
+        return self._thread is not None
+
+    def _run(self) -> None:
+        """
+        Background thread loop.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def stats(self) -> WatchStats:
+        """
+        Get watcher counters.
+
+        Returns:
+            Counters snapshot.
+        """
+        return self._stats
+
+    def check(self) -> WatchEvent:
+        """
+        Check plugin directories and reload changed plugins.
+
+        Called periodically by the background thread,
+        may be called directly as well.
+
+        Returns:
+            Detected changes.
+        """
+        with self._lock:
+            t0 = time.perf_counter()
+            snapshot = self._loader._scan_entries()
+            scan_duration = time.perf_counter() - t0
+            prev = self._snapshot
+            self._snapshot = snapshot
+            added = tuple(n for n in snapshot if n not in prev)
+            removed = tuple(n for n in prev if n not in snapshot)
+            modified = tuple(
+                n for n, v in snapshot.items() if n in prev and prev[n] != v
+            )
+            event = WatchEvent(
+                added=added,
+                removed=removed,
+                modified=modified,
+                scan_duration=scan_duration,
+            )
+            if event.changed:
+                event = self._apply(event)
+            self._update_stats(event)
+            return event
+
+    def _apply(self, event: WatchEvent) -> WatchEvent:
+        """
+        Apply detected changes to the loader.
+
+        Args:
+            event: Detected changes.
+
+        Returns:
+            Changes with reload results.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        loader = self._loader
+        t0 = time.perf_counter()
+        # Reset import system's directory listing caches
+        importlib.invalidate_caches()
+        loader.refresh()
+        for name in event.removed:
+            loader.forget(name)
+        reloaded: list[str] = []
+        failed: list[str] = []
+        for name in event.modified:
+            base = self._snapshot[name][0]
+            if (
+                name not in loader._classes
+                and f"{base}.{name}" not in sys.modules
+            ):
+                # Not loaded yet, will be imported on request
+                loader.forget(name)
+                continue
+            try:
+                item = loader.reload(name)
+            except Exception:  # noqa: BLE001
+                item = None
+            if item is None:
+                failed.append(name)
+            else:
+                reloaded.append(name)
+        return WatchEvent(
+            added=event.added,
+            removed=event.removed,
+            modified=event.modified,
+            reloaded=tuple(reloaded),
+            failed=tuple(failed),
+            scan_duration=event.scan_duration,
+            reload_duration=time.perf_counter() - t0,
+        )
+
+    def _update_stats(self, event: WatchEvent) -> None:
+        """
+        Update counters.
+
+        Args:
+            event: Check results.
+
+        Note:
+            Internal method. Must not be used directly.
+        """
+        st = self._stats
+        n_reloads = len(event.reloaded) + len(event.failed)
+        self._stats = WatchStats(
+            scans=st.scans + 1,
+            scan_time=st.scan_time + event.scan_duration,
+            last_scan=event.scan_duration,
+            reloads=st.reloads + n_reloads,
+            reload_time=st.reload_time + event.reload_duration,
+            last_reload=event.reload_duration if n_reloads else st.last_reload,
+        )
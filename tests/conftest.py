@@ -0,0 +1,52 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Test fixtures
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+# Python modules
+import sys
+from collections.abc import Callable, Iterator, Mapping
+from pathlib import Path
+
+# Third-party modules
+import pytest
+
+PackageFactory = Callable[..., Path]
+
+
+@pytest.fixture
+def make_package(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[PackageFactory]:
+    """
+    Temporary package factory.
+
+    Creates the package `name` in the temporary directory,
+    prepended to `sys.path`. `modules` maps module paths
+    relative to the package, without `.py` suffix, to their
+    sources, i.e. `{"x": ..., "sub/__init__": ...}`. Package's
+    `__init__` is empty, unless set in `modules`.
+
+    All modules of the created packages are removed from
+    `sys.modules` on teardown.
+    """
+    monkeypatch.syspath_prepend(str(tmp_path))
+    names: list[str] = []
+
+    def inner(name: str, modules: Mapping[str, str] | None = None) -> Path:
+        pkg = tmp_path / name
+        pkg.mkdir()
+        (pkg / "__init__.py").write_text("")
+        for mod, src in (modules or {}).items():
+            path = pkg / f"{mod}.py"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(src)
+        names.append(name)
+        return pkg
+
+    yield inner
+    prefixes = tuple(f"{name}." for name in names)
+    for mod in list(sys.modules):
+        if mod in names or mod.startswith(prefixes):
+            del sys.modules[mod]
@@ -0,0 +1,123 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Asynchronous access tests
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+# Python modules
+import asyncio
+import importlib
+from types import ModuleType
+
+# Third-party modules
+import pytest
+
+# Gufo Labs modules
+from gufo.loader import Loader, PreloadReport
+
+from .conftest import PackageFactory
+from .subclass.base import BasePlugin
+
+PLUGIN_BASES = ["tests.subclass.primary", "tests.subclass.secondary"]
+LoaderType = Loader[type[BasePlugin]]
+
+SLOW_PLUGIN = """
+from async_gate import release, imports
+from tests.subclass.base import BasePlugin
+
+imports.append(__name__)
+release.wait(5)
+
+
+class Plugin(BasePlugin):
+    name = "slow"
+
+    def get_name(self) -> str:
+        return self.name
+"""
+
+
+@pytest.fixture
+def slow_loader(make_package: PackageFactory) -> LoaderType:
+    make_package(
+        "async_gate",
+        {
+            "__init__": "import threading\n"
+            "release = threading.Event()\n"
+            "imports = []\n"
+        },
+    )
+    make_package("async_plugins", {"slow": SLOW_PLUGIN})
+    return Loader[type[BasePlugin]](base="async_plugins")
+
+
+@pytest.fixture
+def async_gate(slow_loader: LoaderType) -> ModuleType:
+    return importlib.import_module("async_gate")
+
+
+def test_aget() -> None:
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES)
+
+    async def inner() -> None:
+        kls = await loader.aget("a")
+        assert kls is not None
+        assert kls().get_name() == "a"
+        # Cached
+        assert await loader.aget("a") is kls
+        assert loader["a"] is kls
+
+    asyncio.run(inner())
+
+
+def test_aget_miss() -> None:
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES, exclude=["b"])
+
+    async def inner() -> None:
+        assert await loader.aget("z") is None
+        assert await loader.aget("z", loader["a"]) is loader["a"]
+        with pytest.raises(RuntimeError):
+            await loader.aget("b")
+
+    asyncio.run(inner())
+    assert not loader._pending
+
+
+def test_aget_single_flight(
+    slow_loader: LoaderType, async_gate: ModuleType
+) -> None:
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.001)
+
+    async def inner() -> None:
+        tick_task = asyncio.create_task(ticker())
+        tasks = [
+            asyncio.create_task(slow_loader.aget("slow")) for _ in range(4)
+        ]
+        # Event loop is not blocked by import
+        while ticks < 10:
+            await asyncio.sleep(0.001)
+        async_gate.release.set()
+        results = await asyncio.gather(*tasks)
+        tick_task.cancel()
+        assert results[0] is not None
+        assert all(r is results[0] for r in results)
+
+    asyncio.run(inner())
+    assert async_gate.imports == ["async_plugins.slow"]
+    assert not slow_loader._pending
+
+
+def test_apreload() -> None:
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES, exclude=["d"])
+
+    async def inner() -> PreloadReport:
+        return await loader.apreload()
+
+    report = asyncio.run(inner())
+    assert report.loaded == ["a", "b", "c"]
@@ -0,0 +1,123 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Bounded cache tests
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+# Python modules
+import sys
+import threading
+
+# Third-party modules
+import pytest
+
+# Gufo Labs modules
+from gufo.loader import Loader
+
+from .conftest import PackageFactory
+from .subclass.base import BasePlugin
+
+PLUGIN = """
+from tests.subclass.base import BasePlugin
+
+
+class Plugin(BasePlugin):
+    name = "{name}"
+
+    def get_name(self) -> str:
+        return self.name
+"""
+
+PKG = "bounded_plugins"
+NAMES = ["p0", "p1", "p2", "p3", "p4"]
+
+
+@pytest.fixture
+def pkg(make_package: PackageFactory) -> str:
+    make_package(PKG, {name: PLUGIN.format(name=name) for name in NAMES})
+    return PKG
+
+
+def test_unbounded(pkg: str) -> None:
+    loader = Loader[type[BasePlugin]](base=pkg)
+    loader.preload()
+    assert set(loader._classes) == set(NAMES)
+    assert loader.stats().evictions == 0
+
+
+@pytest.mark.parametrize("free_threading", [False, True])
+def test_lru(
+    pkg: str, free_threading: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("gufo.loader.loader.FREE_THREADING", free_threading)
+    loader = Loader[type[BasePlugin]](base=pkg, max_size=2)
+    loader["p0"]
+    loader["p1"]
+    loader["p2"]
+    assert set(loader._classes) == {"p1", "p2"}
+    # Touch p1, p2 must be evicted
+    loader["p1"]
+    loader["p3"]
+    assert set(loader._classes) == {"p1", "p3"}
+    assert loader.stats().evictions == 2
+    # Module is kept by default
+    assert f"{pkg}.p0" in sys.modules
+    assert loader["p0"]().get_name() == "p0"
+
+
+def test_touch_locked(pkg: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("gufo.loader.loader.FREE_THREADING", True)
+    loader = Loader[type[BasePlugin]](base=pkg, max_size=2)
+    loader["p0"]
+    loader["p1"]
+    done = threading.Event()
+
+    def hit() -> None:
+        loader["p0"]
+        done.set()
+
+    with loader._lock:
+        t = threading.Thread(target=hit)
+        t.start()
+        # Reordering waits for the loader's lock
+        assert not done.wait(0.1)
+    t.join(5)
+    assert done.is_set()
+    assert list(loader._lru) == ["p1", "p0"]
+
+
+def test_pinned(pkg: str) -> None:
+    loader = Loader[type[BasePlugin]](base=pkg, max_size=1, pinned=["p0"])
+    for name in NAMES:
+        loader[name]
+    assert set(loader._classes) == {"p0", "p4"}
+    loader.pin("p4")
+    loader["p1"]
+    assert set(loader._classes) == {"p0", "p1", "p4"}
+    # Unpinned plugin is considered as the recently used one
+    loader.unpin("p0")
+    assert set(loader._classes) == {"p0", "p4"}
+
+
+def test_unload(pkg: str) -> None:
+    loader = Loader[type[BasePlugin]](base=pkg, max_size=1, unload=True)
+    p0 = loader["p0"]
+    loader["p1"]
+    assert set(loader._classes) == {"p1"}
+    assert f"{pkg}.p0" not in sys.modules
+    assert not hasattr(sys.modules[pkg], "p0")
+    assert loader.stats().unloads == 1
+    # Evicted plugin is imported again
+    new_p0 = loader["p0"]
+    assert new_p0 is not p0
+    assert new_p0().get_name() == "p0"
+
+
+def test_unload_foreign(pkg: str) -> None:
+    # Modules imported outside the loader are never unloaded
+    __import__(f"{pkg}.p0")
+    loader = Loader[type[BasePlugin]](base=pkg, max_size=1, unload=True)
+    loader["p0"]
+    loader["p1"]
+    assert f"{pkg}.p0" in sys.modules
+    assert loader.stats().unloads == 0
@@ -0,0 +1,153 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Plugin bytecode tests
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+# Python modules
+import os
+from importlib.util import cache_from_source
+from pathlib import Path
+from py_compile import PycInvalidationMode
+
+# Third-party modules
+import pytest
+
+# Gufo Labs modules
+from gufo.loader import BytecodeReport, Loader
+from gufo.loader.__main__ import main
+from gufo.loader.bytecode import check_bytecode, get_cache_path
+
+from .conftest import PackageFactory
+from .subclass.base import BasePlugin
+
+PLUGIN = """
+from tests.subclass.base import BasePlugin
+
+
+class Plugin(BasePlugin):
+    pass
+"""
+
+
+@pytest.fixture
+def plugins(make_package: PackageFactory) -> Path:
+    pkg = make_package(
+        "pyc_plugins",
+        {
+            "a": PLUGIN,
+            "skipped": PLUGIN,
+            "sub/__init__": PLUGIN,
+            "sub/helper": "x = 1\n",
+        },
+    )
+    (pkg / "data.txt").write_text("")
+    return pkg
+
+
+def get_loader() -> Loader[type[BasePlugin]]:
+    return Loader[type[BasePlugin]](base="pyc_plugins", exclude=["skipped"])
+
+
+def statuses(report: BytecodeReport) -> dict[str, str]:
+    return {m.name: m.status for m in report.modules}
+
+
+def test_cache_path(tmp_path: Path) -> None:
+    source = str(tmp_path / "x.py")
+    assert get_cache_path(source, optimize=0) == cache_from_source(
+        source, optimization=""
+    )
+    path = get_cache_path(source, prefix=str(tmp_path / "cache"), optimize=2)
+    assert path.startswith(str(tmp_path / "cache"))
+    assert path.endswith(".opt-2.pyc")
+    assert os.path.dirname(path).endswith(str(tmp_path))
+
+
+def test_verify_missing(plugins: Path, tmp_path: Path) -> None:
+    report = get_loader().verify_bytecode(prefix=str(tmp_path / "cache"))
+    assert statuses(report) == {
+        "pyc_plugins": "missing",
+        "pyc_plugins.a": "missing",
+        "pyc_plugins.sub": "missing",
+        "pyc_plugins.sub.helper": "missing",
+    }
+    assert len(report.outdated) == 4
+    assert report.compile_time > 0
+    assert report.fresh == []
+
+
+def test_precompile(plugins: Path, tmp_path: Path) -> None:
+    prefix = str(tmp_path / "cache")
+    loader = get_loader()
+    report = loader.precompile(prefix=prefix)
+    assert set(statuses(report).values()) == {"compiled"}
+    assert report.outdated == []
+    for m in report.modules:
+        assert m.cache.startswith(prefix)
+        assert os.path.exists(m.cache)
+    # Nothing to compile
+    report = loader.precompile(prefix=prefix)
+    assert set(statuses(report).values()) == {"fresh"}
+    report = loader.precompile(prefix=prefix, force=True)
+    assert set(statuses(report).values()) == {"compiled"}
+    report = loader.verify_bytecode(prefix=prefix)
+    assert set(statuses(report).values()) == {"fresh"}
+    assert report.compile_time == 0
+    # Change source
+    (plugins / "a.py").write_text(PLUGIN + "\nx = 1\n")
+    report = loader.verify_bytecode(prefix=prefix)
+    assert report.outdated == ["pyc_plugins.a"]
+    assert statuses(report)["pyc_plugins.a"] == "stale"
+
+
+def test_verify_invalid(plugins: Path, tmp_path: Path) -> None:
+    prefix = str(tmp_path / "cache")
+    loader = get_loader()
+    report = loader.precompile(prefix=prefix)
+    Path(report.modules[1].cache).write_bytes(b"garbage")
+    report = loader.verify_bytecode(prefix=prefix)
+    assert statuses(report)["pyc_plugins.a"] == "invalid"
+
+
+def test_checked_hash(plugins: Path, tmp_path: Path) -> None:
+    prefix = str(tmp_path / "cache")
+    loader = get_loader()
+    loader.precompile(
+        prefix=prefix, invalidation_mode=PycInvalidationMode.CHECKED_HASH
+    )
+    assert loader.verify_bytecode(prefix=prefix).outdated == []
+    source = plugins / "a.py"
+    cache = get_cache_path(str(source), prefix=prefix)
+    st = source.stat()
+    source.write_text(PLUGIN.replace("pass", "...."))
+    # Same size and time, different content
+    os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert check_bytecode(str(source), cache) == "stale"
+
+
+def test_compile_error(plugins: Path, tmp_path: Path) -> None:
+    (plugins / "broken.py").write_text("class X(:\n")
+    prefix = str(tmp_path / "cache")
+    loader = get_loader()
+    report = loader.verify_bytecode(prefix=prefix)
+    broken = next(m for m in report.modules if m.name == "pyc_plugins.broken")
+    assert broken.status == "error"
+    assert broken.error
+    report = loader.precompile(prefix=prefix)
+    assert report.outdated == ["pyc_plugins.broken"]
+
+
+def test_cli(
+    plugins: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    prefix = str(tmp_path / "cache")
+    assert main(["check", "--prefix", prefix, "pyc_plugins"]) == 1
+    out = capsys.readouterr().out
+    assert "missing" in out
+    assert "pyc_plugins.sub.helper" in out
+    assert main(["compile", "-q", "--prefix", prefix, "pyc_plugins"]) == 0
+    out = capsys.readouterr().out
+    assert out.startswith("5 modules, 0 outdated")
+    assert main(["check", "--prefix", prefix, "pyc_plugins"]) == 0
+    assert main(["check", "pyc_nonexistent"]) == 2
@@ -0,0 +1,170 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: ChainLoader tests
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+# Python modules
+import asyncio
+from pathlib import Path
+
+# Third-party modules
+import pytest
+
+# Gufo Labs modules
+from gufo.loader import ChainLoader, Loader
+
+from .conftest import PackageFactory
+from .subclass.base import BasePlugin
+
+LoaderType = Loader[type[BasePlugin]]
+ChainType = ChainLoader[type[BasePlugin]]
+
+PLUGIN = """
+from tests.subclass.base import BasePlugin
+
+
+class Plugin(BasePlugin):
+    origin = {origin!r}
+"""
+
+
+def make_chain(
+    exclude: list[str] | None = None,
+) -> tuple[ChainType, LoaderType, LoaderType]:
+    primary = Loader[type[BasePlugin]](
+        base="tests.subclass.primary", exclude=exclude
+    )
+    secondary = Loader[type[BasePlugin]](base="tests.subclass.secondary")
+    return (
+        ChainLoader[type[BasePlugin]]([primary, secondary]),
+        primary,
+        secondary,
+    )
+
+
+@pytest.fixture
+def plugins(tmp_path: Path, make_package: PackageFactory) -> Path:
+    make_package(
+        "chain_custom",
+        {
+            "x": PLUGIN.format(origin="custom"),
+            "only_custom": PLUGIN.format(origin="custom"),
+            # Broken override
+            "broken": "import chain_xxx\n",
+        },
+    )
+    make_package(
+        "chain_core",
+        {
+            "x": PLUGIN.format(origin="core"),
+            "only_core": PLUGIN.format(origin="core"),
+            "broken": PLUGIN.format(origin="core"),
+        },
+    )
+    return tmp_path
+
+
+def test_chain_names() -> None:
+    chain, _, _ = make_chain()
+    assert list(chain) == ["a", "b", "c", "d"]
+    assert list(chain.keys()) == ["a", "b", "c", "d"]
+    assert len(chain) == 4
+    assert "c" in chain
+    assert "x" not in chain
+    assert repr(chain) == "<ChainLoader: 2 loaders>"
+
+
+def test_chain_precedence() -> None:
+    chain, primary, secondary = make_chain()
+    assert chain["b"] is primary["b"]
+    assert chain["b"] is not secondary["b"]
+    assert chain["c"] is secondary["c"]
+    assert chain.owner("b") is primary
+    assert chain.owner("c") is secondary
+    assert chain.owner("x") is None
+    assert chain.shadowed() == {"b": (0, 1)}
+    assert chain.loaders == (primary, secondary)
+
+
+def test_chain_exclude() -> None:
+    chain, _, secondary = make_chain(exclude=["b"])
+    assert chain.owner("b") is secondary
+    assert chain["b"] is secondary["b"]
+    assert chain.shadowed() == {}
+
+
+def test_chain_missed() -> None:
+    chain, primary, secondary = make_chain()
+    assert chain.get("x") is None
+    with pytest.raises(KeyError):
+        chain["x"]
+    # Re-export
+    assert chain.get("d") is None
+    # Unknown names are probed without import
+    assert primary.stats().imports == 0
+    # Re-export only
+    assert secondary.stats().imports == 1
+    assert "x" in primary._probe_misses
+    assert "x" in secondary._probe_misses
+
+
+def test_chain_items() -> None:
+    chain, _, _ = make_chain()
+    assert [name for name, _ in chain.items()] == ["a", "b", "c"]
+    assert [kls.name for kls in chain.values()] == ["a", "b", "c"]
+
+
+def test_chain_keys_filter() -> None:
+    chain, _, _ = make_chain()
+    assert list(chain.keys(prefix="b")) == ["b"]
+    assert list(chain.keys(pattern="[bc]")) == ["b", "c"]
+    assert list(chain.keys(prefix="a", pattern="b*")) == []
+
+
+def test_chain_aget() -> None:
+    chain, primary, _ = make_chain()
+
+    async def inner() -> None:
+        assert await chain.aget("b") is primary["b"]
+        assert await chain.aget("x") is None
+
+    asyncio.run(inner())
+
+
+def test_chain_fallback(plugins: Path) -> None:
+    chain = ChainLoader[type[BasePlugin]](
+        [
+            Loader[type[BasePlugin]](base="chain_custom"),
+            Loader[type[BasePlugin]](base="chain_core"),
+        ]
+    )
+    assert chain["x"].origin == "custom"  # type: ignore[attr-defined]
+    assert chain["only_core"].origin == "core"  # type: ignore[attr-defined]
+    # Broken override falls back to the shadowed plugin
+    assert chain["broken"].origin == "core"  # type: ignore[attr-defined]
+    assert chain.shadowed() == {"broken": (0, 1), "x": (0, 1)}
+
+
+def test_chain_refresh(plugins: Path) -> None:
+    chain = ChainLoader[type[BasePlugin]](
+        [
+            Loader[type[BasePlugin]](base="chain_custom"),
+            Loader[type[BasePlugin]](base="chain_core"),
+        ]
+    )
+    assert "y" not in chain
+    (plugins / "chain_core" / "y.py").write_text(PLUGIN.format(origin="core"))
+    assert "y" not in chain
+    chain.refresh()
+    assert "y" in chain
+    (plugins / "chain_custom" / "z.py").write_text(
+        PLUGIN.format(origin="custom")
+    )
+    chain.invalidate()
+    assert chain.owner("z") is chain.loaders[0]
+
+
+def test_chain_empty() -> None:
+    with pytest.raises(RuntimeError):
+        ChainLoader[type[BasePlugin]]([])
@@ -5,13 +5,18 @@
 # ---------------------------------------------------------------------
 
 # Python modules
+import sys
+from collections.abc import Iterable
+from pathlib import Path
 
 # Third-party modules
 import pytest
 
 # Gufo Labs modules
 from gufo.loader import Loader
+from gufo.loader.loader import filter_names
 
+from .conftest import PackageFactory
 from .subclass.base import BasePlugin
 
 PLUGIN_BASES = ["tests.subclass.primary", "tests.subclass.secondary"]
@@ -116,3 +121,173 @@ def test_items(exc_loader: LoaderType) -> None:
     for name, kls in exc_loader.items():
         items.append((name, kls().get_name()))
     assert items == [("a", "a"), ("b", "b"), ("c", "c")]
+
+
+def test_contains(exc_loader: LoaderType) -> None:
+    assert "a" in exc_loader
+    assert "c" in exc_loader
+    assert "d" not in exc_loader
+    assert "z" not in exc_loader
+
+
+def test_len(exc_loader: LoaderType) -> None:
+    assert len(exc_loader) == 3
+
+
+def test_names_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES)
+    assert list(loader) == ["a", "b", "c", "d"]
+
+    def no_scan() -> Iterable[str]:
+        msg = "must not be scanned"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(loader, "_iter_module_names", no_scan)
+    assert list(loader) == ["a", "b", "c", "d"]
+    assert "a" in loader
+    assert len(loader) == 4
+
+
+def test_refresh(make_package: PackageFactory) -> None:
+    pkg = make_package("refresh_plugins", {"x": ""})
+    loader = Loader[type[BasePlugin]](base="refresh_plugins")
+    assert list(loader) == ["x"]
+    (pkg / "y.py").write_text("")
+    assert "y" not in loader
+    loader.refresh()
+    assert "y" in loader
+    assert list(loader) == ["x", "y"]
+    (pkg / "y.py").unlink()
+    loader.invalidate()
+    assert list(loader) == ["x"]
+
+
+PLUGIN = """
+from tests.subclass.base import BasePlugin
+
+
+class Plugin(BasePlugin):
+    pass
+"""
+
+
+def test_get_added(make_package: PackageFactory) -> None:
+    pkg = make_package("added_plugins", {"x": PLUGIN})
+    loader = Loader[type[BasePlugin]](base="added_plugins")
+    assert list(loader) == ["x"]
+    assert loader.get("y") is None
+    assert "y" in loader._probe_misses
+    # Added after the index is built
+    (pkg / "z.py").write_text(PLUGIN)
+    assert loader.get("z") is not None
+    assert "z" not in loader._probe_misses
+    # Probe misses are cached
+    (pkg / "y.py").write_text(PLUGIN)
+    assert loader.get("y") is None
+    loader.invalidate()
+    assert loader.get("y") is not None
+
+
+def test_get_namespace_portion(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for portion, name in (("p1", "x"), ("p2", "y")):
+        pkg = tmp_path / portion / "ns_plugins"
+        pkg.mkdir(parents=True)
+        (pkg / f"{name}.py").write_text(PLUGIN)
+        monkeypatch.syspath_prepend(str(tmp_path / portion))
+    try:
+        loader = Loader[type[BasePlugin]](base="ns_plugins")
+        assert loader.get("x") is not None
+        assert loader.get("y") is not None
+    finally:
+        for mod in list(sys.modules):
+            if mod == "ns_plugins" or mod.startswith("ns_plugins."):
+                del sys.modules[mod]
+
+
+def test_routes(loader: LoaderType) -> None:
+    routes = loader._get_names().routes
+    assert routes["a"] == ("tests.subclass.primary",)
+    assert routes["b"] == (
+        "tests.subclass.primary",
+        "tests.subclass.secondary",
+    )
+    assert routes["c"] == ("tests.subclass.secondary",)
+
+
+def test_routed_get(monkeypatch: pytest.MonkeyPatch) -> None:
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES)
+    probed: list[str] = []
+    find_item = loader._find_item
+
+    def wrap(name: str) -> type[BasePlugin] | None:
+        probed.append(name)
+        return find_item(name)
+
+    monkeypatch.setattr(loader, "_find_item", wrap)
+    assert loader["c"]().get_name() == "c"
+    assert probed == ["tests.subclass.secondary.c"]
+    # Miss must not touch import system
+    probed.clear()
+    assert loader.get("z") is None
+    assert probed == []
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expected"),
+    [
+        ({}, ["a", "b", "c"]),
+        ({"prefix": "b"}, ["b"]),
+        ({"prefix": ""}, ["a", "b", "c"]),
+        ({"prefix": "x"}, []),
+        ({"pattern": "[ac]"}, ["a", "c"]),
+        ({"pattern": "?"}, ["a", "b", "c"]),
+        ({"pattern": "b*"}, ["b"]),
+        ({"prefix": "b", "pattern": "*"}, ["b"]),
+        ({"prefix": "b", "pattern": "a*"}, []),
+    ],
+)
+def test_keys_filter(
+    exc_loader: LoaderType, kwargs: dict, expected: list[str]
+) -> None:
+    exc_loader.refresh()
+    assert list(exc_loader.keys(**kwargs)) == expected
+    exc_loader.invalidate()
+    assert sorted(exc_loader.keys(sort=False, **kwargs)) == expected
+
+
+def test_keys_streaming(exc_loader: LoaderType) -> None:
+    exc_loader.invalidate()
+    keys = exc_loader.keys(sort=False)
+    assert next(iter(keys)) in {"a", "b", "c"}
+    # Name index is not built
+    assert exc_loader._names is None
+
+
+NAMES = ("a", "huawei_vrp", "huawei_vrp_x", "huawei_ce", "juniper")
+
+
+@pytest.mark.parametrize(
+    ("prefix", "pattern", "expected"),
+    [
+        (None, None, list(NAMES)),
+        ("huawei_vrp", None, ["huawei_vrp", "huawei_vrp_x"]),
+        (None, "huawei_*", ["huawei_ce", "huawei_vrp", "huawei_vrp_x"]),
+        (None, "*_x", ["huawei_vrp_x"]),
+        ("huawei", "huawei_v*", ["huawei_vrp", "huawei_vrp_x"]),
+        ("huawei_ce", "huawei_*", ["huawei_ce"]),
+        ("juniper", "huawei_*", []),
+    ],
+)
+def test_filter_names(
+    prefix: str | None, pattern: str | None, expected: list[str]
+) -> None:
+    # Sorted tuple
+    assert list(filter_names(tuple(sorted(NAMES)), prefix, pattern)) == sorted(
+        expected
+    )
+    # Iterator, in order of names
+    assert list(filter_names(iter(NAMES), prefix, pattern)) == [
+        n for n in NAMES if n in expected
+    ]
@@ -0,0 +1,144 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Plugin dependencies tests
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+# Python modules
+import importlib
+
+# Third-party modules
+import pytest
+
+# Gufo Labs modules
+from gufo.loader import Loader
+from gufo.loader.graph import critical_path, find_cycle, topo_levels
+
+from .conftest import PackageFactory
+from .subclass.base import BasePlugin
+
+PLUGIN = """
+import deps_counter
+
+from tests.subclass.base import BasePlugin
+
+deps_counter.order.append(__name__.rsplit(".", 1)[-1])
+
+
+class Plugin(BasePlugin):
+    pass
+
+{requires}
+"""
+
+PLUGINS = {
+    "core": None,
+    "cli": ["core"],
+    "snmp": ["core", "unknown"],
+    "device": ["cli", "snmp"],
+    "standalone": None,
+}
+
+
+def get_sources(plugins: dict[str, list[str] | None]) -> dict[str, str]:
+    return {
+        name: PLUGIN.format(
+            requires=""
+            if requires is None
+            else f"__plugin_requires__ = {requires!r}"
+        )
+        for name, requires in plugins.items()
+    }
+
+
+@pytest.fixture
+def plugins(make_package: PackageFactory) -> str:
+    make_package("deps_counter", {"__init__": "order = []\n"})
+    make_package("deps_plugins", get_sources(PLUGINS))
+    make_package(
+        "cyclic_plugins",
+        get_sources({"x": ["y"], "y": ["z"], "z": ["x"], "free": None}),
+    )
+    return "deps_plugins"
+
+
+def test_find_cycle() -> None:
+    assert find_cycle({"a": ["b"], "b": []}) is None
+    assert find_cycle({"a": ["b"], "b": ["a"]}) == ["a", "b", "a"]
+    assert find_cycle({"a": ["a"]}) == ["a", "a"]
+    assert find_cycle({"a": ["b"], "b": ["c"], "c": ["b"]}) == ["b", "c", "b"]
+
+
+def test_topo_levels() -> None:
+    graph = {"a": [], "b": ["a"], "c": ["a"], "d": ["b", "c"], "e": []}
+    assert topo_levels(graph) == [("a", "e"), ("b", "c"), ("d",)]
+    assert topo_levels({}) == []
+    with pytest.raises(RuntimeError, match="a -> b -> a"):
+        topo_levels({"a": ["b"], "b": ["a"]})
+
+
+def test_critical_path() -> None:
+    graph = {"a": [], "b": ["a"], "c": ["a"], "d": ["b", "c"], "e": []}
+    durations = {"a": 1.0, "b": 3.0, "c": 2.0, "d": 1.0, "e": 4.0}
+    assert critical_path(graph, durations) == (("a", "b", "d"), 5.0)
+    assert critical_path({}, {}) == ((), 0.0)
+
+
+def test_describe_requires(plugins: str) -> None:
+    loader = Loader[type[BasePlugin]](base=plugins)
+    info = loader.describe("snmp")
+    assert info is not None
+    assert info.requires == ("core", "unknown")
+
+
+def test_load_order(plugins: str) -> None:
+    loader = Loader[type[BasePlugin]](base=plugins)
+    assert loader.load_order() == [
+        ("core", "standalone"),
+        ("cli", "snmp"),
+        ("device",),
+    ]
+    assert loader.load_order(["cli"]) == [("core",), ("cli",)]
+    # Nothing is imported
+    assert loader.stats().imports == 0
+
+
+def test_preload_deps(plugins: str) -> None:
+    loader = Loader[type[BasePlugin]](base=plugins)
+    counter = importlib.import_module("deps_counter")
+    report = loader.preload(["device"], max_workers=2, deps=True)
+    # Dependencies are loaded as well
+    names = [p.name for p in report.plugins]
+    assert names == ["device", "cli", "core", "snmp"]
+    assert report.failed == []
+    # Loaded in order of dependencies
+    order = counter.order
+    assert order[0] == "core"
+    assert order[-1] == "device"
+    assert set(order) == {"core", "cli", "snmp", "device"}
+    # Critical path
+    assert report.critical_path[0] == "core"
+    assert report.critical_path[-1] == "device"
+    assert len(report.critical_path) == 3
+    assert (
+        0
+        < report.critical_path_duration
+        <= sum(p.duration for p in report.plugins)
+    )
+
+
+def test_preload_no_deps(plugins: str) -> None:
+    loader = Loader[type[BasePlugin]](base=plugins)
+    report = loader.preload(["device"])
+    assert report.loaded == ["device"]
+    assert report.critical_path == ()
+
+
+def test_preload_cycle(plugins: str) -> None:
+    loader = Loader[type[BasePlugin]](base="cyclic_plugins")
+    with pytest.raises(RuntimeError, match="x -> y -> z -> x"):
+        loader.preload(deps=True)
+    # Nothing is loaded
+    assert loader.stats().imports == 0
+    report = loader.preload(["free"], deps=True)
+    assert report.loaded == ["free"]
@@ -0,0 +1,121 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Key dispatch tests
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+# Python modules
+import sys
+from pathlib import Path
+from typing import Any
+
+# Third-party modules
+import pytest
+
+# Gufo Labs modules
+from gufo.loader import Loader
+from gufo.loader.static import parse_source
+
+from .conftest import PackageFactory
+from .subclass.base import BasePlugin
+
+PLUGIN_TEMPLATE = """
+from tests.subclass.base import BasePlugin
+
+
+class {kls}(BasePlugin):
+    name = "{name}"
+
+
+__plugin_handles__ = {handles!r}
+"""
+
+PLUGINS: dict[str, list[Any]] = {
+    "cisco": ["Cisco.IOS", "Cisco.IOSXE", ("cisco", 1)],
+    "juniper": ["Juniper.JUNOS"],
+    "generic": [],
+}
+
+
+def get_source(name: str, handles: list[Any]) -> str:
+    return PLUGIN_TEMPLATE.format(
+        kls=f"{name.capitalize()}Plugin", name=name, handles=handles
+    )
+
+
+def write_plugin(path: Path, name: str, handles: list[Any]) -> None:
+    (path / f"{name}.py").write_text(get_source(name, handles))
+
+
+@pytest.fixture
+def plugins(make_package: PackageFactory) -> str:
+    make_package(
+        "dispatch_plugins",
+        {name: get_source(name, handles) for name, handles in PLUGINS.items()},
+    )
+    return "dispatch_plugins"
+
+
+def test_parse_handles() -> None:
+    src = parse_source("__plugin_handles__ = {'a'}")
+    assert src.handles == ("a",)
+    src = parse_source("__plugin_handles__ = ['a', ['b'], 1]")
+    assert src.handles == ("a", 1)
+    src = parse_source("__plugin_handles__ = get_keys()")
+    assert src.handles == ()
+
+
+def test_for_key(plugins: str) -> None:
+    loader = Loader[type[BasePlugin]](base=plugins)
+    kls = loader.for_key("Cisco.IOS")
+    assert kls is not None
+    assert kls.name == "cisco"
+    assert loader.for_key("Cisco.IOSXE") is kls
+    assert loader.for_key(("cisco", 1)) is kls
+    j = loader.for_key("Juniper.JUNOS")
+    assert j is not None
+    assert j.name == "juniper"
+    assert loader.for_key("unknown") is None
+    # Only requested plugins are imported
+    assert f"{plugins}.generic" not in sys.modules
+    assert loader.key_conflicts() == {}
+
+
+def test_for_key_conflict(plugins: str, tmp_path: Path) -> None:
+    write_plugin(tmp_path / plugins, "ios", ["Cisco.IOS"])
+    loader = Loader[type[BasePlugin]](base=plugins)
+    kls = loader.for_key("Cisco.IOS")
+    assert kls is not None
+    assert kls.name == "cisco"
+    assert loader.key_conflicts() == {"Cisco.IOS": ("cisco", "ios")}
+
+
+def test_for_key_conflict_raise(plugins: str, tmp_path: Path) -> None:
+    write_plugin(tmp_path / plugins, "ios", ["Cisco.IOS"])
+    loader = Loader[type[BasePlugin]](base=plugins, on_key_conflict="raise")
+    with pytest.raises(RuntimeError, match=r"'Cisco\.IOS': cisco, ios"):
+        loader.for_key("Cisco.IOS")
+    # Keys without conflicts are dispatched
+    kls = loader.for_key("Juniper.JUNOS")
+    assert kls is not None
+    assert kls.name == "juniper"
+    assert loader.for_key("Unknown") is None
+
+
+def test_for_key_conflict_strict(plugins: str, tmp_path: Path) -> None:
+    write_plugin(tmp_path / plugins, "ios", ["Cisco.IOS"])
+    # Strict mode is about missing plugin packages only
+    loader = Loader[type[BasePlugin]](base=plugins, strict=True)
+    kls = loader.for_key("Cisco.IOS")
+    assert kls is not None
+    assert kls.name == "cisco"
+
+
+def test_for_key_refresh(plugins: str, tmp_path: Path) -> None:
+    loader = Loader[type[BasePlugin]](base=plugins)
+    assert loader.for_key("Huawei.VRP") is None
+    write_plugin(tmp_path / plugins, "huawei", ["Huawei.VRP"])
+    loader.refresh()
+    kls = loader.for_key("Huawei.VRP")
+    assert kls is not None
+    assert kls.name == "huawei"
@@ -0,0 +1,140 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Failure caching tests
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+# Python modules
+import importlib
+import traceback
+from types import ModuleType
+
+# Third-party modules
+import pytest
+
+# Gufo Labs modules
+from gufo.loader import Loader, PluginFailure
+
+from .conftest import PackageFactory
+from .subclass.base import BasePlugin
+
+BROKEN_PLUGIN = """
+from failures_counter import attempts
+
+attempts.append(__name__)
+
+import failures_nonexistent_dependency  # noqa
+"""
+
+FAULTY_PLUGIN = """
+from failures_counter import attempts
+
+attempts.append(__name__)
+
+raise ValueError("faulty")
+"""
+
+
+@pytest.fixture
+def plugins(make_package: PackageFactory) -> str:
+    make_package("failures_counter", {"__init__": "attempts = []\n"})
+    make_package(
+        "failures_plugins",
+        {"broken": BROKEN_PLUGIN, "empty": "", "faulty": FAULTY_PLUGIN},
+    )
+    return "failures_plugins"
+
+
+@pytest.fixture
+def counter(plugins: str) -> ModuleType:
+    return importlib.import_module("failures_counter")
+
+
+def test_failure_cached(plugins: str, counter: ModuleType) -> None:
+    loader = Loader[type[BasePlugin]](base=plugins)
+    for _ in range(3):
+        assert loader.get("broken") is None
+    assert counter.attempts == ["failures_plugins.broken"]
+    failures = loader.failures()
+    assert set(failures) == {"broken"}
+    failure = failures["broken"]
+    assert isinstance(failure, PluginFailure)
+    assert isinstance(failure.error, ImportError)
+    assert failure.attempts == 1
+
+
+def test_exception_cached(plugins: str, counter: ModuleType) -> None:
+    loader = Loader[type[BasePlugin]](base=plugins)
+    errors: list[ValueError] = []
+    for _ in range(3):
+        with pytest.raises(ValueError, match="faulty") as exc_info:
+            loader.get("faulty")
+        errors.append(exc_info.value)
+    assert counter.attempts == ["failures_plugins.faulty"]
+    failure = loader.failures()["faulty"]
+    assert isinstance(failure.error, ValueError)
+    # Recorded error is re-raised
+    assert all(e is failure.error for e in errors)
+    assert loader.stats().import_errors == 1
+    # Traceback does not grow
+    depth = len(traceback.extract_tb(errors[-1].__traceback__))
+    with pytest.raises(ValueError, match="faulty") as exc_info:
+        loader["faulty"]
+    assert len(traceback.extract_tb(exc_info.value.__traceback__)) == depth
+
+
+def test_syntax_error(make_package: PackageFactory) -> None:
+    make_package("syntax_plugins", {"bad": "x = (\n"})
+    loader = Loader[type[BasePlugin]](base="syntax_plugins")
+    for _ in range(2):
+        with pytest.raises(SyntaxError):
+            loader.get("bad")
+    assert isinstance(loader.failures()["bad"].error, SyntaxError)
+    loader.clear_failures()
+    with pytest.raises(SyntaxError):
+        loader.get("bad")
+
+
+def test_no_item_cached(plugins: str) -> None:
+    loader = Loader[type[BasePlugin]](base=plugins)
+    assert loader.get("empty") is None
+    failure = loader.failures()["empty"]
+    assert failure.error is None
+
+
+def test_miss_not_cached(plugins: str) -> None:
+    loader = Loader[type[BasePlugin]](base=plugins)
+    assert loader.get("unknown") is None
+    assert loader.failures() == {}
+
+
+def test_failure_ttl(plugins: str, counter: ModuleType) -> None:
+    loader = Loader[type[BasePlugin]](base=plugins, failure_ttl=0)
+    for _ in range(3):
+        assert loader.get("broken") is None
+    assert len(counter.attempts) == 3
+    assert loader.failures()["broken"].attempts == 3
+
+
+def test_clear_failures(plugins: str, counter: ModuleType) -> None:
+    loader = Loader[type[BasePlugin]](base=plugins)
+    assert loader.get("broken") is None
+    assert loader.get("empty") is None
+    loader.clear_failures("broken")
+    assert set(loader.failures()) == {"empty"}
+    assert loader.get("broken") is None
+    assert len(counter.attempts) == 2
+    loader.clear_failures()
+    assert loader.failures() == {}
+
+
+def test_refresh_clears_failures(plugins: str, counter: ModuleType) -> None:
+    loader = Loader[type[BasePlugin]](base=plugins)
+    assert loader.get("broken") is None
+    loader.refresh()
+    assert loader.failures() == {}
+    assert loader.get("broken") is None
+    loader.invalidate()
+    assert loader.failures() == {}
+    assert loader.get("broken") is None
+    assert len(counter.attempts) == 3
@@ -0,0 +1,71 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Frozen plugin set tests
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+# Python modules
+import os
+from collections.abc import Mapping
+
+# Third-party modules
+import pytest
+
+# Gufo Labs modules
+from gufo.loader import FrozenLoader, Loader
+
+from .subclass.base import BasePlugin
+
+PLUGIN_BASES = ["tests.subclass.primary", "tests.subclass.secondary"]
+
+
+def test_freeze() -> None:
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES)
+    frozen = loader.freeze()
+    assert isinstance(frozen, FrozenLoader)
+    assert isinstance(frozen, Mapping)
+    # d is the re-export
+    assert list(frozen) == ["a", "b", "c"]
+    assert len(frozen) == 3
+    assert "a" in frozen
+    assert "d" not in frozen
+    for name in frozen:
+        assert frozen[name] is loader[name]
+    assert frozen.get("d") is None
+    assert dict(frozen.items()) == {n: loader[n] for n in ("a", "b", "c")}
+    with pytest.raises(KeyError):
+        frozen["d"]
+    assert repr(frozen) == "<FrozenLoader: 3 plugins>"
+
+
+def test_freeze_subset() -> None:
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES)
+    frozen = loader.freeze(["b", "missed"])
+    assert list(frozen) == ["b"]
+    # Loader remains usable
+    assert loader.get("c") is not None
+    assert "c" not in frozen
+
+
+def test_freeze_bounded() -> None:
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES, max_size=1)
+    frozen = loader.freeze()
+    assert list(frozen) == ["a", "b", "c"]
+
+
+def test_freeze_immutable() -> None:
+    frozen = Loader[type[BasePlugin]](bases=PLUGIN_BASES).freeze()
+    with pytest.raises(TypeError):
+        frozen["x"] = frozen["a"]  # type: ignore[index]
+    with pytest.raises(AttributeError):
+        frozen.x = 1  # type: ignore[attr-defined]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork is not supported")
+def test_freeze_fork() -> None:
+    frozen = Loader[type[BasePlugin]](bases=PLUGIN_BASES).freeze()
+    pid = os.fork()
+    if not pid:
+        os._exit(0 if frozen["a"].__name__ == "APlugin" else 1)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
@@ -0,0 +1,150 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Instrumentation tests
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+# Python modules
+import gc
+import threading
+from typing import Any
+
+# Third-party modules
+import pytest
+
+# Gufo Labs modules
+from gufo.loader import Loader, LoaderStats
+
+from .subclass.base import BasePlugin
+
+PLUGIN_BASES = ["tests.subclass.primary", "tests.subclass.secondary"]
+EVENTS = [
+    "on_scan",
+    "on_import_start",
+    "on_import_end",
+    "on_hit",
+    "on_miss",
+    "on_error",
+]
+
+
+def test_stats() -> None:
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES)
+    assert loader.stats() == LoaderStats(
+        hits=0,
+        misses=0,
+        imports=0,
+        import_errors=0,
+        import_time=0.0,
+        scans=0,
+        scan_time=0.0,
+    )
+    loader["a"]
+    loader["a"]
+    loader.get("a")
+    loader.get("d")
+    loader.get("z")
+    stats = loader.stats()
+    assert stats.hits == 2
+    assert stats.misses == 3
+    assert stats.imports == 2
+    assert stats.import_errors == 1
+    assert stats.import_time > 0
+    assert stats.scans == 1
+    assert stats.scan_time > 0
+
+
+def test_stats_free_threading(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("gufo.loader.loader.FREE_THREADING", True)
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES)
+    loader["a"]
+
+    def worker() -> None:
+        for _ in range(100):
+            loader.get("a")
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert loader.stats().hits == 400
+    # Cells of the finished threads are folded
+    gc.collect()
+    assert len(loader._hit_cells) == 1
+    assert loader.stats().hits == 400
+
+
+def test_hooks() -> None:
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES)
+    events: list[tuple[str, tuple[Any, ...]]] = []
+
+    def hook(event: str) -> Any:  # noqa: ANN401
+        def inner(*args: Any) -> None:  # noqa: ANN401
+            events.append((event, args))
+
+        return inner
+
+    hooks = {event: hook(event) for event in EVENTS}
+    for event, h in hooks.items():
+        loader.add_hook(event, h)  # type: ignore[arg-type]
+    loader["a"]
+    loader["a"]
+    loader.get("d")
+    assert [e for e, _ in events] == [
+        "on_miss",
+        "on_scan",
+        "on_import_start",
+        "on_import_end",
+        "on_hit",
+        "on_miss",
+        "on_import_start",
+        "on_import_end",
+        "on_error",
+    ]
+    assert events[0][1] == ("a",)
+    assert events[1][1][1] == 4
+    assert events[3][1][0] == "a"
+    assert events[3][1][2] is True
+    assert events[4][1] == ("a",)
+    assert events[8][1] == ("d", None)
+    # Remove hooks
+    events.clear()
+    for event, h in hooks.items():
+        loader.remove_hook(event, h)  # type: ignore[arg-type]
+    loader["a"]
+    loader.get("b")
+    assert events == []
+    assert not loader._hooks
+    assert not loader._on_hit
+
+
+def test_hooks_interrupted_import(monkeypatch: pytest.MonkeyPatch) -> None:
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES)
+    events: list[tuple[str, tuple[Any, ...]]] = []
+    for event in ("on_import_end", "on_error"):
+        loader.add_hook(
+            event,  # type: ignore[arg-type]
+            lambda *args, event=event: events.append((event, args)),
+        )
+    error = KeyboardInterrupt()
+
+    def interrupted(name: str, bases: list[str]) -> None:
+        raise error
+
+    monkeypatch.setattr(loader, "_import_item", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        loader.get("a")
+    assert [e for e, _ in events] == ["on_import_end", "on_error"]
+    assert events[0][1][2] is False
+    assert events[1][1] == ("a", error)
+    stats = loader.stats()
+    assert stats.imports == 1
+    assert stats.import_errors == 1
+    assert stats.import_time > 0
+
+
+def test_unknown_hook() -> None:
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES)
+    with pytest.raises(ValueError):
+        loader.add_hook("on_unknown", print)  # type: ignore[arg-type]
@@ -0,0 +1,125 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Persistent index tests
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+# Python modules
+import os
+from pathlib import Path
+
+# Third-party modules
+import pytest
+
+# Gufo Labs modules
+from gufo.loader import Loader
+from gufo.loader.index import (
+    RACY_MTIME,
+    DirEntry,
+    IndexEntry,
+    PluginIndex,
+)
+
+from .subclass.base import BasePlugin
+
+PLUGIN_BASES = ["tests.subclass.primary", "tests.subclass.secondary"]
+
+
+def test_index_keys(tmp_path: Path) -> None:
+    index = str(tmp_path / "plugins.idx")
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES, index=index)
+    assert list(loader.keys()) == ["a", "b", "c", "d"]
+    assert os.path.exists(index)
+
+
+def test_index_reuse(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    index = str(tmp_path / "plugins.idx")
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES, index=index)
+    expected = list(loader.keys())
+
+    def no_scan(path: str) -> DirEntry:
+        msg = "must not be scanned"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr("gufo.loader.index.scan_dir", no_scan)
+    loader2 = Loader[type[BasePlugin]](
+        bases=PLUGIN_BASES, index=index, exclude=["d"]
+    )
+    assert list(loader2.keys()) == expected[:-1]
+    assert [kls().get_name() for kls in loader2.values()] == expected[:-1]
+
+
+def test_index_exclude(tmp_path: Path) -> None:
+    index = str(tmp_path / "plugins.idx")
+    loader = Loader[type[BasePlugin]](
+        bases=PLUGIN_BASES, index=index, exclude=["d"]
+    )
+    assert list(loader) == ["a", "b", "c"]
+    assert [name for name, _ in loader.items()] == ["a", "b", "c"]
+
+
+@pytest.mark.parametrize("data", [b"", b"garbage", b"\x00" * 16])
+def test_broken_index(tmp_path: Path, data: bytes) -> None:
+    index = tmp_path / "plugins.idx"
+    index.write_bytes(data)
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES, index=str(index))
+    assert list(loader.keys()) == ["a", "b", "c", "d"]
+
+
+def get_modules(idx: PluginIndex, path: Path) -> list[IndexEntry]:
+    return list(idx.get_dirs([str(path)])[str(path)].modules)
+
+
+def test_index_rescan(tmp_path: Path) -> None:
+    plugins = tmp_path / "plugins"
+    plugins.mkdir()
+    (plugins / "x.py").write_text("")
+    idx = PluginIndex(str(tmp_path / "plugins.idx"))
+    names = [e.name for e in get_modules(idx, plugins)]
+    assert names == ["x"]
+    # Fresh directory must be rescanned
+    dirs = idx.get_dirs([str(plugins)])
+    assert dirs[str(plugins)].mtime == RACY_MTIME
+    # Add module and package
+    (plugins / "y.py").write_text("")
+    (plugins / "z").mkdir()
+    (plugins / "z" / "__init__.py").write_text("")
+    (plugins / "not_pkg").mkdir()
+    entries = get_modules(idx, plugins)
+    assert [e.name for e in entries] == ["x", "y", "z"]
+    assert [e.is_pkg for e in entries] == [False, False, True]
+    assert entries[2].file == str(plugins / "z" / "__init__.py")
+    # Changes must be persisted
+    idx2 = PluginIndex(str(tmp_path / "plugins.idx"))
+    assert idx2._load()[0] == idx.get_dirs([str(plugins)])
+
+
+def test_index_stable_dir(tmp_path: Path) -> None:
+    plugins = tmp_path / "plugins"
+    plugins.mkdir()
+    (plugins / "x.py").write_text("")
+    # Move directory time to the past
+    os.utime(plugins, ns=(0, 1_000_000_000))
+    idx = PluginIndex(str(tmp_path / "plugins.idx"))
+    dirs = idx.get_dirs([str(plugins)])
+    assert dirs[str(plugins)].mtime == 1_000_000_000
+    # Directory changed
+    (plugins / "y.py").write_text("")
+    assert [e.name for e in get_modules(idx, plugins)] == ["x", "y"]
+
+
+def test_index_shared(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    index = str(tmp_path / "plugins.idx")
+    primary = Loader[type[BasePlugin]](bases=PLUGIN_BASES[:1], index=index)
+    secondary = Loader[type[BasePlugin]](bases=PLUGIN_BASES[1:], index=index)
+    expected = (list(primary.keys()), list(secondary.keys()))
+
+    def no_scan(path: str) -> DirEntry:
+        msg = "must not be scanned"
+        raise AssertionError(msg)
+
+    # Both configurations are kept in the index
+    monkeypatch.setattr("gufo.loader.index.scan_dir", no_scan)
+    primary = Loader[type[BasePlugin]](bases=PLUGIN_BASES[:1], index=index)
+    secondary = Loader[type[BasePlugin]](bases=PLUGIN_BASES[1:], index=index)
+    assert (list(primary.keys()), list(secondary.keys())) == expected
@@ -0,0 +1,123 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Lazy plugin proxy tests
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+# Third-party modules
+import pytest
+
+# Gufo Labs modules
+from gufo.loader import LazyPlugin, Loader
+
+from .conftest import PackageFactory
+from .singleton.base import BasePlugin as SingletonPlugin
+from .subclass.base import BasePlugin
+
+PLUGIN_BASES = ["tests.subclass.primary", "tests.subclass.secondary"]
+SINGLETON_BASES = ["tests.singleton.primary", "tests.singleton.secondary"]
+
+
+@pytest.fixture
+def plugins(make_package: PackageFactory) -> str:
+    make_package(
+        "lazy_plugins", {"broken": "import lazy_nonexistent_dependency\n"}
+    )
+    return "lazy_plugins"
+
+
+def test_lazy_deferred() -> None:
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES)
+    routes = {name: loader.lazy(name) for name in ("a", "b", "c")}
+    assert isinstance(routes["a"], LazyPlugin)
+    assert loader.stats().imports == 0
+    assert repr(routes["a"]) == "<LazyPlugin: a>"
+    # Call
+    assert routes["a"]().get_name() == "a"
+    assert loader.stats().imports == 1
+    # Attribute access
+    assert routes["b"].name == "b"
+    assert loader.stats().imports == 2
+    assert repr(routes["a"]) == f"<LazyPlugin: a -> {loader['a']!r}>"
+
+
+def test_lazy_direct_access() -> None:
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES)
+    proxy = loader.lazy("a")
+    assert proxy.name == "a"
+    hits = loader.stats().hits
+    for _ in range(3):
+        assert proxy.name == "a"
+    # Served from proxy, not from loader
+    assert loader.stats().hits == hits
+
+
+def test_lazy_singleton() -> None:
+    loader = Loader[SingletonPlugin](bases=SINGLETON_BASES)
+    proxy = loader.lazy("a")
+    assert proxy.get_name() == "a"
+    proxy.extra = 1  # type: ignore[attr-defined]
+    assert loader["a"].extra == 1  # type: ignore[attr-defined]
+    del proxy.extra  # type: ignore[attr-defined]
+    assert not hasattr(loader["a"], "extra")
+
+
+def test_lazy_missed() -> None:
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES)
+    proxy = loader.lazy("missed")
+    with pytest.raises(KeyError, match="plugin is not found: missed"):
+        proxy()
+    with pytest.raises(KeyError):
+        proxy.name  # noqa: B018
+
+
+def test_lazy_broken(plugins: str) -> None:
+    loader = Loader[type[BasePlugin]](base=plugins)
+    proxy = loader.lazy("broken")
+    with pytest.raises(KeyError) as exc_info:
+        proxy.name  # noqa: B018
+    assert isinstance(exc_info.value.__cause__, ImportError)
+
+
+def test_lazy_special_methods(make_package: PackageFactory) -> None:
+    make_package(
+        "lazy_special",
+        {
+            "items": "from tests.singleton.base import BasePlugin\n\n\n"
+            "class Items(BasePlugin, list):\n"
+            "    def __str__(self) -> str:\n"
+            "        return 'items'\n\n\n"
+            "items = Items(['x', 'y'])\n"
+        },
+    )
+    loader = Loader[SingletonPlugin](base="lazy_special")
+    proxy = loader.lazy("items")
+    assert proxy == ["x", "y"]  # type: ignore[comparison-overlap]
+    assert loader.stats().imports == 1
+    assert proxy != ["x"]  # type: ignore[comparison-overlap]
+    assert bool(proxy)
+    assert len(proxy) == 2  # type: ignore[arg-type]
+    assert list(proxy) == ["x", "y"]  # type: ignore[call-overload]
+    assert "y" in proxy  # type: ignore[operator]
+    assert proxy[0] == "x"  # type: ignore[index]
+    assert str(proxy) == "items"
+    # Class plugins are hashable
+    kls = Loader[type[BasePlugin]](bases=PLUGIN_BASES)
+    assert {kls.lazy("a"): 1}[kls["a"]] == 1
+    assert kls.lazy("a") == kls.lazy("a")
+
+
+def test_lazy_import_triggers() -> None:
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES)
+    proxies = {name: loader.lazy(name) for name in ("a", "b", "c")}
+    assert repr(proxies["a"]) == "<LazyPlugin: a>"
+    assert type(proxies["a"]) is LazyPlugin  # type: ignore[comparison-overlap]
+    assert loader.stats().imports == 0
+    # Checks see the plugin's class and bases
+    assert isinstance(proxies["a"], type)
+    assert loader.stats().imports == 1
+    assert issubclass(proxies["b"], BasePlugin)
+    assert loader.stats().imports == 2
+    # Set members are hashed
+    assert len({proxies["c"]}) == 1
+    assert loader.stats().imports == 3
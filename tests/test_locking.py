@@ -0,0 +1,222 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Import locking tests
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+# Python modules
+import importlib
+import threading
+from types import ModuleType
+
+# Third-party modules
+import pytest
+
+# Gufo Labs modules
+from gufo.loader import ImportPathResolver, Loader
+
+from .conftest import PackageFactory
+from .subclass.base import BasePlugin
+
+PLUGIN = """
+from locking_gate import started, release, imports
+from tests.subclass.base import BasePlugin
+
+imports.append(__name__)
+started.set()
+release.wait(5)
+
+
+class Plugin(BasePlugin):
+    name = "{name}"
+
+    def get_name(self) -> str:
+        return self.name
+"""
+
+FAST_PLUGIN = """
+from tests.subclass.base import BasePlugin
+
+
+class Plugin(BasePlugin):
+    name = "fast"
+
+    def get_name(self) -> str:
+        return self.name
+"""
+
+
+@pytest.fixture
+def loader(make_package: PackageFactory) -> Loader[type[BasePlugin]]:
+    make_package(
+        "locking_gate",
+        {
+            "__init__": "import threading\n"
+            "started = threading.Event()\n"
+            "release = threading.Event()\n"
+            "imports = []\n"
+        },
+    )
+    make_package(
+        "locking_plugins",
+        {"slow": PLUGIN.format(name="slow"), "fast": FAST_PLUGIN},
+    )
+    return Loader[type[BasePlugin]](base="locking_plugins")
+
+
+@pytest.fixture
+def locking_gate(loader: Loader[type[BasePlugin]]) -> ModuleType:
+    return importlib.import_module("locking_gate")
+
+
+def test_parallel_imports(
+    loader: Loader[type[BasePlugin]], locking_gate: ModuleType
+) -> None:
+    t = threading.Thread(target=loader.get, args=("slow",))
+    t.start()
+    try:
+        assert locking_gate.started.wait(5)
+        # Slow import must not block other plugins
+        assert loader["fast"]().get_name() == "fast"
+    finally:
+        locking_gate.release.set()
+        t.join()
+    assert loader["slow"]().get_name() == "slow"
+
+
+def test_single_flight(
+    loader: Loader[type[BasePlugin]], locking_gate: ModuleType
+) -> None:
+    results: list[type[BasePlugin] | None] = []
+
+    def get() -> None:
+        results.append(loader.get("slow"))
+
+    threads = [threading.Thread(target=get) for _ in range(4)]
+    for t in threads:
+        t.start()
+    assert locking_gate.started.wait(5)
+    locking_gate.release.set()
+    for t in threads:
+        t.join()
+    assert locking_gate.imports == ["locking_plugins.slow"]
+    assert len(results) == 4
+    assert all(r is results[0] for r in results)
+    assert not loader._name_locks
+
+
+def test_resolver_single_flight(
+    loader: Loader[type[BasePlugin]], locking_gate: ModuleType
+) -> None:
+    resolver = ImportPathResolver[type[BasePlugin]]()
+    results: list[type[BasePlugin]] = []
+
+    def resolve() -> None:
+        results.append(resolver("locking_plugins.slow.Plugin"))
+
+    threads = [threading.Thread(target=resolve) for _ in range(4)]
+    for t in threads:
+        t.start()
+    assert locking_gate.started.wait(5)
+    # Slow import must not block other paths
+    assert resolver("locking_plugins.fast.Plugin")().get_name() == "fast"
+    locking_gate.release.set()
+    for t in threads:
+        t.join()
+    assert locking_gate.imports == ["locking_plugins.slow"]
+    assert len(results) == 4
+    assert all(r is results[0] for r in results)
+    assert not resolver._path_locks
+
+
+def test_name_locks_released(
+    loader: Loader[type[BasePlugin]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Failing dotted names
+    for i in range(3):
+        assert loader.get(f"missing.x{i}") is None
+    assert not loader._name_locks
+
+    # Failing imports
+    def broken(name: str, bases: list[str]) -> None:
+        msg = "broken"
+        raise RuntimeError(msg)
+
+    monkeypatch.setattr(loader, "_load_item", broken)
+    with pytest.raises(RuntimeError):
+        loader.get("fast")
+    assert not loader._name_locks
+
+
+CYCLE_PLUGIN = """
+import cycle_gate
+from tests.subclass.base import BasePlugin
+
+
+class Plugin(BasePlugin):
+    name = "{name}"
+
+
+# Both imports are in progress
+cycle_gate.barrier.wait(5)
+cycle_gate.peers["{name}"] = cycle_gate.loader.get("{peer}")
+"""
+
+
+def test_cycle(make_package: PackageFactory) -> None:
+    make_package(
+        "cycle_gate",
+        {
+            "__init__": "import threading\n"
+            "barrier = threading.Barrier(2)\n"
+            "peers = {}\n"
+            "loader = None\n"
+        },
+    )
+    make_package(
+        "cycle_plugins",
+        {
+            "a": CYCLE_PLUGIN.format(name="a", peer="b"),
+            "b": CYCLE_PLUGIN.format(name="b", peer="a"),
+        },
+    )
+    loader = Loader[type[BasePlugin]](base="cycle_plugins")
+    cycle_gate = importlib.import_module("cycle_gate")
+    cycle_gate.loader = loader  # type: ignore[attr-defined]
+    threads = [
+        threading.Thread(target=loader.get, args=(name,), daemon=True)
+        for name in ("a", "b")
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+    # Plugins requesting each other must not deadlock
+    assert not any(t.is_alive() for t in threads)
+    assert loader["a"].name == "a"
+    assert loader["b"].name == "b"
+    peers = cycle_gate.peers  # type: ignore[attr-defined]
+    assert peers["a"].name == "b"
+    assert peers["b"].name == "a"
+    assert not loader._name_locks
+    assert not loader._blocking_on
+
+
+def test_self_request(make_package: PackageFactory) -> None:
+    make_package(
+        "self_plugins",
+        {
+            "x": "from tests.subclass.base import BasePlugin\n"
+            "from self_plugins import loader\n\n\n"
+            "class Plugin(BasePlugin):\n"
+            "    name = 'x'\n\n\n"
+            "partial = loader.get('x')\n",
+            "__init__": "loader = None\n",
+        },
+    )
+    self_plugins = importlib.import_module("self_plugins")
+    loader = Loader[type[BasePlugin]](base="self_plugins")
+    self_plugins.loader = loader  # type: ignore[attr-defined]
+    kls = loader["x"]
+    assert importlib.import_module("self_plugins.x").partial is kls
+    assert not loader.failures()
@@ -0,0 +1,119 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Metadata query tests
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+# Python modules
+import sys
+from pathlib import Path
+
+# Third-party modules
+import pytest
+
+# Gufo Labs modules
+from gufo.loader import Loader
+from gufo.loader.index import PluginIndex
+from gufo.loader.static import ModuleSource
+
+from .conftest import PackageFactory
+from .subclass.base import BasePlugin
+
+PLUGIN_TEMPLATE = """
+import meta_nonexistent_dependency
+
+from tests.subclass.base import BasePlugin
+
+
+class Plugin(BasePlugin):
+    pass
+
+
+__plugin_meta__ = {meta!r}
+"""
+
+PLUGINS = {
+    "p1": {"vendor": "acme", "protocols": ["ssh", "telnet"], "tier": 1},
+    "p2": {"vendor": "acme", "protocols": ["http"], "tier": 2},
+    "p3": {"vendor": "other", "protocols": ("ssh",), "tier": 1},
+    "p4": {},
+}
+
+
+@pytest.fixture
+def plugins(make_package: PackageFactory) -> str:
+    modules = {
+        name: PLUGIN_TEMPLATE.format(meta=meta)
+        for name, meta in PLUGINS.items()
+    }
+    # No valid plugin
+    modules["invalid"] = "__plugin_meta__ = {'vendor': 'acme'}\n"
+    make_package("meta_plugins", modules)
+    return "meta_plugins"
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ({}, ["p1", "p2", "p3", "p4"]),
+        ({"vendor": "acme"}, ["p1", "p2"]),
+        ({"vendor": "acme", "protocols": "ssh"}, ["p1"]),
+        ({"protocols": "ssh"}, ["p1", "p3"]),
+        ({"protocols": ("ssh",)}, ["p3"]),
+        ({"protocols": ["http"]}, ["p2"]),
+        ({"tier": 1}, ["p1", "p3"]),
+        ({"vendor": "unknown"}, []),
+        ({"unknown": 1}, []),
+    ],
+)
+def test_find(plugins: str, query: dict, expected: list[str]) -> None:
+    loader = Loader[type[BasePlugin]](base=plugins)
+    assert loader.find(**query) == expected
+    assert loader.stats().imports == 0
+    assert not any(m.startswith(plugins) and "." in m for m in sys.modules)
+
+
+def test_find_refresh(plugins: str, tmp_path: Path) -> None:
+    loader = Loader[type[BasePlugin]](base=plugins)
+    assert loader.find(vendor="other") == ["p3"]
+    (tmp_path / plugins / "p5.py").write_text(
+        PLUGIN_TEMPLATE.format(meta={"vendor": "other"})
+    )
+    # Cached until refresh
+    assert loader.find(vendor="other") == ["p3"]
+    loader.refresh()
+    assert loader.find(vendor="other") == ["p3", "p5"]
+
+
+def test_find_index(
+    plugins: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    index = str(tmp_path / "plugins.idx")
+    loader = Loader[type[BasePlugin]](base=plugins, index=index)
+    assert loader.find(vendor="acme") == ["p1", "p2"]
+    # Sources must be persisted
+    _, sources = PluginIndex(index)._load()
+    assert len(sources) == 5
+    src = sources[str(tmp_path / plugins / "p1.py")][2]
+    assert isinstance(src, ModuleSource)
+    assert src.meta == PLUGINS["p1"]
+
+    def no_parse(path: str) -> ModuleSource:
+        msg = "must not be parsed"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr("gufo.loader.static.parse_file", no_parse)
+    loader2 = Loader[type[BasePlugin]](base=plugins, index=index)
+    assert loader2.find(vendor="acme") == ["p1", "p2"]
+    # Changed file must be reparsed
+    monkeypatch.undo()
+    monkeypatch.syspath_prepend(str(tmp_path))
+    (tmp_path / plugins / "p2.py").write_text(
+        PLUGIN_TEMPLATE.format(meta={"vendor": "other", "extra": True})
+    )
+    loader3 = Loader[type[BasePlugin]](base=plugins, index=index)
+    assert loader3.find(vendor="acme") == ["p1"]
+    _, sources = PluginIndex(index)._load()
+    src = sources[str(tmp_path / plugins / "p2.py")][2]
+    assert src is not None
+    assert src.meta == {"vendor": "other", "extra": True}
@@ -0,0 +1,126 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Pre-fork tests
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+# Python modules
+import gc
+import os
+from collections.abc import Callable, Iterator
+from threading import Event, Thread
+
+# Third-party modules
+import pytest
+
+# Gufo Labs modules
+from gufo.loader import ImportPathResolver, Loader, PreforkReport
+
+from .subclass.base import BasePlugin
+
+PLUGIN_BASES = ["tests.subclass.primary", "tests.subclass.secondary"]
+
+requires_fork = pytest.mark.skipif(
+    not hasattr(os, "fork"), reason="fork is not supported"
+)
+
+
+@pytest.fixture
+def unfreeze() -> Iterator[None]:
+    yield
+    gc.unfreeze()
+
+
+def add(x: int, y: int) -> int:
+    return x + y
+
+
+def test_loader_prefork(unfreeze: None) -> None:
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES)
+    report = loader.prefork()
+    assert isinstance(report, PreforkReport)
+    assert report.loaded == ("a", "b", "c")
+    assert report.failed == ("d",)
+    assert report.frozen > 0
+    assert report.duration > 0
+    assert set(loader._classes) == {"a", "b", "c"}
+
+
+def test_loader_prefork_no_freeze() -> None:
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES)
+    report = loader.prefork(["a"], gc_freeze=False)
+    assert report.loaded == ("a",)
+    assert report.frozen == 0
+
+
+def test_resolver_prefork() -> None:
+    resolver = ImportPathResolver[Callable[[int, int], int]]()
+    report = resolver.prefork(
+        ["tests.test_prefork.add", "tests.test_prefork.missed", "malformed"],
+        gc_freeze=False,
+    )
+    assert report.loaded == ("tests.test_prefork.add",)
+    assert report.failed == ("tests.test_prefork.missed", "malformed")
+    assert resolver("tests.test_prefork.add")(1, 2) == 3
+
+
+def hold_lock(lock: object) -> tuple[Thread, Event]:
+    """Hold the lock in the background thread until event is set."""
+    acquired = Event()
+    release = Event()
+
+    def inner() -> None:
+        with lock:  # type: ignore[attr-defined]
+            acquired.set()
+            release.wait()
+
+    thread = Thread(target=inner)
+    thread.start()
+    acquired.wait()
+    return thread, release
+
+
+def run_in_child(fn: Callable[[], bool]) -> bool:
+    pid = os.fork()
+    if not pid:
+        try:
+            ok = fn()
+        except BaseException:  # noqa: BLE001
+            ok = False
+        os._exit(0 if ok else 1)
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status) == 0
+
+
+@requires_fork
+def test_loader_fork_lock_reset() -> None:
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES)
+    loader.prefork(gc_freeze=False)
+    loader.forget("a")
+    thread, release = hold_lock(loader._lock)
+    try:
+
+        def child() -> bool:
+            if not loader._lock.acquire(timeout=1):
+                return False
+            loader._lock.release()
+            return loader.get("a") is not None and loader["b"] is not None
+
+        assert run_in_child(child)
+    finally:
+        release.set()
+        thread.join()
+
+
+@requires_fork
+def test_resolver_fork_lock_reset() -> None:
+    resolver = ImportPathResolver[Callable[[int, int], int]]()
+    resolver.prefork(["tests.test_prefork.add"], gc_freeze=False)
+    thread, release = hold_lock(resolver._lock)
+    try:
+        assert run_in_child(
+            lambda: resolver("tests.test_prefork.add")(1, 2) == 3
+        )
+    finally:
+        release.set()
+        thread.join()
@@ -0,0 +1,43 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Preload tests
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+# Gufo Labs modules
+from gufo.loader import Loader, PreloadReport
+
+from .subclass.base import BasePlugin
+
+PLUGIN_BASES = ["tests.subclass.primary", "tests.subclass.secondary"]
+
+
+def test_preload() -> None:
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES, exclude=["d"])
+    report = loader.preload()
+    assert isinstance(report, PreloadReport)
+    assert [p.name for p in report.plugins] == ["a", "b", "c"]
+    assert report.loaded == ["a", "b", "c"]
+    assert report.failed == []
+    assert report.duration >= 0
+    assert all(p.duration >= 0 for p in report.plugins)
+    assert len(report.slowest(2)) == 2
+    # Populated cache
+    assert set(loader._classes) == {"a", "b", "c"}
+
+
+def test_preload_subset() -> None:
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES)
+    report = loader.preload(["a", "c"], max_workers=1)
+    assert report.loaded == ["a", "c"]
+    assert set(loader._classes) == {"a", "c"}
+
+
+def test_preload_failures() -> None:
+    loader = Loader[type[BasePlugin]](bases=PLUGIN_BASES, exclude=["b"])
+    report = loader.preload(["a", "b", "z"])
+    assert report.loaded == ["a"]
+    assert report.failed == ["b", "z"]
+    b, z = report.plugins[1:]
+    assert isinstance(b.error, RuntimeError)
+    assert z.error is None
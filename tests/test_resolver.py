@@ -100,3 +100,17 @@ def test_passthrough() -> None:
     assert fn is add
     # Cache is clean
     assert not resolver._cache
+
+
+def test_path_locks_released() -> None:
+    resolver = ImportPathResolver[Callable[[int, int], int]](
+        cache_negative=False
+    )
+    for i in range(3):
+        # Uncached attribute misses
+        with pytest.raises(ImportError):
+            resolver(f"tests.test_resolver.invalid{i}")
+        # Import errors
+        with pytest.raises(ImportError):
+            resolver(f"tests.resolver_nonexistent{i}.x")
+    assert not resolver._path_locks
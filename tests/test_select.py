@@ -0,0 +1,81 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Plugin item selection tests
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+# Python modules
+from types import ModuleType
+from typing import Any
+
+# Third-party modules
+import pytest
+
+# Gufo Labs modules
+from gufo.loader import Loader
+
+from .subclass.base import BasePlugin
+
+PLUGIN_BASES = ["tests.subclass.primary", "tests.subclass.secondary"]
+LoaderType = Loader[type[BasePlugin]]
+
+
+@pytest.fixture(scope="module")
+def loader() -> LoaderType:
+    return Loader[type[BasePlugin]](bases=PLUGIN_BASES)
+
+
+def make_module(**kwargs: Any) -> ModuleType:  # noqa: ANN401
+    mod = ModuleType("select_plugin")
+    for k, v in kwargs.items():
+        setattr(mod, k, v)
+    return mod
+
+
+def make_plugin(name: str, module: str = "select_plugin") -> type[BasePlugin]:
+    return type(name, (BasePlugin,), {"__module__": module})
+
+
+def test_reexport_ignored(loader: LoaderType) -> None:
+    assert loader.get("d") is None
+
+
+def test_select_order(loader: LoaderType) -> None:
+    first = make_plugin("Z")
+    mod = make_module(trash=1, func=make_module, Z=first, A=make_plugin("A"))
+    assert loader._select_item(mod) is first
+
+
+def test_select_non_local(loader: LoaderType) -> None:
+    mod = make_module(P=make_plugin("P", module="other"))
+    assert loader._select_item(mod) is None
+
+
+def test_select_plugin_attr(loader: LoaderType) -> None:
+    explicit = make_plugin("Explicit", module="other")
+    mod = make_module(A=make_plugin("A"), __plugin__=explicit)
+    assert loader._select_item(mod) is explicit
+
+
+def test_select_invalid_plugin_attr(loader: LoaderType) -> None:
+    mod = make_module(A=make_plugin("A"), __plugin__=int)
+    assert loader._select_item(mod) is None
+
+
+def test_select_all(loader: LoaderType) -> None:
+    exported = make_plugin("B")
+    mod = make_module(A=make_plugin("A"), B=exported, __all__=["x", "B"])
+    assert loader._select_item(mod) is exported
+
+
+def test_select_all_fallback(loader: LoaderType) -> None:
+    plugin = make_plugin("A")
+    mod = make_module(A=plugin, x=1, __all__=["x"])
+    assert loader._select_item(mod) is plugin
+
+
+def test_candidates_unique(loader: LoaderType) -> None:
+    mod = make_module(
+        A=make_plugin("A"), B=make_plugin("B"), __all__=["B", "A"]
+    )
+    assert [attr for attr, _ in loader._iter_candidates(mod)] == ["B", "A"]
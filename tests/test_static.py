@@ -0,0 +1,230 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Static discovery tests
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+# Python modules
+import os
+import sys
+from pathlib import Path
+
+# Third-party modules
+import pytest
+
+# Gufo Labs modules
+from gufo.loader import Loader, PluginInfo
+from gufo.loader.static import parse_source, select_candidate
+
+from .conftest import PackageFactory
+from .protocol.base import Named
+from .singleton.base import BasePlugin as SingletonPlugin
+from .subclass.base import BasePlugin
+
+SUBCLASS_BASES = ["tests.subclass.primary", "tests.subclass.secondary"]
+
+HEAVY_PLUGIN = """
+import static_nonexistent_dependency
+
+from tests.subclass.base import BasePlugin
+
+
+class Helper:
+    pass
+
+
+class Intermediate(BasePlugin):
+    pass
+
+
+class HeavyPlugin(Intermediate):
+    pass
+
+
+__plugin__ = HeavyPlugin
+
+__plugin_meta__ = {"vendor": "acme", "protocols": ["ssh", "telnet"]}
+"""
+
+
+@pytest.fixture
+def plugins(make_package: PackageFactory) -> str:
+    make_package(
+        "static_plugins",
+        {"heavy": HEAVY_PLUGIN, "broken": "class X(:\n", "empty": "x = 1\n"},
+    )
+    return "static_plugins"
+
+
+def test_parse_source() -> None:
+    src = parse_source(HEAVY_PLUGIN)
+    assert src.error is None
+    assert src.plugin == "HeavyPlugin"
+    assert list(src.classes) == ["Helper", "Intermediate", "HeavyPlugin"]
+    assert src.classes["Intermediate"] == ("BasePlugin",)
+    assert src.instances == {}
+    assert src.meta == {"vendor": "acme", "protocols": ["ssh", "telnet"]}
+
+
+def test_parse_source_error() -> None:
+    src = parse_source("class X(:\n")
+    assert src.error
+    assert src.classes == {}
+
+
+@pytest.mark.parametrize(
+    ("source", "kind", "expected"),
+    [
+        ("class A(BasePlugin): ...", "class", ("A", "class", True)),
+        ("class A(base.BasePlugin): ...", "class", ("A", "class", True)),
+        ("class A: ...", "class", (None, None, False)),
+        ("class A(Other): ...", "class", ("A", "class", None)),
+        (
+            "class A: ...\nclass B(BasePlugin): ...",
+            "class",
+            ("B", "class", True),
+        ),
+        (
+            "class A(BasePlugin): ...\nclass B(BasePlugin): ...\n"
+            "__all__ = ['B']",
+            "class",
+            ("B", "class", True),
+        ),
+        (
+            "from x import P\nclass A(BasePlugin): ...\n__plugin__ = P",
+            "class",
+            ("P", None, None),
+        ),
+        (
+            "class A(BasePlugin): ...\na = A()",
+            "instance",
+            ("a", "instance", True),
+        ),
+        # Instances of imported classes are skipped on import
+        ("a = BasePlugin()", "instance", (None, None, False)),
+        ("a = x.Other()", "instance", (None, None, False)),
+        (
+            "a = BasePlugin()\n__plugin__ = a",
+            "instance",
+            ("a", "instance", True),
+        ),
+        (
+            "a = x.Other()\n__plugin__ = a",
+            "instance",
+            ("a", "instance", None),
+        ),
+        ("class A(BasePlugin): ...", "instance", (None, None, False)),
+    ],
+)
+def test_select_candidate(source: str, kind: str, expected: tuple) -> None:
+    src = parse_source(source)
+    item, item_kind, _, valid = select_candidate(
+        src,
+        kind,  # type: ignore[arg-type]
+        "BasePlugin",
+    )
+    assert (item, item_kind, valid) == expected
+
+
+def test_select_candidate_protocol() -> None:
+    src = parse_source("x = 1\na = A()")
+    assert select_candidate(src, "instance", None) == (None, None, (), False)
+    src = parse_source("x = 1\na = A()\n__plugin__ = a")
+    assert select_candidate(src, "instance", None) == (
+        "a",
+        "instance",
+        ("A",),
+        None,
+    )
+
+
+def test_describe_subclass() -> None:
+    loader = Loader[type[BasePlugin]](bases=SUBCLASS_BASES)
+    info = loader.describe("a")
+    assert isinstance(info, PluginInfo)
+    assert info.base == "tests.subclass.primary"
+    assert info.item == "APlugin"
+    assert info.kind == "class"
+    assert info.bases == ("BasePlugin",)
+    assert info.valid is True
+    assert info.file.endswith(os.path.join("primary", "a.py"))
+    # Re-export is not the plugin
+    d = loader.describe("d")
+    assert d is not None
+    assert d.valid is False
+    assert loader.describe("missed") is None
+    assert [i.name for i in loader.describe_all()] == ["a", "b", "c", "d"]
+
+
+def test_describe_singleton() -> None:
+    loader = Loader[SingletonPlugin](
+        bases=["tests.singleton.primary", "tests.singleton.secondary"]
+    )
+    info = loader.describe("a")
+    assert info is not None
+    assert info.item == "a_singleton"
+    assert info.kind == "instance"
+    assert info.valid is True
+
+
+def test_describe_imported_instance(make_package: PackageFactory) -> None:
+    make_package(
+        "static_instances",
+        {
+            "imported": "from tests.singleton.base import BasePlugin\n\n"
+            "plugin = BasePlugin()\n"
+        },
+    )
+    loader = Loader[SingletonPlugin](base="static_instances")
+    info = loader.describe("imported")
+    assert info is not None
+    assert info.valid is False
+    # Same as on import
+    assert loader.get("imported") is None
+
+
+def test_describe_protocol() -> None:
+    loader = Loader[Named](
+        bases=["tests.protocol.primary", "tests.protocol.secondary"]
+    )
+    info = loader.describe("a")
+    assert info is not None
+    assert info.item == "APlugin"
+    assert info.kind == "class"
+    assert info.valid is None
+
+
+def test_describe_no_import(plugins: str) -> None:
+    loader = Loader[type[BasePlugin]](base=plugins)
+    info = loader.describe("heavy")
+    assert info is not None
+    assert info.item == "HeavyPlugin"
+    assert info.valid is True
+    assert info.meta == {"vendor": "acme", "protocols": ["ssh", "telnet"]}
+    assert f"{plugins}.heavy" not in sys.modules
+    assert loader.stats().imports == 0
+    broken = loader.describe("broken")
+    assert broken is not None
+    assert broken.valid is False
+    assert broken.error
+    empty = loader.describe("empty")
+    assert empty is not None
+    assert empty.item is None
+    assert empty.valid is False
+
+
+def test_describe_cached(plugins: str, tmp_path: Path) -> None:
+    loader = Loader[type[BasePlugin]](base=plugins)
+    path = tmp_path / plugins / "empty.py"
+    info = loader.describe("empty")
+    assert info is not None
+    assert info.valid is False
+    assert loader.describe("empty") == info
+    path.write_text(
+        "from tests.subclass.base import BasePlugin\n\n"
+        "class EmptyPlugin(BasePlugin):\n    pass\n"
+    )
+    info = loader.describe("empty")
+    assert info is not None
+    assert info.item == "EmptyPlugin"
+    assert info.valid is True
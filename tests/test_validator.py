@@ -0,0 +1,176 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Plugin item validator tests
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+# Python modules
+from typing import Protocol, runtime_checkable
+
+# Third-party modules
+import pytest
+
+# Gufo Labs modules
+from gufo.loader import Loader
+from gufo.loader.validator import (
+    InstanceValidator,
+    ProtocolValidator,
+    SubclassValidator,
+    Validator,
+)
+
+from .conftest import PackageFactory
+from .protocol.base import Named
+from .subclass.base import BasePlugin
+
+REJECTED_PLUGIN = """
+class Nameless:
+    pass
+
+
+class BrokenName:
+    get_name = None
+
+
+class Plugin:
+    def get_name(self) -> str:
+        return "rejected"
+
+
+class Late:
+    def get_name(self) -> str:
+        return "late"
+"""
+
+
+@runtime_checkable
+class Labeled(Protocol):
+    label: str
+
+    def get_name(self) -> str: ...
+
+
+class Good:
+    label = "good"
+
+    def get_name(self) -> str:
+        return "good"
+
+
+class NoLabel:
+    def get_name(self) -> str:
+        return "no_label"
+
+
+class Explicit(Labeled):
+    pass
+
+
+@pytest.fixture
+def plugins(make_package: PackageFactory) -> str:
+    make_package("rejected_plugins", {"rejected": REJECTED_PLUGIN})
+    return "rejected_plugins"
+
+
+def test_protocol_members() -> None:
+    v = ProtocolValidator(Labeled)
+    assert v.members == ("get_name", "label")
+
+
+def test_protocol_instance() -> None:
+    v = ProtocolValidator(Labeled)
+    assert v(Good)
+    assert v(Good())
+    assert not v(NoLabel)
+    assert v.explain(NoLabel) == "missing label"
+    # Set in instance
+    item = NoLabel()
+    item.label = "instance"  # type: ignore[attr-defined]
+    assert v(item)
+    assert not v(NoLabel())
+
+
+def test_protocol_subclass() -> None:
+    v = ProtocolValidator(Labeled, classes=True)
+    assert v(Good)
+    assert v(Explicit)
+    assert not v(Good())
+    assert v.explain(Good()) == "not a class"
+    assert v.explain(NoLabel) == "missing label"
+
+
+def test_protocol_cache() -> None:
+    v = ProtocolValidator(Labeled)
+    assert v(Good())
+    assert v._cache[Good] == ()
+    assert not v(NoLabel())
+    assert v._cache[NoLabel] == ("label",)
+
+
+@runtime_checkable
+class CallableProtocol(Protocol):
+    def __call__(self) -> None: ...
+
+    def mro(self) -> list[type]: ...
+
+
+def test_protocol_metaclass_members() -> None:
+    # Provided by `type`, not by the class
+    v = ProtocolValidator(CallableProtocol, classes=True)
+    assert not v(Good)
+    assert v(Good) is issubclass(Good, CallableProtocol)
+    assert v.explain(Good) == "missing __call__, mro"
+    # Class objects are callable instances
+    v = ProtocolValidator(CallableProtocol)
+    for x in (Good, Good(), len):
+        assert v(x) is isinstance(x, CallableProtocol)
+
+
+def test_validator_abstract() -> None:
+    with pytest.raises(TypeError):
+        Validator(BasePlugin)  # type: ignore[abstract]
+
+
+def test_protocol_matches_isinstance() -> None:
+    v = ProtocolValidator(Named)
+    for x in (Good, NoLabel, Good(), object(), 1, "x", None):
+        assert v(x) is isinstance(x, Named)
+
+
+def test_explain() -> None:
+    v = InstanceValidator(BasePlugin)
+    assert v.explain(BasePlugin()) is None
+    assert v.explain(1) == "not an instance of BasePlugin"
+    sv = SubclassValidator(BasePlugin)
+    assert sv.explain(BasePlugin) is None
+    assert sv.explain(1) == "not a class"
+    assert sv.explain(int) == "not a subclass of BasePlugin"
+
+
+def test_loader_protocol_validator() -> None:
+    loader = Loader[Named](bases=["tests.protocol.primary"])
+    assert isinstance(loader._get_validator(), ProtocolValidator)
+    loader2 = Loader[type[Labeled]](bases=["tests.protocol.primary"])
+    assert isinstance(loader2._get_validator(), ProtocolValidator)
+    loader3 = Loader[type[BasePlugin]](bases=["tests.subclass.primary"])
+    assert isinstance(loader3._get_validator(), SubclassValidator)
+
+
+def test_rejections(plugins: str) -> None:
+    loader = Loader[Named](base=plugins)
+    assert loader["rejected"]().get_name() == "rejected"
+    assert loader.rejections("rejected") == {
+        f"{plugins}.rejected.Nameless": "missing get_name",
+        f"{plugins}.rejected.BrokenName": "missing get_name",
+    }
+
+
+def test_rejections_selected() -> None:
+    loader = Loader[Named](bases=["tests.protocol.primary"])
+    assert loader.rejections("a") == {}
+
+
+def test_rejections_not_found() -> None:
+    loader = Loader[Named](bases=["tests.protocol.primary"])
+    with pytest.raises(KeyError):
+        loader.rejections("nonexistent")
@@ -0,0 +1,124 @@
+# ---------------------------------------------------------------------
+# Gufo Loader: Plugin watcher tests
+# ---------------------------------------------------------------------
+# Copyright (C) 2026, Gufo Labs
+# ---------------------------------------------------------------------
+
+# Python modules
+import os
+import sys
+import time
+from pathlib import Path
+
+# Third-party modules
+import pytest
+
+# Gufo Labs modules
+from gufo.loader import Loader, PluginWatcher
+
+from .conftest import PackageFactory
+from .subclass.base import BasePlugin
+
+PLUGIN = """
+from tests.subclass.base import BasePlugin
+
+
+class Plugin(BasePlugin):
+    name = "{name}"
+
+    def get_name(self) -> str:
+        return self.name
+"""
+
+PKG = "watcher_plugins"
+LoaderType = Loader[type[BasePlugin]]
+
+
+def write(path: Path, data: str) -> None:
+    # Ensure modification time is changed
+    mtime = path.stat().st_mtime_ns + 1_000_000_000 if path.exists() else None
+    path.write_text(data)
+    if mtime:
+        os.utime(path, ns=(mtime, mtime))
+
+
+@pytest.fixture
+def pkg(make_package: PackageFactory, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    return make_package(PKG, {"x": PLUGIN.format(name="x1")})
+
+
+@pytest.fixture
+def loader(pkg: Path) -> LoaderType:
+    return Loader[type[BasePlugin]](base=PKG)
+
+
+def test_no_changes(loader: LoaderType) -> None:
+    watcher = PluginWatcher(loader)
+    event = watcher.check()
+    assert not event.changed
+    assert watcher.stats().scans == 1
+    assert watcher.stats().reloads == 0
+
+
+def test_modified(pkg: Path, loader: LoaderType) -> None:
+    old = loader["x"]
+    assert old().get_name() == "x1"
+    watcher = PluginWatcher(loader)
+    write(pkg / "x.py", PLUGIN.format(name="x22"))
+    event = watcher.check()
+    assert event.modified == ("x",)
+    assert event.reloaded == ("x",)
+    new = loader["x"]
+    assert new is not old
+    assert new().get_name() == "x22"
+    stats = watcher.stats()
+    assert stats.reloads == 1
+    assert stats.last_reload > 0
+
+
+def test_modified_not_loaded(pkg: Path, loader: LoaderType) -> None:
+    watcher = PluginWatcher(loader)
+    write(pkg / "x.py", PLUGIN.format(name="x22"))
+    event = watcher.check()
+    assert event.modified == ("x",)
+    assert event.reloaded == ()
+    assert loader["x"]().get_name() == "x22"
+
+
+def test_failed_reload(pkg: Path, loader: LoaderType) -> None:
+    old = loader["x"]
+    watcher = PluginWatcher(loader)
+    write(pkg / "x.py", "import watcher_nonexistent_module\n")
+    event = watcher.check()
+    assert event.failed == ("x",)
+    # Old item is kept
+    assert loader["x"] is old
+    assert "x" in loader.failures()
+
+
+def test_added_removed(pkg: Path, loader: LoaderType) -> None:
+    watcher = PluginWatcher(loader)
+    assert list(loader) == ["x"]
+    write(pkg / "y.py", PLUGIN.format(name="y"))
+    event = watcher.check()
+    assert event.added == ("y",)
+    assert list(loader) == ["x", "y"]
+    assert loader["y"]().get_name() == "y"
+    (pkg / "y.py").unlink()
+    event = watcher.check()
+    assert event.removed == ("y",)
+    assert list(loader) == ["x"]
+    assert loader.get("y") is None
+
+
+def test_background(pkg: Path, loader: LoaderType) -> None:
+    assert loader["x"]().get_name() == "x1"
+    with loader.watch(interval=0.01) as watcher:
+        assert watcher.is_running
+        write(pkg / "x.py", PLUGIN.format(name="x22"))
+        deadline = time.monotonic() + 5
+        while not watcher.stats().reloads and time.monotonic() < deadline:
+            time.sleep(0.01)
+    assert not watcher.is_running
+    assert loader["x"]().get_name() == "x22"